@@ -0,0 +1,45 @@
+"""Object model and helpers for Alexa skills running on AWS Lambda.
+
+Submodules are imported on first attribute access, so ``import alexa`` stays
+cheap during cold starts and only the parts a skill uses are ever loaded::
+
+  >>> import alexa
+  >>> alexa.response.build_response(alexa.response.PLAIN_TEXT, 'Hello')
+"""
+
+_SUBMODULES = frozenset([
+    'aio',
+    'api',
+    'budget',
+    'cache',
+    'compact',
+    'context',
+    'dialog',
+    'dispatch',
+    'fuzzy',
+    'metrics',
+    'progressive',
+    'profile',
+    'request',
+    'resolution',
+    'response',
+    'routing',
+    'session',
+    'ssml',
+    'store',
+])
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        import importlib
+
+        return importlib.import_module('.'.join([__name__, name]))
+
+    raise AttributeError(
+        "module '{module}' has no attribute '{name}'".format(
+            module=__name__, name=name))
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | _SUBMODULES)
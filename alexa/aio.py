@@ -0,0 +1,91 @@
+"""Helpers for intent handlers written as coroutines.
+
+Handlers called through :func:`lambda_handler.async_lambda_handler` may be
+``async def`` functions. Independent backend calls can then run concurrently
+instead of one after another::
+
+  async def handle_intent(alexa_session, alexa_user, alexa_request, alexa_context):
+      results = await alexa.aio.gather(
+          profile=fetch_profile(alexa_user.consent_token),
+          device=alexa.aio.run_blocking(lookup_device, alexa_context.device.device_id))
+
+      return alexa.response.build_response(
+          alexa.response.PLAIN_TEXT,
+          'Hello {name}'.format(name=results['profile']['name']))
+"""
+import asyncio
+import functools
+import inspect
+
+_loop = None
+
+
+def run(awaitable):
+    """Run an awaitable to completion on the process-wide event loop.
+
+    The loop is created on first use and kept for later warm invocations, so
+    anything bound to it, such as connection pools, survives between
+    requests. It must only be driven from one thread at a time.
+
+    :param awaitable: Coroutine or other awaitable to run
+
+    :return: The awaitable's result
+    """
+
+    global _loop
+
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+
+    return _loop.run_until_complete(awaitable)
+
+
+async def call_handler(handler, *args):
+    """Call an intent handler, awaiting its result if it's a coroutine.
+
+    Plain functions are called directly and their result returned as-is.
+
+    :param handler: Intent handler function or coroutine function
+    :param args: Arguments passed to the handler
+
+    :return: The handler's response
+    """
+
+    result = handler(*args)
+    if inspect.isawaitable(result):
+        result = await result
+
+    return result
+
+
+async def gather(**awaitables) -> dict:
+    """Await several named awaitables concurrently.
+
+    :param awaitables: Awaitables to run, keyed by the name their result
+        should be returned under
+
+    :return: dict of name to result
+
+    :raises: The first exception raised by any awaitable
+    """
+
+    results = await asyncio.gather(*awaitables.values())
+
+    return dict(zip(awaitables.keys(), results))
+
+
+async def run_blocking(function, *args, **kwargs):
+    """Run a blocking function on the loop's thread pool so it can be awaited
+    alongside other calls.
+
+    :param function: Blocking function to call
+    :param args: Positional arguments for ``function``
+    :param kwargs: Keyword arguments for ``function``
+
+    :return: The function's result
+    """
+
+    loop = asyncio.get_running_loop()
+
+    return await loop.run_in_executor(
+        None, functools.partial(function, *args, **kwargs))
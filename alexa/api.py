@@ -0,0 +1,280 @@
+"""Call the Alexa service APIs, such as device address, settings and lists.
+
+Requests carry the API endpoint to use and a token authorizing the skill.
+:func:`get_client` returns a client for an endpoint that keeps its
+connections open, so later calls, including those from later warm
+invocations, skip the TCP and TLS handshakes::
+
+  def handle_intent(alexa_session, alexa_user, alexa_request, alexa_context):
+      client = alexa.api.get_client(alexa_context.api_endpoint)
+      address = client.get(
+          '/v1/devices/{device_id}/settings/address'.format(
+              device_id=alexa_context.device.device_id),
+          alexa_user.consent_token, timeout=1.0)
+
+Calls raise :class:`APIError` for error responses, and :class:`OSError`,
+such as :class:`TimeoutError`, when the service can't be reached in time.
+"""
+import collections
+import http.client
+import select
+import threading
+import urllib.parse
+
+import alexa.response
+
+#: Seconds a call may wait to connect, or for each read, unless it gives its
+#: own timeout.
+DEFAULT_TIMEOUT = 5.0
+
+#: Most idle connections each client keeps open.
+MAX_IDLE_CONNECTIONS = 4
+
+#: A response from an API. ``body`` is the raw response body.
+Response = collections.namedtuple('Response', ['status', 'headers', 'body'])
+
+# Errors showing that a kept-alive connection may have been closed by the
+# server while it sat idle
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+# Methods that are safe to send again if the server may have acted on them
+_IDEMPOTENT_METHODS = frozenset(['DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT'])
+
+
+def _is_dropped(connection: http.client.HTTPConnection) -> bool:
+    """Check whether the server has closed an idle connection
+
+    An idle connection has nothing to read, unless the server has closed it.
+    """
+
+    if connection.sock is None:
+        return True
+
+    try:
+        readable, _, _ = select.select([connection.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+
+    return bool(readable)
+
+
+class APIError(Exception):
+    """An API call answered with an error status."""
+
+    def __init__(self, status: int, body: bytes):
+        """
+        :param status: HTTP status code
+        :param body: Response body
+        """
+
+        super().__init__('Alexa API call failed with status {status}'.format(status=status))
+
+        #: :class:`int` HTTP status code, such as 403 when the user hasn't
+        #: granted the skill permission.
+        self.status = status
+
+        #: :class:`bytes` response body.
+        self.body = body
+
+
+class APIClient:
+    """Client for one API endpoint, with a pool of kept-alive connections.
+
+    A call reuses an idle connection if there is one, and returns it to the
+    pool once the response has been read. Connections are only opened as
+    needed, so concurrent calls from several threads each get their own.
+
+    Idle connections the server has closed are dropped before they're used.
+    If a reused connection still turns out to be closed, the call is retried
+    once on a new connection, provided the request never reached the server
+    or its method is safe to repeat.
+    """
+
+    def __init__(
+            self, endpoint: str, timeout: float=DEFAULT_TIMEOUT,
+            max_idle: int=MAX_IDLE_CONNECTIONS):
+        """
+        :param endpoint: Base URL of the API, such as a context's
+            :attr:`api_endpoint <alexa.context.Context.api_endpoint>`
+        :param timeout: Default timeout for calls, in seconds
+        :param max_idle: Most idle connections to keep open
+
+        :raises: ValueError
+        """
+
+        parts = urllib.parse.urlsplit(endpoint)
+        if parts.scheme == 'https':
+            self._connection_class = http.client.HTTPSConnection
+        elif parts.scheme == 'http':
+            self._connection_class = http.client.HTTPConnection
+        else:
+            raise ValueError('Unsupported API endpoint: {endpoint}'.format(endpoint=endpoint))
+
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.max_idle = max_idle
+
+        self._host = parts.netloc
+        self._base_path = parts.path.rstrip('/')
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def request(
+            self, method: str, path: str, token: str=None, body: bytes=None,
+            headers: dict=None, timeout: float=None) -> Response:
+        """Make a call and read its whole response.
+
+        :param method: HTTP method
+        :param path: Path under the endpoint, such as ``/v1/directives``
+        :param token: API access or consent token, sent as a bearer token
+        :param body: Request body
+        :param headers: Extra request headers
+        :param timeout: Timeout in seconds, instead of the client's default
+
+        :return: The :class:`Response`, whatever its status
+
+        :raises: OSError
+        """
+
+        request_headers = {'Accept': 'application/json'}
+        if token is not None:
+            request_headers['Authorization'] = 'Bearer ' + token
+        request_headers.update(headers or {})
+
+        timeout = self.timeout if timeout is None else timeout
+        retry = True
+        while True:
+            connection, reused = self._acquire(timeout, idle=retry)
+            sent = False
+            try:
+                connection.request(method, self._base_path + path, body, request_headers)
+                sent = True
+                response = connection.getresponse()
+                result = Response(response.status, response.headers, response.read())
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                # Only a connection that sat idle can have gone stale, and a
+                # request the server may have acted on is only sent again if
+                # that's harmless
+                if retry and reused and (not sent or method in _IDEMPOTENT_METHODS):
+                    retry = False
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+
+            return result
+
+    def get(self, path: str, token: str=None, timeout: float=None):
+        """Fetch and decode a JSON resource.
+
+        :param path: Path under the endpoint
+        :param token: API access or consent token
+        :param timeout: Timeout in seconds, instead of the client's default
+
+        :return: The decoded response, or None if the response is empty
+
+        :raises: APIError, OSError
+        """
+
+        return self._decode(self.request('GET', path, token, timeout=timeout))
+
+    def post(self, path: str, data, token: str=None, timeout: float=None):
+        """Send a JSON object, decoding any JSON sent back.
+
+        :param path: Path under the endpoint
+        :param data: A JSON-serializable object
+        :param token: API access or consent token
+        :param timeout: Timeout in seconds, instead of the client's default
+
+        :return: The decoded response, or None if the response is empty
+
+        :raises: APIError, OSError
+        """
+
+        return self._decode(self.request(
+            'POST', path, token, alexa.response.to_json_bytes(data),
+            {'Content-Type': 'application/json'}, timeout))
+
+    def close(self):
+        """Close every idle connection."""
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for connection in idle:
+            connection.close()
+
+    def _acquire(self, timeout: float, idle: bool=True) -> tuple:
+        while idle:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None or not _is_dropped(connection):
+                break
+            connection.close()
+        else:
+            connection = None
+
+        if connection is None:
+            return self._connection_class(self._host, timeout=timeout), False
+
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+
+        return connection, True
+
+    def _release(self, connection):
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(connection)
+                return
+
+        connection.close()
+
+    @staticmethod
+    def _decode(response: Response):
+        if response.status >= 400:
+            raise APIError(response.status, response.body)
+        if not response.body:
+            return None
+
+        import json
+
+        return json.loads(response.body)
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(endpoint: str) -> APIClient:
+    """Return the process-wide client for an endpoint, so its connections are
+    reused across warm invocations.
+
+    :param endpoint: Base URL of the API, such as a context's
+        :attr:`api_endpoint <alexa.context.Context.api_endpoint>`
+
+    :return: The shared :class:`APIClient`
+
+    :raises: ValueError
+    """
+
+    client = _clients.get(endpoint)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(endpoint)
+            if client is None:
+                client = _clients[endpoint] = APIClient(endpoint)
+
+    return client
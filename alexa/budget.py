@@ -0,0 +1,190 @@
+"""Keep responses within Alexa's size limits.
+
+Alexa rejects responses larger than :data:`MAX_RESPONSE_SIZE`. A
+:class:`ResponseBudget` attached to a
+:class:`ResponseBuilder <alexa.response.ResponseBuilder>` checks the
+response's encoded size whenever it's built, and applies strategies in order
+until it fits::
+
+  budget = alexa.budget.ResponseBudget()
+
+  def handle_intent(alexa_session, alexa_user, alexa_request, alexa_context):
+      alexa.budget.restore_session_attributes(alexa_session)
+      ...
+      return (
+          alexa.response.ResponseBuilder(alexa.response.SSML, speech)
+          .set_session_attributes(alexa_session.attributes)
+          .set_budget(budget, alexa_session))
+
+Sizes come from :meth:`ResponseBuilder.encoded_size
+<alexa.response.ResponseBuilder.encoded_size>`, which remembers the size of
+each part of the response until it changes, so the response is never
+serialized just to be measured.
+
+A strategy is a function taking the builder, the number of bytes the
+response is over budget, and the request's session (or None), and
+returning whether it changed the response.
+"""
+import alexa.response
+import alexa.session
+import alexa.ssml
+import alexa.store
+
+#: Largest response Alexa accepts, in bytes.
+MAX_RESPONSE_SIZE = 24 * 1024
+
+#: Session attribute left in place of attributes moved to the state store,
+#: holding the key they were stored under.
+OFFLOADED_ATTRIBUTE = '_offloaded_attributes'
+
+
+def drop_card_image(builder, overflow: int, alexa_session) -> bool:
+    """Strategy replacing a card that has images with a text-only card.
+
+    :return: Whether the card had images to drop
+    """
+
+    card = builder.card
+    if card is None or not (hasattr(card, 'small_image') or hasattr(card, 'large_image')):
+        return False
+
+    builder.set_card(alexa.response.Card(card.text, getattr(card, 'title', None)))
+
+    return True
+
+
+def truncate_speech(builder, overflow: int, alexa_session) -> bool:
+    """Strategy cutting the end off the output speech.
+
+    Plain text is cut between words. SSML is cut with
+    :func:`alexa.ssml.truncate`, which keeps it well-formed.
+
+    :return: Whether there was speech long enough to shorten
+    """
+
+    output_speech = builder.output_speech
+    if output_speech is None:
+        return False
+
+    response_type = output_speech['type']
+    text = output_speech['ssml' if response_type == alexa.response.SSML else 'text']
+    # Every character encodes to at least one byte, so removing as many
+    # characters as there are bytes over budget is always enough
+    max_length = len(text) - overflow
+
+    if response_type == alexa.response.SSML:
+        try:
+            shortened = alexa.ssml.truncate(text, max_length)
+        except ValueError:
+            return False
+    else:
+        if max_length <= 0:
+            return False
+        shortened = text[:max_length]
+        if not text[max_length].isspace() and ' ' in shortened:
+            shortened = shortened.rsplit(' ', 1)[0]
+
+    builder.speak(response_type, shortened)
+
+    return True
+
+
+def offload_session_attributes(store=None):
+    """Build a strategy moving the session attributes to a state store.
+
+    The attributes are replaced in the response by a reference to where
+    they're stored, which :func:`restore_session_attributes` follows on the
+    session's next request.
+
+    :param store: :class:`CachedStateStore <alexa.store.CachedStateStore>`
+        to write to; the default store if not given
+
+    :return: The strategy
+    """
+
+    def offload_session_attributes(builder, overflow: int, alexa_session) -> bool:
+        attributes = builder.session_attributes
+        if not attributes or alexa_session is None:
+            return False
+
+        key = 'session-attributes:' + alexa_session.session_id
+        (store or alexa.store.default_store()).set(key, dict(attributes))
+        builder.set_session_attributes({OFFLOADED_ATTRIBUTE: key})
+
+        return True
+
+    return offload_session_attributes
+
+
+def restore_session_attributes(alexa_session, store=None) -> bool:
+    """Bring back session attributes moved to a state store by
+    :func:`offload_session_attributes`.
+
+    :param alexa_session: A :class:`Session <alexa.session.Session>`, whose
+        :attr:`attributes <alexa.session.Session.attributes>` are replaced by
+        the stored ones
+    :param store: :class:`CachedStateStore <alexa.store.CachedStateStore>`
+        the attributes were written to; the default store if not given
+
+    :return: Whether the attributes had been offloaded
+    """
+
+    key = alexa_session.attributes.get(OFFLOADED_ATTRIBUTE)
+    if key is None:
+        return False
+
+    alexa_session.attributes = alexa.session.SessionAttributes(
+        (store or alexa.store.default_store()).get(key))
+
+    return True
+
+
+#: Strategies applied by default, least noticeable to the user first.
+DEFAULT_STRATEGIES = (
+    drop_card_image,
+    offload_session_attributes(),
+    truncate_speech,
+)
+
+
+class ResponseBudget:
+    """A response size limit and the strategies used to stay within it."""
+
+    def __init__(self, max_size: int=MAX_RESPONSE_SIZE, strategies=DEFAULT_STRATEGIES):
+        """
+        :param max_size: Most bytes the encoded response may have
+        :param strategies: Strategies to try, in order, while the response
+            is too large
+        """
+
+        self.max_size = max_size
+        self.strategies = tuple(strategies)
+
+    def fit(self, builder, alexa_session=None) -> list:
+        """Apply strategies to a response until it fits the budget.
+
+        :param builder: A :class:`ResponseBuilder
+            <alexa.response.ResponseBuilder>`
+        :param alexa_session: The request's
+            :class:`Session <alexa.session.Session>`, if strategies need it
+
+        :return: List of the strategies that changed the response
+
+        :raises: ValueError
+        """
+
+        applied = []
+        overflow = builder.encoded_size() - self.max_size
+        for strategy in self.strategies:
+            if overflow <= 0:
+                break
+            if strategy(builder, overflow, alexa_session):
+                applied.append(strategy)
+                overflow = builder.encoded_size() - self.max_size
+
+        if overflow > 0:
+            raise ValueError(
+                'Response is {size} bytes, over the budget of {max_size} bytes'.format(
+                    size=self.max_size + overflow, max_size=self.max_size))
+
+        return applied
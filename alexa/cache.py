@@ -0,0 +1,141 @@
+"""Bounded in-process caches that survive between warm invocations."""
+import collections
+import threading
+import time
+
+#: Returned by :meth:`LRUCache.get` when a key isn't cached; distinct from a
+#: cached value of None.
+MISS = object()
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts its least recently used entries once
+    it holds more than ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int=1024):
+        """
+        :param max_entries: Most entries kept before evicting
+        """
+
+        if max_entries < 1:
+            raise ValueError('Caches must hold at least one entry')
+
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, default=MISS):
+        """Look up a key, marking it as recently used.
+
+        :param key: Key to look up
+        :param default: Returned if the key isn't cached
+
+        :return: The cached value, or ``default``
+        """
+
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return default
+
+            return self._entries[key]
+
+    def put(self, key, value):
+        """Cache a value, evicting the least recently used entry if needed.
+
+        :param key: Key to cache the value under
+        :param value: Value to cache
+        """
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove a key.
+
+        :param key: Key to remove
+        :param default: Returned if the key isn't cached
+
+        :return: The removed value, or ``default``
+        """
+
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def clear(self):
+        """Remove every entry."""
+
+        with self._lock:
+            self._entries.clear()
+
+
+class TTLCache(LRUCache):
+    """:class:`LRUCache` whose entries also expire a fixed time after they're
+    cached.
+    """
+
+    def __init__(self, max_entries: int=1024, ttl: float=300.0, clock=time.monotonic):
+        """
+        :param max_entries: Most entries kept before evicting
+        :param ttl: Seconds an entry stays valid
+        :param clock: Function returning the current time in seconds
+        """
+
+        super().__init__(max_entries)
+
+        self.ttl = ttl
+        self._clock = clock
+
+    def __contains__(self, key) -> bool:
+        entry = self._entries.get(key)
+
+        return entry is not None and self._clock() < entry[0]
+
+    def get(self, key, default=MISS):
+        """Look up a key, marking it as recently used.
+
+        :param key: Key to look up
+        :param default: Returned if the key isn't cached or has expired
+
+        :return: The cached value, or ``default``
+        """
+
+        entry = super().get(key)
+        if entry is MISS:
+            return default
+
+        expires, value = entry
+        if self._clock() >= expires:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return default
+
+        return value
+
+    def put(self, key, value, ttl: float=None):
+        """Cache a value until it expires, evicting the least recently used
+        entry if needed.
+
+        :param key: Key to cache the value under
+        :param value: Value to cache
+        :param ttl: Seconds this entry stays valid, instead of :attr:`ttl`
+        """
+
+        super().put(key, (self._clock() + (self.ttl if ttl is None else ttl), value))
+
+    def pop(self, key, default=None):
+        entry = super().pop(key, MISS)
+
+        return default if entry is MISS else entry[1]
@@ -0,0 +1,263 @@
+"""Compact, ``__slots__``-based variants of the Alexa event model.
+
+These classes parse the same JSON objects as their counterparts in
+:mod:`alexa.session`, :mod:`alexa.context` and :mod:`alexa.request`, but
+store their fields in slots instead of a per-instance ``__dict__``. Optional
+fields that are absent from the request are set to :data:`MISSING` rather than
+left undefined, so they're tested with ``is MISSING`` (or simply for
+truthiness) instead of :func:`hasattr`::
+
+  >>> request = alexa.compact.IntentRequest(event['request'])
+  >>> if request.dialog_state is not alexa.compact.MISSING:
+  ...     ...
+"""
+import alexa.context
+
+
+class _Missing:
+    """Type of the :data:`MISSING` sentinel."""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return 'MISSING'
+
+    def __reduce__(self) -> str:
+        return 'MISSING'
+
+
+#: Value of any optional field that wasn't present in the request.
+MISSING = _Missing()
+
+
+class Session:
+    """Compact variant of :class:`alexa.session.Session`.
+
+    Session attributes aren't copied onto the instance; they're available
+    as the ``attributes`` dict, or :data:`MISSING` if the session has none.
+    """
+
+    __slots__ = ('new', 'session_id', 'application', 'user', 'attributes')
+
+    def __init__(self, session_data: dict):
+        """
+        :param session_data: The ``session`` object from the request sent by
+            the Alexa service.
+        """
+
+        self.new = bool(session_data['new'])
+        self.session_id = session_data['sessionId']
+        self.application = Application(session_data['application'])
+        self.user = User(session_data['user'])
+        self.attributes = session_data.get('attributes', MISSING)
+
+
+class Application:
+    """Compact variant of :class:`alexa.session.Application`."""
+
+    __slots__ = ('application_id', )
+
+    def __init__(self, application_data: dict):
+        """
+        :param application_data: The ``application`` object from the request
+            sent by the Alexa service.
+        """
+
+        self.application_id = application_data['applicationId']
+
+
+class User:
+    """Compact variant of :class:`alexa.session.User`.
+
+    ``consent_token`` and ``access_token`` are :data:`MISSING` when the user
+    hasn't granted permissions or linked an account.
+    """
+
+    __slots__ = ('user_id', 'consent_token', 'access_token')
+
+    def __init__(self, user_data: dict):
+        """
+        :param user_data: The ``user`` object from the request sent by the
+            Alexa service.
+        """
+
+        self.user_id = user_data['userId']
+        self.consent_token = user_data.get('permissions', {}).get('consentToken', MISSING)
+        self.access_token = user_data.get('accessToken', MISSING)
+
+
+class Context:
+    """Compact variant of :class:`alexa.context.Context`.
+
+    ``api_endpoint`` and ``api_access_token`` are :data:`MISSING` when the
+    request doesn't include them.
+    """
+
+    __slots__ = ('device', 'api_endpoint', 'api_access_token')
+
+    def __init__(self, context_data: dict):
+        """
+        :param context_data: The ``context`` object from the request sent by
+            the Alexa service
+        """
+
+        system = context_data['System']
+        self.device = Device(system['device'])
+        self.api_endpoint = system.get('apiEndpoint', MISSING)
+        self.api_access_token = system.get('apiAccessToken', MISSING)
+
+
+class Device:
+    """Compact variant of :class:`alexa.context.Device`, sharing its cache of
+    device capabilities.
+    """
+
+    __slots__ = ('device_id', 'capabilities', 'supports_streaming')
+
+    def __init__(self, device_data: dict):
+        """
+        :param device_data: The ``device`` object from the request sent by the
+            Alexa service.
+        """
+
+        self.device_id = device_data['deviceId']
+        self.capabilities = alexa.context.device_capabilities(
+            device_data['supportedInterfaces'])
+        self.supports_streaming = bool(
+            self.capabilities & alexa.context.Capability.AUDIO_PLAYER)
+
+    supports = alexa.context.Device.supports
+
+
+class Request:
+    """Compact variant of :class:`alexa.request.Request`."""
+
+    __slots__ = ('locale', 'request_id', 'timestamp', 'request_type')
+
+    def __init__(self, request_data: dict):
+        """Creates a new Alexa request
+
+        :param request_data:
+            The 'request' object from the event passed by the Lambda service to
+            the entry function
+        """
+
+        self.locale = request_data['locale']
+        self.request_id = request_data['requestId']
+        self.timestamp = request_data['timestamp']
+        self.request_type = request_data['type']
+
+
+class IntentRequest(Request):
+    """Compact variant of :class:`alexa.request.IntentRequest`.
+
+    ``dialog_state`` is :data:`MISSING` for intents without a dialog model.
+    """
+
+    __slots__ = ('intent', 'dialog_state')
+
+    def __init__(self, request_data: dict):
+        """Creates a new Alexa IntentRequest
+
+        :param request_data:
+            The 'request' object from the event passed by the Lambda service to
+            the entry function
+        """
+
+        super().__init__(request_data)
+
+        self.intent = Intent(request_data['intent'])
+        self.dialog_state = request_data.get('dialogState', MISSING)
+
+    @property
+    def intent_name(self) -> str:
+        """Name of the Intent being requested"""
+
+        return self.intent.name
+
+
+class Intent:
+    """Compact variant of :class:`alexa.request.Intent`."""
+
+    __slots__ = ('confirmation_status', 'name', 'slots')
+
+    def __init__(self, intent_data: dict):
+        """Creates a new Intent
+
+        :param intent_data:
+            The 'intent' object from the 'request' object in the Lambda event
+        """
+
+        self.confirmation_status = intent_data['confirmationStatus']
+        self.name = intent_data['name']
+        self.slots = {
+            name: Slot(data)
+            for name, data in intent_data.get('slots', {}).items()
+        }
+
+
+class Slot:
+    """Compact variant of :class:`alexa.request.Slot`."""
+
+    __slots__ = ('confirmation_status', 'name', 'value')
+
+    def __init__(self, slot_data: dict):
+        """Creates a new Slot
+
+        :param slot_data:
+            The 'slot' object from an 'intent' object in the Lambda event
+        """
+
+        self.confirmation_status = slot_data['confirmationStatus']
+        self.name = slot_data['name']
+        # Alexa leaves 'value' out of slots the user hasn't filled yet
+        self.value = slot_data.get('value')
+
+
+class SessionEndedRequest(Request):
+    """Compact variant of :class:`alexa.request.SessionEndedRequest`.
+
+    ``error_type`` and ``error_message`` are :data:`MISSING` unless the
+    session ended because of an error.
+    """
+
+    __slots__ = ('reason', 'error_type', 'error_message')
+
+    def __init__(self, request_data: dict):
+        """Creates a new Alexa SessionEndedRequest
+
+        :param request_data:
+            The 'request' object from the event passed by the Lambda service to
+            the entry function
+        """
+
+        super().__init__(request_data)
+
+        self.reason = request_data['reason']
+
+        error = request_data.get('error', {})
+        self.error_type = error.get('type', MISSING)
+        self.error_message = error.get('message', MISSING)
+
+
+_REQUEST_TYPES = {
+    'IntentRequest': IntentRequest,
+    'SessionEndedRequest': SessionEndedRequest,
+}
+
+
+def parse_request(request_data: dict) -> Request:
+    """Creates the appropriate compact Request subclass for a 'request' object
+
+    :param request_data:
+        The 'request' object from the event passed by the Lambda service to
+        the entry function
+
+    :return: An IntentRequest, SessionEndedRequest, or a plain Request for any
+        other request type such as 'LaunchRequest'
+    """
+
+    return _REQUEST_TYPES.get(request_data['type'], Request)(request_data)
@@ -1,3 +1,52 @@
+import functools
+
+
+class Capability:
+    """Bit flags for the interfaces a device supports, combined into
+    :attr:`Device.capabilities <alexa.context.Device.capabilities>`::
+
+      >>> if alexa_context.device.supports(alexa.context.Capability.DISPLAY):
+      ...     builder.add_directive(render_template)
+    """
+
+    AUDIO_PLAYER = 1 << 0
+    DISPLAY = 1 << 1
+    VIDEO_APP = 1 << 2
+    APL = 1 << 3
+    APLT = 1 << 4
+    HTML = 1 << 5
+    GEOLOCATION = 1 << 6
+    NAVIGATION = 1 << 7
+
+
+# Interface names from 'supportedInterfaces' and their capability flags
+_INTERFACE_CAPABILITIES = {
+    'AudioPlayer': Capability.AUDIO_PLAYER,
+    'Display': Capability.DISPLAY,
+    'VideoApp': Capability.VIDEO_APP,
+    'Alexa.Presentation.APL': Capability.APL,
+    'Alexa.Presentation.APLT': Capability.APLT,
+    'Alexa.Presentation.HTML': Capability.HTML,
+    'Geolocation': Capability.GEOLOCATION,
+    'Navigation': Capability.NAVIGATION,
+}
+
+
+def device_capabilities(supported_interfaces: dict) -> int:
+    """Work out a device's capabilities from its supported interfaces
+
+    Interfaces this package doesn't know of are ignored.
+
+    :param supported_interfaces: The device's ``supportedInterfaces`` object
+
+    :return: Bitwise OR of its :class:`Capability` flags
+    """
+
+    capabilities = 0
+    for interface in supported_interfaces:
+        capabilities |= _INTERFACE_CAPABILITIES.get(interface, 0)
+
+    return capabilities
 
 
 class Context(object):
@@ -15,6 +64,7 @@ class Context(object):
               "playerActivity": "IDLE"
           },
           "System": {
+              "apiAccessToken": "<token>",
               "apiEndpoint": "https://api.amazonalexa.com",
               "application": {
                   "applicationId": "amzn1.ask.skill.<application_id>"
@@ -32,17 +82,41 @@ class Context(object):
       }
 
     For more information, see `the Alexa Skills Kit docs <https://developer.amazon.com/public/solutions/alexa/alexa-skills-kit/docs/alexa-skills-kit-interface-reference#context-object>`_.
+
+    Pass ``lazy=True`` to defer building the
+    :class:`Device <alexa.context.Device>` until it's first accessed.
     """
 
-    def __init__(self, context_data: dict):
+    def __init__(self, context_data: dict, lazy: bool=False):
         """
         :param context_data: The ``context`` object from the request sent by
             the Alexa service
+        :param lazy: Build child objects on first access instead of up front
+        """
+
+        self._context_data = context_data
+
+        system = context_data['System']
+
+        #: :class:`str` base URL of the Alexa service APIs for this request,
+        #: for use with :func:`alexa.api.get_client`, or None if the request
+        #: doesn't include one.
+        self.api_endpoint = system.get('apiEndpoint')
+
+        #: :class:`str` token authorizing calls to the Alexa service APIs for
+        #: this request, or None if the request doesn't include one.
+        self.api_access_token = system.get('apiAccessToken')
+
+        if not lazy:
+            self.device
+
+    @functools.cached_property
+    def device(self) -> 'Device':
+        """A :class:`Device <alexa.context.Device>` representing the Amazon
+        Echo making the request.
         """
 
-        #: A :class:`Device <alexa.context.Device>` representing the Amazon
-        #: Echo making the request.
-        self.device = Device(context_data['System']['device'])
+        return Device(self._context_data['System']['device'])
 
 
 class Device(object):
@@ -77,6 +151,21 @@ class Device(object):
         #: making the request.
         self.device_id = device_data['deviceId']
 
+        #: :class:`int` bitset of the device's :class:`Capability
+        #: <alexa.context.Capability>` flags.
+        self.capabilities = device_capabilities(device_data['supportedInterfaces'])
+
         #: :class:`bool` indicating whether the requesting Echo supports audio
         #: streaming.
-        self.supports_streaming = 'AudioPlayer' in device_data['supportedInterfaces']
+        self.supports_streaming = bool(self.capabilities & Capability.AUDIO_PLAYER)
+
+    def supports(self, capability: int) -> bool:
+        """Check whether the device supports all of the given capabilities.
+
+        :param capability: A :class:`Capability <alexa.context.Capability>`
+            flag, or several combined with ``|``
+
+        :return: Whether every capability is supported
+        """
+
+        return self.capabilities & capability == capability
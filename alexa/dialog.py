@@ -0,0 +1,263 @@
+"""Multi-turn dialogs declared as state machines.
+
+A dialog is a set of states, each with a handler, and transitions between
+them triggered by intents::
+
+  order = alexa.dialog.DialogMachine('order', initial='size')
+
+  @order.state('size')
+  def ask_size(alexa_session, alexa_user, alexa_request, alexa_context):
+      ...
+
+  @order.state('topping')
+  def ask_topping(alexa_session, alexa_user, alexa_request, alexa_context):
+      ...
+
+  @order.state('done', final=True)
+  def place_order(alexa_session, alexa_user, alexa_request, alexa_context):
+      ...
+
+  order.add_transition('size', 'topping', on='SizeIntent')
+  order.add_transition('topping', 'done', on='ToppingIntent', confirmation_status='CONFIRMED')
+  order.add_transition('topping', 'size', on='ToppingIntent', confirmation_status='DENIED')
+  order.add_transition('*', 'size', on='AMAZON.StartOverIntent')
+
+The machine's :meth:`handle <DialogMachine.handle>` method is itself a
+handler, so it can be registered for every intent the dialog uses. Between
+turns, the current state's name is kept in the session attributes, so
+sessions in progress keep their place when states are added or reordered.
+"""
+import alexa.routing
+
+#: Transition source matching every state.
+ANY_STATE = '*'
+
+
+class DialogMachine:
+    """A dialog's states and the intents that move between them.
+
+    States and transitions compile into one table per state, mapping each
+    intent name to the index of the next state, so each turn takes a few
+    dict lookups however many states and transitions there are. Intents
+    without a transition from the current state leave the dialog where it
+    is, so its handler can prompt again.
+
+    Transitions can also require the request's dialog state, or the
+    intent's confirmation status. When several transitions from a state
+    apply, one with both conditions wins over one with a dialog state, then
+    one with a confirmation status, then one with neither; transitions from
+    a specific state win over those from :data:`ANY_STATE`.
+    """
+
+    def __init__(self, name: str, initial: str):
+        """
+        :param name: Name of the dialog, unique within the skill; the session
+            attribute holding its state is named after it
+        :param initial: State a dialog starts in
+        """
+
+        self.name = name
+        self.initial = initial
+
+        #: Name of the session attribute holding the current state's name.
+        self.attribute = '_dialog_{name}'.format(name=name)
+
+        self._states = {}
+        self._transitions = []
+        self._compiled = None
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def add_state(self, name: str, handler=None, final: bool=False):
+        """Add a state.
+
+        :param name: Name of the state
+        :param handler: Handler called on turns ending in this state
+        :param final: Whether reaching this state ends the dialog
+        """
+
+        self._states[name] = (handler, final)
+        self._compiled = None
+
+    def state(self, name: str, final: bool=False):
+        """Decorator form of :meth:`add_state`.
+
+        :param name: Name of the state
+        :param final: Whether reaching this state ends the dialog
+
+        :return: Decorator adding a state handled by the function it's
+            applied to
+        """
+
+        def decorator(handler):
+            self.add_state(name, handler, final)
+
+            return handler
+
+        return decorator
+
+    def add_transition(
+            self, source: str, target: str, on: str, dialog_state: str=None,
+            confirmation_status: str=None):
+        """Add a transition between states.
+
+        :param source: State the transition leaves, or :data:`ANY_STATE`
+        :param target: State the transition enters
+        :param on: Intent name, or request type, that triggers it
+        :param dialog_state: Dialog state the request must have, from
+            :data:`alexa.routing.DIALOG_STATES`
+        :param confirmation_status: Confirmation status the intent must
+            have, from :data:`alexa.routing.CONFIRMATION_STATUSES`
+
+        :raises: ValueError
+        """
+
+        if dialog_state is not None and dialog_state not in alexa.routing.DIALOG_STATES:
+            raise ValueError('Unknown dialog state: {state}'.format(state=dialog_state))
+        if (confirmation_status is not None
+                and confirmation_status not in alexa.routing.CONFIRMATION_STATUSES):
+            raise ValueError('Unknown confirmation status: {status}'.format(
+                status=confirmation_status))
+
+        self._transitions.append((source, target, (on, dialog_state, confirmation_status)))
+        self._compiled = None
+
+    def compile(self) -> tuple:
+        """Compile the states and transitions into transition tables.
+
+        This happens automatically on the first turn after the dialog is
+        changed, but can be done ahead of time during a cold start.
+
+        :return: Tuple of the state names, their handlers, whether each is
+            final, each state's dict of (intent name, dialog state,
+            confirmation status) to next state index, a dict of state name to
+            index, and whether any transition has conditions
+
+        :raises: ValueError
+        """
+
+        names = list(self._states)
+        indexes = {name: index for index, name in enumerate(names)}
+
+        for state in [self.initial] + [
+                state for source, target, _ in self._transitions
+                for state in (source, target) if state != ANY_STATE]:
+            if state not in indexes:
+                raise ValueError("Dialog '{dialog}' has no state '{state}'".format(
+                    dialog=self.name, state=state))
+
+        tables = [{} for _ in names]
+        # Transitions from any state are applied first, so ones from a
+        # specific state replace them
+        for source, target, event in sorted(
+                self._transitions, key=lambda transition: transition[0] != ANY_STATE):
+            if source == ANY_STATE:
+                for table in tables:
+                    table[event] = indexes[target]
+            else:
+                tables[indexes[source]][event] = indexes[target]
+
+        self._compiled = (
+            tuple(names),
+            tuple(self._states[name][0] for name in names),
+            tuple(self._states[name][1] for name in names),
+            tuple(tables),
+            indexes,
+            any(event[1:] != (None, None) for _, _, event in self._transitions),
+        )
+
+        return self._compiled
+
+    def current(self, alexa_session) -> str:
+        """Find the state a session's dialog is in.
+
+        :param alexa_session: A :class:`Session <alexa.session.Session>`
+
+        :return: Name of the current state, or None if the dialog hasn't
+            started
+        """
+
+        indexes = (self._compiled or self.compile())[4]
+        name = alexa_session.attributes.get(self.attribute)
+        if not isinstance(name, str) or name not in indexes:
+            return None
+
+        return name
+
+    def step(self, alexa_session, alexa_request) -> str:
+        """Advance a session's dialog by one turn.
+
+        A dialog that hasn't started, or whose stored state is no longer
+        valid, enters its initial state instead of following a transition.
+        Reaching a final state ends the dialog and removes its session
+        attribute.
+
+        :param alexa_session: A :class:`Session <alexa.session.Session>`,
+            whose attributes are updated with the new state
+        :param alexa_request: A parsed :class:`Request <alexa.request.Request>`
+
+        :return: Name of the new state
+        """
+
+        index = self._advance(alexa_session, alexa_request)
+
+        return self._compiled[0][index]
+
+    def _advance(self, alexa_session, alexa_request) -> int:
+        """Implements :meth:`step`.
+
+        :return: Index of the new state
+        """
+
+        names, _, finals, tables, indexes, conditional = self._compiled or self.compile()
+        attributes = alexa_session.attributes
+
+        stored = attributes.get(self.attribute)
+        current = indexes.get(stored) if isinstance(stored, str) else None
+        if current is None:
+            index = indexes[self.initial]
+        else:
+            table = tables[current]
+            intent = getattr(alexa_request, 'intent', None)
+            if intent is None:
+                index = table.get((alexa_request.request_type, None, None), current)
+            elif not conditional:
+                index = table.get((intent.name, None, None), current)
+            else:
+                dialog_state = getattr(alexa_request, 'dialog_state', None)
+                status = intent.confirmation_status
+                # Most specific conditions first
+                for key in (
+                        (intent.name, dialog_state, status), (intent.name, dialog_state, None),
+                        (intent.name, None, status), (intent.name, None, None)):
+                    index = table.get(key)
+                    if index is not None:
+                        break
+                else:
+                    index = current
+
+        if finals[index]:
+            attributes.pop(self.attribute, None)
+        elif index != current:
+            attributes[self.attribute] = names[index]
+
+        return index
+
+    def handle(self, alexa_session, alexa_user, alexa_request, alexa_context):
+        """Handler that advances the dialog, then calls the new state's
+        handler.
+
+        :return: The state handler's response
+
+        :raises: RuntimeError
+        """
+
+        index = self._advance(alexa_session, alexa_request)
+        names, handlers = self._compiled[:2]
+        handler = handlers[index]
+        if handler is None:
+            raise RuntimeError("State '{state}' of dialog '{dialog}' has no handler".format(
+                state=names[index], dialog=self.name))
+
+        return handler(alexa_session, alexa_user, alexa_request, alexa_context)
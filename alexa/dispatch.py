@@ -0,0 +1,204 @@
+HANDLER_FUNCTION = 'handle_intent'
+
+
+def _default_fallback(alexa_session, alexa_user, alexa_request, alexa_context) -> dict:
+    """Handler used for any request without a registered handler.
+
+    :return: An Alexa skill response apologizing for the confusion
+    """
+
+    import alexa.response
+
+    return alexa.response.build_response(
+        alexa.response.PLAIN_TEXT,
+        "Sorry, I don't know how to help with that.")
+
+
+class IntentRegistry:
+    """Maps intent names and request types to handler functions.
+
+    Handlers are plain functions with the signature::
+
+      def handle_intent(alexa_session, alexa_user, alexa_request, alexa_context):
+          ...
+
+    and return either a response dict or a
+    :class:`ResponseBuilder <alexa.response.ResponseBuilder>`.
+
+    A registry is normally built once per process, either by scanning a
+    package of handler modules with
+    :meth:`discover <alexa.dispatch.IntentRegistry.discover>` or from a
+    prebuilt manifest with
+    :meth:`from_manifest <alexa.dispatch.IntentRegistry.from_manifest>`.
+    Resolving a request afterwards is a single dict lookup; requests with no
+    registered handler go to the fallback handler instead of raising.
+    """
+
+    def __init__(self, handlers: dict=None, fallback=None):
+        """
+        :param handlers: Optional mapping of intent name or request type to
+            either a handler function or the dotted path of the module
+            providing one
+        :param fallback: Optional handler for requests with no registered
+            handler
+        """
+
+        self._handlers = {}
+        self._module_paths = {}
+
+        #: Handler called for any intent or request type that isn't
+        #: registered.
+        self.fallback = fallback or _default_fallback
+
+        if handlers:
+            for name, handler in handlers.items():
+                self.register(name, handler)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._handlers or name in self._module_paths
+
+    def __len__(self) -> int:
+        return len(self._handlers.keys() | self._module_paths.keys())
+
+    @classmethod
+    def discover(cls, package_name: str, fallback=None) -> 'IntentRegistry':
+        """Build a registry from every module in a handler package.
+
+        Each module is registered under its name relative to the package,
+        so the module ``intents.GetWeather`` handles the ``GetWeather``
+        intent, and ``intents/AMAZON/HelpIntent.py`` handles
+        ``AMAZON.HelpIntent``. Subpackages are scanned too, and registered
+        themselves only if they define a handler function. Modules are only
+        imported when first resolved; subpackages are imported to be scanned.
+
+        :param package_name: Dotted name of the package holding handler
+            modules
+        :param fallback: Optional handler for unregistered requests
+
+        :return: A populated registry
+
+        :raises: ImportError
+        """
+
+        import importlib
+        import pkgutil
+
+        package = importlib.import_module(package_name)
+
+        registry = cls(fallback=fallback)
+
+        def scan(path, prefix: str):
+            for module_info in pkgutil.iter_modules(path):
+                if module_info.name.startswith('_'):
+                    continue
+
+                name = prefix + module_info.name
+                module_path = '.'.join([package_name, name])
+                if not module_info.ispkg:
+                    registry.register(name, module_path)
+                    continue
+
+                subpackage = importlib.import_module(module_path)
+                if hasattr(subpackage, HANDLER_FUNCTION):
+                    registry.register(name, module_path)
+                scan(subpackage.__path__, name + '.')
+
+        scan(package.__path__, '')
+
+        return registry
+
+    @classmethod
+    def from_manifest(cls, manifest_path: str, fallback=None) -> 'IntentRegistry':
+        """Build a registry from a JSON manifest, skipping package scans.
+
+        The manifest is a JSON object mapping intent names or request types
+        to module paths, optionally naming the handler function::
+
+          {
+              "GetWeather": "intents.GetWeather",
+              "LaunchRequest": "intents.launch:handle_launch"
+          }
+
+        :param manifest_path: Path to the manifest file
+        :param fallback: Optional handler for unregistered requests
+
+        :return: A populated registry
+        """
+
+        import json
+
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+
+        return cls(manifest, fallback=fallback)
+
+    def manifest(self) -> dict:
+        """Return the module paths known to this registry, suitable for
+        writing out and loading later with
+        :meth:`from_manifest <alexa.dispatch.IntentRegistry.from_manifest>`.
+
+        :return: dict of intent name or request type to module path
+        """
+
+        return dict(self._module_paths)
+
+    def register(self, name: str, handler):
+        """Register a handler for an intent name or request type.
+
+        :param name: Intent name, or request type such as ``LaunchRequest``
+        :param handler: Handler function, or the dotted path of a module
+            providing a ``handle_intent`` function; a different function name
+            can be given as ``module.path:function``
+        """
+
+        if isinstance(handler, str):
+            self._module_paths[name] = handler
+            self._handlers.pop(name, None)
+        else:
+            self._handlers[name] = handler
+            self._module_paths.pop(name, None)
+
+    def resolve(self, alexa_request):
+        """Find the handler for a parsed request.
+
+        :class:`IntentRequests <alexa.request.IntentRequest>` resolve by
+        intent name; all other requests resolve by request type.
+
+        :param alexa_request: A parsed :class:`Request <alexa.request.Request>`
+
+        :return: The handler function to call
+        """
+
+        if hasattr(alexa_request, 'intent'):
+            name = alexa_request.intent.name
+        else:
+            name = alexa_request.request_type
+
+        return self.resolve_name(name)
+
+    def resolve_name(self, name: str):
+        """Find the handler registered under an intent name or request type.
+
+        :param name: Intent name or request type
+
+        :return: The handler function to call
+        """
+
+        try:
+            return self._handlers[name]
+        except KeyError:
+            pass
+
+        module_path = self._module_paths.get(name)
+        if module_path is None:
+            return self.fallback
+
+        import importlib
+
+        module_path, _, function_name = module_path.partition(':')
+        handler = getattr(
+            importlib.import_module(module_path),
+            function_name or HANDLER_FUNCTION)
+        self._handlers[name] = handler
+
+        return handler
@@ -0,0 +1,190 @@
+"""Rank catalog entries by similarity to misrecognized slot values.
+
+Speech recognition often returns a near miss, like ``"peperoni piza"``,
+that :mod:`alexa.resolution` can't find. A :class:`FuzzyMatcher` scores a
+slot value against every value and synonym of a catalog at once, by the
+trigrams they share, and returns the best candidates::
+
+  matcher = alexa.fuzzy.load_matcher('catalogs/products.json')
+
+  for candidate in alexa_request.intent.slots['Product'].matches(matcher, k=3):
+      print(candidate.id, candidate.score)
+
+Scoring is vectorized with NumPy, which must be installed to use this
+module.
+"""
+import collections
+import threading
+
+try:
+    import numpy
+except ImportError as error:
+    raise ImportError(
+        'alexa.fuzzy requires NumPy; install it with "pip install numpy"') from error
+
+import alexa.resolution
+
+#: A ranked catalog entry. ``matched`` is the normalized value or synonym
+#: most similar to the slot value, and ``score`` is their trigram similarity,
+#: from 0 to 1.
+Candidate = collections.namedtuple('Candidate', ['id', 'name', 'matched', 'score'])
+
+# Each codepoint fits in 21 bits, so a trigram packs into one uint64
+_CODEPOINT_BITS = 21
+
+
+def _pad(normalized: str) -> str:
+    # Padding gives the start and end of every word trigrams of their own,
+    # so short words and their first letters still count
+    return '  ' + normalized + ' '
+
+
+def _codepoints(text: str) -> numpy.ndarray:
+    return numpy.frombuffer(text.encode('utf-32-le'), dtype=numpy.uint32).astype(numpy.uint64)
+
+
+def _trigrams(codes: numpy.ndarray) -> numpy.ndarray:
+    return (
+        codes[:-2] << (2 * _CODEPOINT_BITS) | codes[1:-1] << _CODEPOINT_BITS | codes[2:])
+
+
+class FuzzyMatcher:
+    """Trigram index of a :class:`SlotCatalog <alexa.resolution.SlotCatalog>`.
+
+    Every value and synonym is packed into a single array of codepoints, and
+    their trigrams into an inverted index from each distinct trigram to the
+    phrases containing it. Matching a slot value looks up its trigrams, counts
+    the trigrams each phrase shares with it using :func:`numpy.bincount`, and
+    scores every phrase with the Dice coefficient,
+    ``2 * shared / (query trigrams + phrase trigrams)``.
+    """
+
+    def __init__(self, catalog: 'alexa.resolution.SlotCatalog'):
+        """
+        :param catalog: The catalog to match against
+        """
+
+        self.catalog = catalog
+
+        phrases = catalog.phrases()
+        self._phrases = [phrase for phrase, _ in phrases]
+        self._phrase_entries = numpy.fromiter(
+            (index for _, index in phrases), dtype=numpy.int64, count=len(phrases))
+
+        padded = [_pad(phrase) for phrase in self._phrases]
+        # NUL never survives normalization, so it safely separates phrases
+        codes = _codepoints('\0'.join(padded))
+        lengths = numpy.fromiter(map(len, padded), dtype=numpy.int64, count=len(padded))
+        owners = numpy.repeat(numpy.arange(len(padded)), lengths + 1)[:len(codes) - 2]
+
+        grams = _trigrams(codes)
+        within_phrase = (codes[:-2] != 0) & (codes[1:-1] != 0) & (codes[2:] != 0)
+        grams = grams[within_phrase]
+        owners = owners[within_phrase]
+
+        # Sorted distinct trigrams; a trigram's position is its ID
+        self._grams, gram_ids = numpy.unique(grams, return_inverse=True)
+
+        # Each phrase counts each of its trigrams once
+        pairs = numpy.unique(owners * len(self._grams) + gram_ids.reshape(-1))
+        pair_phrases = pairs // len(self._grams)
+        pair_grams = pairs % len(self._grams)
+
+        order = numpy.argsort(pair_grams, kind='stable')
+        self._postings = pair_phrases[order]
+        self._posting_starts = numpy.concatenate([
+            [0], numpy.cumsum(numpy.bincount(pair_grams, minlength=len(self._grams)))])
+        self._gram_counts = numpy.bincount(pair_phrases, minlength=len(self._phrases))
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def scores(self, value: str) -> numpy.ndarray:
+        """Score a slot value against every value and synonym in the catalog.
+
+        :param value: A slot value
+
+        :return: Array of similarity scores, in :meth:`SlotCatalog.phrases
+            <alexa.resolution.SlotCatalog.phrases>` order
+        """
+
+        scores = numpy.zeros(len(self._phrases))
+        normalized = alexa.resolution.normalize(value or '')
+        if not normalized or not len(self._grams):
+            return scores
+
+        query = numpy.unique(_trigrams(_codepoints(_pad(normalized))))
+        positions = numpy.minimum(
+            numpy.searchsorted(self._grams, query), len(self._grams) - 1)
+        found = positions[self._grams[positions] == query]
+        if not len(found):
+            return scores
+
+        postings = numpy.concatenate([
+            self._postings[start:end] for start, end in zip(
+                self._posting_starts[found], self._posting_starts[found + 1])])
+        shared = numpy.bincount(postings, minlength=len(self._phrases))
+
+        return numpy.divide(2 * shared, len(query) + self._gram_counts, out=scores)
+
+    def match(self, value: str, k: int=5, min_score: float=0.0) -> list:
+        """Find the catalog entries most similar to a slot value.
+
+        :param value: A slot value, or None for an empty slot
+        :param k: Most candidates to return
+        :param min_score: Lowest score a candidate may have
+
+        :return: List of up to ``k`` :class:`Candidate` entries, best first;
+            an entry matching by several synonyms is only listed once
+        """
+
+        scores = self.scores(value)
+        candidates = numpy.flatnonzero(scores > min_score)
+        if not len(candidates) or k < 1:
+            return []
+
+        # Entries are ranked by their best scoring value or synonym
+        entries = self._phrase_entries[candidates]
+        entry_scores = numpy.zeros(len(self.catalog))
+        numpy.maximum.at(entry_scores, entries, scores[candidates])
+
+        ranked = numpy.flatnonzero(entry_scores)
+        if len(ranked) > k:
+            ranked = ranked[numpy.argpartition(-entry_scores[ranked], k - 1)[:k]]
+        ranked = ranked[numpy.lexsort((ranked, -entry_scores[ranked]))]
+
+        best_phrases = {}
+        phrases = candidates[numpy.isin(entries, ranked)]
+        for phrase in phrases[numpy.argsort(-scores[phrases], kind='stable')].tolist():
+            best_phrases.setdefault(int(self._phrase_entries[phrase]), phrase)
+
+        return [
+            Candidate(
+                self.catalog.ids[entry], self.catalog.names[entry],
+                self._phrases[best_phrases[entry]], float(entry_scores[entry]))
+            for entry in ranked.tolist()
+        ]
+
+
+_matchers = {}
+_matchers_lock = threading.Lock()
+
+
+def load_matcher(path: str) -> FuzzyMatcher:
+    """Load a catalog file's matcher, reusing the index already built for it
+    by this process.
+
+    :param path: Path of the catalog's JSON file
+
+    :return: The shared :class:`FuzzyMatcher`, built on the catalog from
+        :func:`alexa.resolution.load_catalog`
+    """
+
+    matcher = _matchers.get(path)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(path)
+            if matcher is None:
+                matcher = _matchers[path] = FuzzyMatcher(alexa.resolution.load_catalog(path))
+
+    return matcher
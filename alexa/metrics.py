@@ -0,0 +1,150 @@
+"""Per-phase timing of the request pipeline.
+
+When enabled, each invocation writes one line to stdout in CloudWatch's
+`embedded metric format <https://docs.aws.amazon.com/AmazonCloudWatch/latest/monitoring/CloudWatch_Embedded_Metric_Format_Specification.html>`_,
+which CloudWatch Logs turns into metrics without any API calls::
+
+  {"_aws": {"Timestamp": 1500000000000, "CloudWatchMetrics": [...]},
+   "Intent": "GetWeather", "RequestId": "amzn1.echo-api.request.<id>",
+   "SessionParse": 0.011, "UserParse": 0.004, ..., "Total": 1.52}
+
+Timing is enabled by setting the ``ALEXA_PHASE_METRICS`` environment variable
+to ``1``, or by setting :data:`enabled` at runtime. While disabled, timers
+are a shared no-op object and add no measurable overhead.
+"""
+import os
+import sys
+import time
+
+#: Whether invocations are timed and their metrics emitted.
+enabled = os.environ.get('ALEXA_PHASE_METRICS', '0') not in ('', '0')
+
+#: CloudWatch namespace the metrics are published under.
+NAMESPACE = os.environ.get('ALEXA_PHASE_METRICS_NAMESPACE', 'AlexaSkill')
+
+#: Pipeline phases, in the order they're timed.
+PHASES = (
+    'SessionParse',
+    'UserParse',
+    'RequestParse',
+    'HandlerResolution',
+    'HandlerExecution',
+    'ResponseBuild',
+    'StateFlush',
+)
+
+
+class PhaseTimer:
+    """Times consecutive phases of a single invocation."""
+
+    __slots__ = ('phases', '_started', '_last')
+
+    def __init__(self):
+        #: dict of phase name to its duration in milliseconds.
+        self.phases = {}
+        self._started = self._last = time.perf_counter_ns()
+
+    def mark(self, phase: str):
+        """Record the end of a phase, which began when the previous one ended.
+
+        :param phase: Name of the phase that just finished
+        """
+
+        now = time.perf_counter_ns()
+        self.phases[phase] = (now - self._last) / 1e6
+        self._last = now
+
+    def record(self, alexa_request) -> dict:
+        """Build the embedded metric format record for this invocation.
+
+        :param alexa_request: The invocation's parsed
+            :class:`Request <alexa.request.Request>`, or None if parsing failed
+
+        :return: A record ready to be serialized as JSON
+        """
+
+        if alexa_request is None:
+            intent = 'Unknown'
+            request_id = None
+        else:
+            intent = _intent_name(alexa_request)
+            request_id = alexa_request.request_id
+
+        metrics = dict(self.phases)
+        metrics['Total'] = (self._last - self._started) / 1e6
+
+        record = {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': NAMESPACE,
+                    'Dimensions': [['Intent']],
+                    'Metrics': [
+                        {'Name': name, 'Unit': 'Milliseconds'} for name in metrics
+                    ],
+                }],
+            },
+            'Intent': intent,
+            'RequestId': request_id,
+        }
+        record.update(metrics)
+
+        return record
+
+    def emit(self, alexa_request, stream=None):
+        """Write this invocation's metrics as a single JSON log line.
+
+        :param alexa_request: The invocation's parsed
+            :class:`Request <alexa.request.Request>`, or None if parsing failed
+        :param stream: Optional file to write to instead of stdout
+        """
+
+        import json
+
+        (stream or sys.stdout).write(
+            json.dumps(self.record(alexa_request), separators=(',', ':')) + '\n')
+
+
+def _intent_name(alexa_request) -> str:
+    """Name a request by its intent, or its type if it has none.
+
+    This runs while an invocation's error may be propagating, so the name is
+    read with :attr:`intent_name <alexa.request.IntentRequest.intent_name>`
+    rather than from a lazily parsed intent, whose building could raise again
+    and hide the original error.
+
+    :return: Intent name, request type, or ``'Unknown'``
+    """
+
+    if not hasattr(alexa_request, 'intent_name'):
+        return alexa_request.request_type
+
+    return alexa_request.intent_name or 'Unknown'
+
+
+class _DisabledTimer:
+    """Stand-in for :class:`PhaseTimer` while timing is disabled."""
+
+    __slots__ = ()
+
+    def mark(self, phase: str):
+        pass
+
+    def emit(self, alexa_request, stream=None):
+        pass
+
+
+_DISABLED_TIMER = _DisabledTimer()
+
+
+def start_timer():
+    """Start timing an invocation.
+
+    :return: A new :class:`PhaseTimer` if timing is enabled, otherwise a
+        shared timer that does nothing
+    """
+
+    if enabled:
+        return PhaseTimer()
+
+    return _DISABLED_TIMER
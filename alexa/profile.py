@@ -0,0 +1,163 @@
+"""Per-user profiles, loaded in the background while a request is handled.
+
+A :class:`ProfileCache` wraps a function that fetches a user's profile,
+such as from the Alexa customer profile API or the skill's own backend.
+Once attached, every :class:`User <alexa.session.User>` starts loading its
+profile on a worker thread as soon as it's parsed, so the fetch overlaps with
+parsing the rest of the event and dispatching to the handler::
+
+  def fetch_profile(alexa_user):
+      ...
+
+  profiles = alexa.profile.ProfileCache(fetch_profile)
+  profiles.attach()
+
+  def handle_intent(alexa_session, alexa_user, alexa_request, alexa_context):
+      name = alexa_user.profile['name']
+
+Profiles are cached across warm invocations, and users without a profile
+are remembered too, for a shorter time, so they aren't fetched on every
+turn.
+"""
+import concurrent.futures
+import threading
+
+import alexa.cache
+import alexa.session
+
+#: Default seconds a fetched profile stays cached.
+DEFAULT_TTL = 300.0
+
+#: Default seconds a user without a profile stays cached.
+DEFAULT_NEGATIVE_TTL = 60.0
+
+# Cached in place of None for users without a profile
+_NO_PROFILE = object()
+
+
+class ProfileCache:
+    """Cache of user profiles by user ID, with least recently used and
+    time-based eviction.
+
+    Each user is fetched at most once at a time: a request for a profile
+    that's still loading waits for the fetch already running. Errors raised
+    while fetching aren't cached, so the next request tries again.
+    """
+
+    def __init__(
+            self, fetch, max_entries: int=1024, ttl: float=DEFAULT_TTL,
+            negative_ttl: float=DEFAULT_NEGATIVE_TTL, max_workers: int=4):
+        """
+        :param fetch: Function taking a :class:`User <alexa.session.User>` and
+            returning their profile, or None if they have none
+        :param max_entries: Most users cached before evicting
+        :param ttl: Seconds a profile stays cached
+        :param negative_ttl: Seconds a user without a profile stays cached
+        :param max_workers: Most profiles fetched at once
+        """
+
+        self.fetch = fetch
+        self.negative_ttl = negative_ttl
+        self.max_workers = max_workers
+
+        self._cache = alexa.cache.TTLCache(max_entries, ttl)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def attach(self) -> 'ProfileCache':
+        """Prefetch the profile of every :class:`User <alexa.session.User>`
+        parsed from now on, and serve their :attr:`profile
+        <alexa.session.User.profile>`.
+
+        :return: This cache
+        """
+
+        alexa.session.User.profile_cache = self
+
+        return self
+
+    def prefetch(self, alexa_user) -> concurrent.futures.Future:
+        """Start loading a user's profile in the background, unless it's
+        cached or already loading.
+
+        :param alexa_user: A :class:`User <alexa.session.User>`
+
+        :return: The :class:`concurrent.futures.Future` loading the profile,
+            or None if it's cached
+        """
+
+        user_id = alexa_user.user_id
+        if user_id in self._cache:
+            return None
+
+        with self._lock:
+            future = self._pending.get(user_id)
+            if future is not None:
+                return future
+
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix='alexa-profile')
+            future = self._pending[user_id] = self._executor.submit(self.fetch, alexa_user)
+
+        # Outside the lock, since a fetch that's already finished runs the
+        # callback right away
+        future.add_done_callback(lambda future: self._store(user_id, future))
+
+        return future
+
+    def get(self, alexa_user, timeout: float=None):
+        """Get a user's profile, waiting for it if it isn't cached.
+
+        :param alexa_user: A :class:`User <alexa.session.User>`
+        :param timeout: Most seconds to wait for the profile to load
+
+        :return: The profile, or None if the user has none
+
+        :raises: TimeoutError, or whatever the fetch function raised
+        """
+
+        while True:
+            profile = self._cache.get(alexa_user.user_id)
+            if profile is not alexa.cache.MISS:
+                return None if profile is _NO_PROFILE else profile
+
+            future = self.prefetch(alexa_user)
+            # Between the lookup and the prefetch, another thread may have
+            # finished loading the profile
+            if future is not None:
+                return future.result(timeout)
+
+    def invalidate(self, user_id: str):
+        """Forget a user's profile, so it's fetched again on next use.
+
+        :param user_id: ID of the user
+        """
+
+        with self._lock:
+            self._pending.pop(user_id, None)
+            self._cache.pop(user_id)
+
+    def clear(self):
+        """Forget every profile."""
+
+        with self._lock:
+            self._pending.clear()
+            self._cache.clear()
+
+    def _store(self, user_id: str, future: concurrent.futures.Future):
+        with self._lock:
+            # A profile invalidated while it loaded is left out of the cache
+            if self._pending.get(user_id) is not future:
+                return
+            del self._pending[user_id]
+
+            if future.cancelled() or future.exception() is not None:
+                return
+
+            profile = future.result()
+            if profile is None:
+                self._cache.put(user_id, _NO_PROFILE, self.negative_ttl)
+            else:
+                self._cache.put(user_id, profile)
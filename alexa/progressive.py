@@ -0,0 +1,92 @@
+"""Progressive responses, spoken while a slow handler is still working.
+
+Alexa can speak an interim message, such as "One moment while I look that
+up", before the skill's response is ready. :func:`send` posts it to the
+Alexa directives API on a background thread and returns at once, so the
+handler carries on computing while it's delivered::
+
+  def handle_intent(alexa_session, alexa_user, alexa_request, alexa_context):
+      alexa.progressive.send(alexa_request, alexa_context, 'One moment...')
+      result = slow_lookup()
+      ...
+
+Progressive responses travel over the pooled connections of
+:func:`alexa.api.get_client`. A failed delivery never affects the main
+response; it's only reported through the returned future.
+"""
+import concurrent.futures
+import threading
+
+import alexa.api
+
+#: Path of the directives API, under the request's API endpoint.
+DIRECTIVES_PATH = '/v1/directives'
+
+#: Default seconds a progressive response may take to deliver. Alexa drops
+#: them once the skill's response has arrived, so there's no use waiting
+#: long.
+DEFAULT_TIMEOUT = 1.0
+
+#: Most progressive responses delivered at once.
+MAX_WORKERS = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def directive(request_id: str, speech: str) -> dict:
+    """Build the body of a ``VoicePlayer.Speak`` progressive response.
+
+    :param request_id: ID of the request being answered
+    :param speech: Plain text, or an SSML document, to speak
+
+    :return: The JSON-serializable body
+    """
+
+    return {
+        'header': {
+            'requestId': request_id,
+        },
+        'directive': {
+            'type': 'VoicePlayer.Speak',
+            'speech': speech,
+        },
+    }
+
+
+def send(
+        alexa_request, alexa_context, speech,
+        timeout: float=DEFAULT_TIMEOUT) -> concurrent.futures.Future:
+    """Speak a progressive response without waiting for it to be delivered.
+
+    :param alexa_request: The parsed :class:`Request <alexa.request.Request>`
+        being answered
+    :param alexa_context: The request's :class:`Context
+        <alexa.context.Context>`, giving the API endpoint and access token
+    :param speech: Plain text or SSML to speak, or a :class:`Speech
+        <alexa.ssml.Speech>`
+    :param timeout: Most seconds the delivery may take
+
+    :return: :class:`concurrent.futures.Future` finishing once the response
+        is delivered, holding any :class:`APIError <alexa.api.APIError>` or
+        :class:`OSError` if delivery failed
+
+    :raises: ValueError
+    """
+
+    global _executor
+
+    if not alexa_context.api_endpoint or not alexa_context.api_access_token:
+        raise ValueError('Request has no API endpoint to send a progressive response to')
+
+    client = alexa.api.get_client(alexa_context.api_endpoint)
+    body = directive(alexa_request.request_id, str(speech))
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    MAX_WORKERS, thread_name_prefix='alexa-progressive')
+
+    return _executor.submit(
+        client.post, DIRECTIVES_PATH, body, alexa_context.api_access_token, timeout)
@@ -1,13 +1,16 @@
+import functools
 
 
 class Request:
 
-    def __init__(self, request_data: dict):
+    def __init__(self, request_data: dict, lazy: bool=False):
         """Creates a new Alexa request
         
         :param request_data:
             The 'request' object from the event passed by the Lambda service to
             the entry function
+        :param lazy:
+            Build child objects on first access instead of up front
         """
 
         self.locale = request_data['locale']
@@ -18,38 +21,93 @@ class Request:
 
 class IntentRequest(Request):
 
-    def __init__(self, request_data: dict):
+    def __init__(self, request_data: dict, lazy: bool=False):
         """Creates a new Alexa IntentRequest
 
         :param request_data:
             The 'request' object from the event passed by the Lambda service to
             the entry function
+        :param lazy:
+            Build the Intent and its Slots on first access instead of up front
         """
 
-        super().__init__(request_data)
+        super().__init__(request_data, lazy)
+
+        self._intent_data = request_data['intent']
+        self._lazy = lazy
+        if not lazy:
+            self.intent
 
-        self.intent = Intent(request_data['intent'])
         if 'dialogState' in request_data:
             self.dialog_state = request_data['dialogState']
 
+    @functools.cached_property
+    def intent(self) -> 'Intent':
+        """The Intent being requested"""
+
+        return Intent(self._intent_data, self._lazy)
+
+    @property
+    def intent_name(self) -> str:
+        """Name of the Intent being requested, or None if the request has
+        none. It's read without building the Intent, so it's safe to use even
+        if the intent is malformed.
+        """
+
+        intent_data = self._intent_data
+        if not isinstance(intent_data, dict):
+            return None
+
+        return intent_data.get('name')
+
 
 class Intent:
 
-    def __init__(self, intent_data: dict):
+    def __init__(self, intent_data: dict, lazy: bool=False):
         """Creates a new Intent
 
         :param intent_data:
             The 'intent' object from the 'request' object in the Lambda event
+        :param lazy:
+            Build the Slots on first access instead of up front
         """
 
         self.confirmation_status = intent_data['confirmationStatus']
         self.name = intent_data['name']
 
-        self.slots = {}
-        if 'slots' in intent_data:
-            for name, data in intent_data['slots'].items():
+        self._slot_data = intent_data.get('slots')
+        if not lazy:
+            self.slots
+
+    @functools.cached_property
+    def slots(self) -> dict:
+        """dict of slot name to Slot"""
+
+        slots = {}
+        if self._slot_data:
+            for name, data in self._slot_data.items():
                 slot = Slot(data)
-                self.slots[name] = slot
+                slots[name] = slot
+
+        return slots
+
+    def match_slots(self, matchers: dict, k: int=5) -> dict:
+        """Ranks catalog matches for several slots at once
+
+        :param matchers: dict of slot name to the
+            :class:`FuzzyMatcher <alexa.fuzzy.FuzzyMatcher>` for its catalog
+        :param k: Most candidates to return per slot
+
+        :return: dict of slot name to a list of
+            :class:`Candidate <alexa.fuzzy.Candidate>`, best first, for each
+            slot in ``matchers`` that the intent has
+        """
+
+        return {
+            name: self.slots[name].matches(matcher, k)
+            for name, matcher in matchers.items()
+            if name in self.slots
+        }
 
 
 class Slot:
@@ -63,20 +121,47 @@ class Slot:
 
         self.confirmation_status = slot_data['confirmationStatus']
         self.name = slot_data['name']
-        self.value = slot_data['value']
+        # Alexa leaves 'value' out of slots the user hasn't filled yet
+        self.value = slot_data.get('value')
+
+    def resolve(self, catalog: 'alexa.resolution.SlotCatalog') -> 'alexa.resolution.Match':
+        """Resolves this slot's value to a catalog entry
+
+        :param catalog: The :class:`SlotCatalog <alexa.resolution.SlotCatalog>`
+            to resolve against
+
+        :return: The best :class:`Match <alexa.resolution.Match>`, or None
+        """
+
+        return catalog.resolve(self.value)
+
+    def matches(self, matcher: 'alexa.fuzzy.FuzzyMatcher', k: int=5) -> list:
+        """Ranks the catalog entries most similar to this slot's value
+
+        :param matcher: The :class:`FuzzyMatcher <alexa.fuzzy.FuzzyMatcher>`
+            of the catalog to match against
+        :param k: Most candidates to return
+
+        :return: List of :class:`Candidate <alexa.fuzzy.Candidate>`, best first
+        """
+
+        return matcher.match(self.value, k)
 
 
 class SessionEndedRequest(Request):
 
-    def __init__(self, request_data: dict):
+    def __init__(self, request_data: dict, lazy: bool=False):
         """Creates a new Alexa SessionEndedRequest
 
         :param request_data:
             The 'request' object from the event passed by the Lambda service to
             the entry function
+        :param lazy:
+            Accepted for consistency with other requests; there are no child
+            objects to defer
         """
 
-        super().__init__(request_data)
+        super().__init__(request_data, lazy)
 
         self.reason = request_data['reason']
 
@@ -85,3 +170,25 @@ class SessionEndedRequest(Request):
                 self.error_type = request_data['error']['type']
             if 'message' in request_data['error']:
                 self.error_message = request_data['error']['message']
+
+
+_REQUEST_TYPES = {
+    'IntentRequest': IntentRequest,
+    'SessionEndedRequest': SessionEndedRequest,
+}
+
+
+def parse_request(request_data: dict, lazy: bool=False) -> Request:
+    """Creates the appropriate Request subclass for a 'request' object
+
+    :param request_data:
+        The 'request' object from the event passed by the Lambda service to
+        the entry function
+    :param lazy:
+        Build child objects on first access instead of up front
+
+    :return: An IntentRequest, SessionEndedRequest, or a plain Request for any
+        other request type such as 'LaunchRequest'
+    """
+
+    return _REQUEST_TYPES.get(request_data['type'], Request)(request_data, lazy)
@@ -0,0 +1,248 @@
+"""Resolve slot values to entries of a custom catalog.
+
+A catalog lists canonical values with their IDs and synonyms, in the same
+form as a custom slot type in the skill's interaction model::
+
+  {
+      "values": [
+          {
+              "id": "SKU-1234",
+              "name": {
+                  "value": "pepperoni pizza",
+                  "synonyms": ["pepperoni pie", "pepperoni"]
+              }
+          }
+      ]
+  }
+
+Loading a catalog builds an index once: a hash of every normalized value
+and synonym for exact lookups, and a token trie for finding the longest
+value or synonym inside a longer phrase. Catalogs loaded with
+:func:`load_catalog` are kept for the life of the process, so warm
+invocations skip the build::
+
+  catalog = alexa.resolution.load_catalog('catalogs/products.json')
+
+  match = alexa_request.intent.slots['Product'].resolve(catalog)
+  if match is not None:
+      add_to_order(match.id)
+"""
+import collections
+import re
+import sys
+import threading
+import unicodedata
+
+#: A catalog entry matched by a slot value. ``matched`` is the normalized
+#: value or synonym that matched, and ``exact`` is False if it was only
+#: found inside a longer phrase.
+Match = collections.namedtuple('Match', ['id', 'name', 'matched', 'exact'])
+
+_SEPARATORS = re.compile(r'[\W_]+')
+
+
+def normalize(text: str) -> str:
+    """Normalize text for matching: fold case and accents, and reduce
+    punctuation and runs of whitespace to single spaces.
+
+    :param text: Text to normalize
+
+    :return: Normalized text
+    """
+
+    if not text.isascii():
+        text = ''.join(
+            character for character in unicodedata.normalize('NFKD', text)
+            if not unicodedata.combining(character))
+
+    return _SEPARATORS.sub(' ', text.casefold()).strip()
+
+
+class SlotCatalog:
+    """Index of a catalog's values and synonyms.
+
+    When several entries share a value or synonym, the first one listed
+    wins.
+    """
+
+    def __init__(self, values: list):
+        """
+        :param values: The catalog's ``values``, each a dict with an ``id``
+            and a ``name`` holding the ``value`` and optional ``synonyms``
+        """
+
+        #: IDs of the entries, in catalog order.
+        self.ids = []
+        #: Canonical values of the entries, in catalog order.
+        self.names = []
+
+        self._exact = {}
+        # The trie is kept flat, as a map of (node, token) to child node, and
+        # a map of the nodes that end a value or synonym to their entry
+        self._children = {}
+        self._terminals = {}
+        self._max_tokens = 0
+
+        self._index(values)
+
+    def _index(self, values: list):
+        """Add values to the hash and trie.
+
+        Large catalogs are indexed during cold starts, so this loop is kept
+        tight, with attribute lookups hoisted into locals.
+
+        :param values: Catalog values, as passed to :class:`SlotCatalog`
+        """
+
+        ids = self.ids
+        names = self.names
+        exact = self._exact
+        children = self._children
+        terminals = self._terminals
+        max_tokens = self._max_tokens
+        intern = sys.intern
+
+        for value in values:
+            name = value['name']
+            index = len(ids)
+            ids.append(value.get('id', name['value']))
+            names.append(name['value'])
+
+            for text in [name['value']] + list(name.get('synonyms', ())):
+                normalized = normalize(text)
+                if not normalized or normalized in exact:
+                    continue
+                exact[normalized] = index
+
+                tokens = normalized.split(' ')
+                node = 0
+                for token in tokens:
+                    child = children.get((node, token))
+                    if child is None:
+                        child = len(children) + 1
+                        children[(node, intern(token))] = child
+                    node = child
+                terminals[node] = index
+                if len(tokens) > max_tokens:
+                    max_tokens = len(tokens)
+
+        self._max_tokens = max_tokens
+
+    @classmethod
+    def from_file(cls, path: str) -> 'SlotCatalog':
+        """Build a catalog from a JSON file.
+
+        :param path: Path of a JSON file holding a custom slot type, or just
+            its list of values
+
+        :return: A new :class:`SlotCatalog`
+        """
+
+        import json
+
+        with open(path, encoding='utf-8') as catalog_file:
+            data = json.load(catalog_file)
+
+        return cls(data['values'] if isinstance(data, dict) else data)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def phrases(self) -> list:
+        """List every indexed value and synonym.
+
+        :return: List of (normalized text, entry position) pairs, in catalog
+            order
+        """
+
+        return list(self._exact.items())
+
+    def _match(self, index: int, matched: str, exact: bool) -> Match:
+        return Match(self.ids[index], self.names[index], matched, exact)
+
+    def lookup(self, value: str) -> Match:
+        """Find the entry whose value or synonym is exactly ``value``, once
+        both are normalized.
+
+        :param value: A slot value
+
+        :return: The matching :class:`Match`, or None
+        """
+
+        normalized = normalize(value)
+        index = self._exact.get(normalized)
+
+        return None if index is None else self._match(index, normalized, True)
+
+    def search(self, value: str) -> Match:
+        """Find the longest value or synonym contained in ``value``, on token
+        boundaries, so ``"a large pepperoni pizza please"`` finds
+        ``"pepperoni pizza"``.
+
+        :param value: A slot value
+
+        :return: The best :class:`Match`, or None; the earliest wins between
+            matches of the same length
+        """
+
+        tokens = normalize(value).split(' ')
+        children = self._children
+        best = None
+        best_length = 0
+
+        for start in range(len(tokens)):
+            if len(tokens) - start <= best_length:
+                break
+
+            node = 0
+            for end in range(start, min(len(tokens), start + self._max_tokens)):
+                node = children.get((node, tokens[end]))
+                if node is None:
+                    break
+                if node in self._terminals and end - start + 1 > best_length:
+                    best = (self._terminals[node], start, end + 1)
+                    best_length = end - start + 1
+
+        if best is None:
+            return None
+
+        index, start, end = best
+
+        return self._match(index, ' '.join(tokens[start:end]), end - start == len(tokens))
+
+    def resolve(self, value: str) -> Match:
+        """Resolve a slot value, trying an exact match before searching
+        inside it.
+
+        :param value: A slot value, or None for an empty slot
+
+        :return: The best :class:`Match`, or None
+        """
+
+        if not value:
+            return None
+
+        return self.lookup(value) or self.search(value)
+
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def load_catalog(path: str) -> SlotCatalog:
+    """Load a catalog file, reusing the index already built for it by this
+    process.
+
+    :param path: Path of the catalog's JSON file
+
+    :return: The shared :class:`SlotCatalog`
+    """
+
+    catalog = _catalogs.get(path)
+    if catalog is None:
+        with _catalogs_lock:
+            catalog = _catalogs.get(path)
+            if catalog is None:
+                catalog = _catalogs[path] = SlotCatalog.from_file(path)
+
+    return catalog
@@ -1,10 +1,160 @@
-import json
-import urllib.parse
+import collections.abc
+import functools
 
+_IMAGE_EXTENSIONS = ('.jpeg', '.jpg', '.png')
+_IMAGE_URL_CACHE_SIZE = 512
 _MAX_CARD_LENGTH = 8000
+_SHARED_CARD_CACHE_SIZE = 256
 PLAIN_TEXT = 'PlainText'
 SSML = 'SSML'
 
+# Output speech type and the key its text goes under, per response type
+_OUTPUT_SPEECH_SKELETONS = {
+    PLAIN_TEXT: (PLAIN_TEXT, 'text'),
+    SSML: (SSML, 'ssml'),
+}
+
+
+def _json_default(obj):
+    """Serialize mappings that aren't plain dicts, such as session attributes
+
+    :raises: TypeError
+    """
+
+    if isinstance(obj, collections.abc.Mapping):
+        return dict(obj)
+
+    raise TypeError('Object of type {type} is not JSON serializable'.format(
+        type=type(obj).__name__))
+
+
+def _plain_session_attributes(session_attributes):
+    """Unwrap :class:`SessionAttributes <alexa.session.SessionAttributes>`,
+    which hand back the request's own dict when nothing was changed
+
+    :param session_attributes: A dict or other mapping of session attributes
+
+    :return: The attributes, ready to be serialized
+    """
+
+    to_dict = getattr(session_attributes, 'to_dict', None)
+
+    return session_attributes if to_dict is None else to_dict()
+
+
+def _select_encoder():
+    """Pick the fastest available JSON encoder
+
+    orjson is used if it's installed; otherwise the standard library encoder
+    is configured to produce the same compact UTF-8 output.
+
+    :return: Function encoding an object to JSON bytes
+    """
+
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        encoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(',', ':'), default=_json_default)
+
+        def encode(obj) -> bytes:
+            return encoder.encode(obj).encode('utf-8')
+    else:
+        def encode(obj) -> bytes:
+            return orjson.dumps(obj, default=_json_default)
+
+    return encode
+
+
+_encode = None
+
+# Extra bytes needed to escape each character JSON requires escaping
+_JSON_ESCAPE_EXTRA_LENGTH = {chr(code): 5 for code in range(0x20)}
+_JSON_ESCAPE_EXTRA_LENGTH.update(
+    {character: 1 for character in '"\\\b\f\n\r\t'})
+
+
+def to_json_bytes(obj) -> bytes:
+    """Encodes an object as compact UTF-8 JSON with the fastest available
+    encoder, which is chosen and imported on first use
+
+    :param obj: A JSON-serializable object
+
+    :return: The encoded object
+
+    :raises: TypeError
+    """
+
+    global _encode
+
+    if _encode is None:
+        _encode = _select_encoder()
+
+    return _encode(obj)
+
+
+def encoded_size(obj) -> int:
+    """Computes the length in bytes of an object's compact JSON encoding
+
+    The object is walked rather than serialized, so no intermediate string is
+    built. Objects with their own ``encoded_size`` method, like cards and
+    response builders, report their own size.
+
+    :param obj: A JSON-serializable object
+
+    :return: Length of ``to_json_bytes(obj)``
+
+    :raises: TypeError
+    """
+
+    if isinstance(obj, str):
+        return _encoded_string_size(obj)
+    if obj is None or obj is True:
+        return 4
+    if obj is False:
+        return 5
+    if isinstance(obj, int):
+        return len(str(obj))
+    if isinstance(obj, float):
+        # Encoders format floats differently, such as orjson writing 1e16
+        # and null where the standard library writes 1e+16 and NaN, so floats
+        # are measured by the encoder in use
+        return len(to_json_bytes(obj))
+    if isinstance(obj, collections.abc.Mapping):
+        return 1 + max(len(obj), 1) + sum(
+            _encoded_string_size(key) + 1 + encoded_size(value)
+            for key, value in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return 1 + max(len(obj), 1) + sum(encoded_size(item) for item in obj)
+    if hasattr(obj, 'encoded_size'):
+        return obj.encoded_size()
+
+    raise TypeError('Object of type {type} is not JSON serializable'.format(
+        type=type(obj).__name__))
+
+
+def _encoded_string_size(text: str) -> int:
+    """Computes the length in bytes of a JSON-encoded string, quotes included
+
+    :param text: String to measure
+
+    :return: Encoded length in bytes
+    """
+
+    if text.isascii():
+        size = len(text) + 2
+    else:
+        size = len(text.encode('utf-8')) + 2
+
+    # Control characters aren't printable, so this only scans strings that
+    # might need escaping
+    if '"' in text or '\\' in text or not text.isprintable():
+        size += sum(_JSON_ESCAPE_EXTRA_LENGTH.get(character, 0) for character in text)
+
+    return size
+
 
 def build_response(
         response_type: str, response_text: str, session_attributes: dict=None,
@@ -14,7 +164,9 @@ def build_response(
     :param response_type: Using the module attributes, specify whether the
                           response is plain text to be read or speech markup
     :param response_text: The actual response for Alexa to speak
-    :param session_attributes: Key/value pairs to store in the user's session
+    :param session_attributes: Key/value pairs to store in the user's session,
+                               such as the session's own
+                               :attr:`attributes <alexa.session.Session.attributes>`
     :param should_end_session:
         Should Alexa listen for a response, or is the conversation over
 
@@ -24,24 +176,435 @@ def build_response(
     response = {
         'version': '1.0',
         'response': {
-            'outputSpeech': {
-                'type': response_type,
-            },
+            'outputSpeech': _output_speech(response_type, response_text),
             'shouldEndSession': should_end_session,
         },
     }
 
-    if response_type == SSML:
-        response['response']['outputSpeech']['ssml'] = response_text
-    else:
-        response['response']['outputSpeech']['text'] = response_text
-
     if session_attributes:
-        response['session_attributes'] = session_attributes
+        response['sessionAttributes'] = _plain_session_attributes(session_attributes)
 
     return response
 
 
+def _output_speech(response_type: str, response_text: str) -> dict:
+    """Builds an 'outputSpeech' object from the skeleton for its type
+
+    :param response_type: PLAIN_TEXT or SSML
+    :param response_text: The actual response for Alexa to speak
+
+    :return: An 'outputSpeech' object
+    """
+
+    output_type, text_key = _OUTPUT_SPEECH_SKELETONS[response_type]
+
+    return {'type': output_type, text_key: response_text}
+
+
+# Start of every encoded response, up to the value of 'shouldEndSession'
+_RESPONSE_PREFIX = b'{"version":"1.0","response":{"shouldEndSession":'
+
+
+class ResponseBuilder:
+
+    def __init__(
+            self, response_type: str=PLAIN_TEXT, response_text: str=None,
+            should_end_session: bool=True):
+        """Incrementally assembles an Alexa skill response
+
+        Each part of the response is built once when it's set and shared by
+        every response built afterwards, rather than copied. Responses that
+        never change, like help or goodbye messages, can be built once at
+        import time and frozen::
+
+          >>> GOODBYE = ResponseBuilder(PLAIN_TEXT, 'Goodbye!').freeze()
+          >>> GOODBYE.build() is GOODBYE.build()
+          True
+
+        :param response_type: Using the module attributes, specify whether the
+                              response is plain text to be read or speech
+                              markup
+        :param response_text: Optional response for Alexa to speak
+        :param should_end_session:
+            Should Alexa listen for a response, or is the conversation over
+        """
+
+        self._output_speech = None
+        self._reprompt = None
+        self._card = None
+        self._directives = []
+        self._session_attributes = None
+        self._should_end_session = should_end_session
+        self._frozen = None
+        self._frozen_json = None
+        self._encoded_parts = {}
+        self._part_sizes = {}
+        self._session_attributes_size = None
+        self._budget = None
+        self._budget_session = None
+
+        if response_text is not None:
+            self.speak(response_type, response_text)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether this builder has been frozen"""
+
+        return self._frozen is not None
+
+    def _check_not_frozen(self):
+        """Guard against changing a response that's already been frozen
+
+        :raises: RuntimeError
+        """
+
+        if self._frozen is not None:
+            raise RuntimeError('Frozen responses cannot be modified')
+
+    def _invalidate(self, key: str):
+        """Forget the cached encoding and size of a part that's changed
+
+        :param key: Name of the part in the 'response' object
+        """
+
+        self._encoded_parts.pop(key, None)
+        self._part_sizes.pop(key, None)
+
+    @property
+    def output_speech(self) -> dict:
+        """The 'outputSpeech' object, or None if no speech is set"""
+
+        return self._output_speech
+
+    @property
+    def card(self) -> 'Card':
+        """The :class:`Card`, or None if no card is set"""
+
+        return self._card
+
+    @property
+    def session_attributes(self):
+        """The session attributes, or None if none are set"""
+
+        return self._session_attributes
+
+    def speak(self, response_type: str, response_text: str) -> 'ResponseBuilder':
+        """Set what Alexa says in response
+
+        :param response_type: PLAIN_TEXT or SSML
+        :param response_text: The actual response for Alexa to speak
+
+        :return: This builder, for chaining
+
+        :raises: RuntimeError
+        """
+
+        self._check_not_frozen()
+        self._output_speech = _output_speech(response_type, response_text)
+        self._invalidate('outputSpeech')
+
+        return self
+
+    def reprompt(self, response_type: str, response_text: str) -> 'ResponseBuilder':
+        """Set what Alexa says if the user doesn't answer
+
+        :param response_type: PLAIN_TEXT or SSML
+        :param response_text: The reprompt for Alexa to speak
+
+        :return: This builder, for chaining
+
+        :raises: RuntimeError
+        """
+
+        self._check_not_frozen()
+        self._reprompt = {
+            'outputSpeech': _output_speech(response_type, response_text),
+        }
+        self._invalidate('reprompt')
+
+        return self
+
+    def set_card(self, card: 'Card') -> 'ResponseBuilder':
+        """Set the card displayed in the Alexa app
+
+        :param card: Card to display
+
+        :return: This builder, for chaining
+
+        :raises: RuntimeError
+        """
+
+        self._check_not_frozen()
+        self._card = card
+        self._invalidate('card')
+
+        return self
+
+    def add_directive(self, directive: dict) -> 'ResponseBuilder':
+        """Add a directive, such as an AudioPlayer or Dialog directive
+
+        :param directive: The directive object to include as-is
+
+        :return: This builder, for chaining
+
+        :raises: RuntimeError
+        """
+
+        self._check_not_frozen()
+        self._directives.append(directive)
+        self._invalidate('directives')
+
+        return self
+
+    def set_session_attributes(self, session_attributes: dict) -> 'ResponseBuilder':
+        """Set key/value pairs to store in the user's session
+
+        :param session_attributes: Session attributes. The session's own
+            :attr:`attributes <alexa.session.Session.attributes>` are read
+            when the response is built, so later changes to them are sent too.
+
+        :return: This builder, for chaining
+
+        :raises: RuntimeError
+        """
+
+        self._check_not_frozen()
+        self._session_attributes = session_attributes
+        self._session_attributes_size = None
+
+        return self
+
+    def set_budget(self, budget, alexa_session=None) -> 'ResponseBuilder':
+        """Keep the response within a size budget
+
+        The budget is applied each time the response is built or encoded,
+        changing the response as needed to fit.
+
+        :param budget: A :class:`ResponseBudget <alexa.budget.ResponseBudget>`
+        :param alexa_session: The request's
+            :class:`Session <alexa.session.Session>`, for strategies that
+            need it
+
+        :return: This builder, for chaining
+
+        :raises: RuntimeError
+        """
+
+        self._check_not_frozen()
+        self._budget = budget
+        self._budget_session = alexa_session
+
+        return self
+
+    def set_should_end_session(self, should_end_session: bool) -> 'ResponseBuilder':
+        """Set whether Alexa should listen for a response
+
+        :param should_end_session:
+            Should Alexa listen for a response, or is the conversation over
+
+        :return: This builder, for chaining
+
+        :raises: RuntimeError
+        """
+
+        self._check_not_frozen()
+        self._should_end_session = should_end_session
+
+        return self
+
+    def build(self) -> dict:
+        """Build the response
+
+        Frozen builders return the same dict every time, so callers must not
+        modify it.
+
+        :return: An Alexa skill response
+        """
+
+        if self._frozen is not None:
+            return self._frozen
+        if self._budget is not None:
+            self._budget.fit(self, self._budget_session)
+
+        response = {'shouldEndSession': self._should_end_session}
+        if self._output_speech is not None:
+            response['outputSpeech'] = self._output_speech
+        if self._reprompt is not None:
+            response['reprompt'] = self._reprompt
+        if self._card is not None:
+            response['card'] = self._card.render()
+        if self._directives:
+            response['directives'] = list(self._directives)
+
+        output = {
+            'version': '1.0',
+            'response': response,
+        }
+        if self._session_attributes:
+            output['sessionAttributes'] = _plain_session_attributes(self._session_attributes)
+
+        return output
+
+    def freeze(self) -> 'ResponseBuilder':
+        """Build the response once and reuse it for every later build
+
+        :return: This builder, for chaining
+        """
+
+        if self._frozen is None:
+            self._frozen = self.build()
+
+        return self
+
+    def _response_parts(self) -> list:
+        """List the optional parts of the 'response' object in build order
+
+        :return: List of (key, value) pairs for each part that's set
+        """
+
+        parts = []
+        for key, value in [
+            ('outputSpeech', self._output_speech),
+            ('reprompt', self._reprompt),
+            ('card', self._card),
+            ('directives', self._directives),
+        ]:
+            if value:
+                parts.append((key, value))
+
+        return parts
+
+    def _encoded_part(self, key: str, value) -> bytes:
+        """Encode one part of the response, reusing earlier encodings
+
+        :param key: Name of the part in the 'response' object
+        :param value: The part's value
+
+        :return: The part's JSON encoding
+        """
+
+        # Only shared cards keep their encoding; other cards may have been
+        # modified since they were set, so they're encoded every time
+        if isinstance(value, Card):
+            return value.to_json_bytes()
+
+        try:
+            return self._encoded_parts[key]
+        except KeyError:
+            pass
+
+        encoded = self._encoded_parts[key] = to_json_bytes(value)
+
+        return encoded
+
+    def to_json_bytes(self) -> bytes:
+        """Encode the response as compact UTF-8 JSON
+
+        The encoding is assembled from each part's cached encoding, so
+        unchanged speech and directives are only encoded once, as are
+        :meth:`shared <Card.shared>` cards. Frozen builders encode the whole
+        response only once.
+
+        :return: The same bytes as ``to_json_bytes(self.build())``
+        """
+
+        if self._frozen_json is not None:
+            return self._frozen_json
+        if self._budget is not None and self._frozen is None:
+            self._budget.fit(self, self._budget_session)
+
+        encoded = [
+            _RESPONSE_PREFIX,
+            b'true' if self._should_end_session else b'false',
+        ]
+        for key, value in self._response_parts():
+            encoded.extend([b',"', key.encode(), b'":', self._encoded_part(key, value)])
+        encoded.append(b'}')
+        if self._session_attributes:
+            encoded.extend([
+                b',"sessionAttributes":',
+                to_json_bytes(_plain_session_attributes(self._session_attributes))])
+        encoded.append(b'}')
+        encoded = b''.join(encoded)
+
+        if self._frozen is not None:
+            self._frozen_json = encoded
+
+        return encoded
+
+    def encoded_size(self) -> int:
+        """Compute the length of :meth:`to_json_bytes` without encoding the
+        whole response, for checking against Alexa's payload limits
+
+        Each part's size is kept until the part changes, so checking again
+        after a change only measures what changed.
+
+        :return: Encoded length in bytes
+        """
+
+        if self._frozen_json is not None:
+            return len(self._frozen_json)
+
+        size = len(_RESPONSE_PREFIX) + (4 if self._should_end_session else 5) + 2
+        for key, value in self._response_parts():
+            if isinstance(value, Card):
+                part_size = value.encoded_size()
+            else:
+                part_size = self._part_sizes.get(key)
+                if part_size is None:
+                    encoded = self._encoded_parts.get(key)
+                    part_size = self._part_sizes[key] = (
+                        len(encoded) if encoded is not None else encoded_size(value))
+            size += len(key) + 4 + part_size
+        if self._session_attributes:
+            size += len(b',"sessionAttributes":') + self._measure_session_attributes()
+
+        return size
+
+    def _measure_session_attributes(self) -> int:
+        """Compute the encoded size of the session attributes
+
+        Unchanged :class:`SessionAttributes <alexa.session.SessionAttributes>`
+        are the request's own dict, which is never modified, so its size is
+        kept. Other attributes can change at any time and are measured on
+        every call.
+
+        :return: Encoded length in bytes
+        """
+
+        attributes = _plain_session_attributes(self._session_attributes)
+        if (self._session_attributes_size is not None
+                and self._session_attributes_size[0] is attributes):
+            return self._session_attributes_size[1]
+
+        size = encoded_size(attributes)
+        if attributes is not self._session_attributes:
+            self._session_attributes_size = (attributes, size)
+
+        return size
+
+
+@functools.lru_cache(maxsize=_IMAGE_URL_CACHE_SIZE)
+def _image_url_error(url: str) -> str:
+    """Check an image URL, caching the outcome for URL's seen before
+
+    :param url: URL to be checked
+
+    :return: Description of the problem with the URL, or None if it's valid
+    """
+
+    import urllib.parse
+
+    parsed_url = urllib.parse.urlparse(url)
+    if parsed_url.scheme != 'https' or '.' not in parsed_url.netloc:
+        return 'Invalid image URL; received: {url}'.format(url=url)
+
+    if not url.lower().endswith(_IMAGE_EXTENSIONS):
+        return 'Only JPEG and PNG image types are supported for cards'
+
+    return None
+
+
 class Card:
 
     MAX_CARD_LENGTH = _MAX_CARD_LENGTH
@@ -53,6 +616,9 @@ class Card:
         displayed above. Supported image formats are JPEG and PNG, with a max
         file size of 2 MB. Per Amazon docs, images must be loaded over SSL.
 
+        Cards built often from the same inputs can be shared with
+        :meth:`shared`, which validates and renders them only once.
+
         :param text: Formatted text content to display for standard card types
         :param title: Optional title of the card displayed in the Alexa app
         :param small_image:
@@ -62,63 +628,52 @@ class Card:
             URL of an image to display on large-format devices;
             Amazon-recommended size is 1200x800
 
-        :raises: ValueError
+        :raises: TypeError, ValueError
         """
 
-        try:
-            self._check_attribute_types(text, title, small_image, large_image)
-        except TypeError:
-            raise
-        try:
-            self._check_card_length(text, title, small_image, large_image)
-        except ValueError:
-            raise
+        self._validate(text, title, small_image, large_image)
 
         self.text = text
         if title:
             self.title = title
+        if small_image:
+            self.small_image = small_image
+        if large_image:
+            self.large_image = large_image
 
-        try:
-            if small_image:
-                self._check_image_url(small_image)
-                self.small_image = small_image
-            if large_image:
-                self._check_image_url(large_image)
-                self.large_image = large_image
-        except ValueError:
-            raise
+    @classmethod
+    @functools.lru_cache(maxsize=_SHARED_CARD_CACHE_SIZE)
+    def shared(
+            cls, text: str, title: str=None, small_image: str=None,
+            large_image: str=None) -> 'Card':
+        """Return a Card shared by every caller passing the same inputs
 
-    @staticmethod
-    def _check_attribute_types(
-            text: str, title: str, small_image: str, large_image: str):
-        """Verify all Card initialization parameters are of the correct types.
+        Shared cards are validated, rendered and encoded once, and keep those
+        forms, so they must not be modified.
 
-        :param text: Card's text
-        :param title: Card's title, if any
-        :param small_image: Card's small image URL, if any
-        :param large_image: Card's large image URL, if any
+        :param text: Formatted text content to display for standard card types
+        :param title: Optional title of the card displayed in the Alexa app
+        :param small_image: URL of an image to display on small-format devices
+        :param large_image: URL of an image to display on large-format devices
 
-        :raises: TypeError
+        :return: A validated Card
+
+        :raises: TypeError, ValueError
         """
 
-        text_is_not_str = type(text) != str
-        title_is_not_str = title is not None and type(title) != str
-        small_image_is_not_str = (
-             small_image is not None and type(small_image) != str)
-        large_image_is_not_str = (
-            large_image is not None and type(large_image) != str)
+        card = cls(text, title, small_image, large_image)
+        card._rendered = card.render()
+        card._json_bytes = to_json_bytes(card._rendered)
 
-        if (text_is_not_str or title_is_not_str or small_image_is_not_str
-                or large_image_is_not_str):
-            raise TypeError('Cards can only be built from strings')
+        return card
 
     @classmethod
-    def _check_card_length(
+    def _validate(
             cls, text: str, title: str, small_image: str, large_image: str):
-        """Verify total length of all card text is less than the allowed max.
+        """Verify all Card initialization parameters in a single pass.
 
-        The Alexa API limits the combined length of all text fields and URL's
-        on a single card, see
+        Every parameter must be a string, and the combined length of all text
+        fields and URL's on a single card is limited by the Alexa API, see
         https://developer.amazon.com/public/solutions/alexa/alexa-skills-kit/docs/alexa-skills-kit-interface-reference#response-format
 
         :param text: Card's text
@@ -126,53 +681,83 @@ class Card:
         :param small_image: Card's small image URL, if any
         :param large_image: Card's large image URL, if any
 
-        :raises: ValueError
+        :raises: TypeError, ValueError
         """
 
+        if type(text) != str:
+            raise TypeError('Cards can only be built from strings')
+
         total_length = len(text)
-        if title:
-            total_length += len(title)
-        if small_image:
-            total_length += len(small_image)
-        if large_image:
-            total_length += len(large_image)
+        for value in (title, small_image, large_image):
+            if value is None:
+                continue
+            if type(value) != str:
+                raise TypeError('Cards can only be built from strings')
+            total_length += len(value)
 
         if total_length > cls.MAX_CARD_LENGTH:
             raise ValueError(
                 'Total length of all card items cannot exceed {max_length} characters.'.format(
                     max_length=cls.MAX_CARD_LENGTH))
 
+        if small_image:
+            cls._check_image_url(small_image)
+        if large_image:
+            cls._check_image_url(large_image)
+
     @staticmethod
     def _check_image_url(url: str):
         """Verify an image URL meets the requirements of the Alexa app.
 
         Specifically, the scheme must be 'https', URL's must be absolute, and
-        only JPEG and PNG images are supported.
+        only JPEG and PNG images are supported. Results are cached, since
+        skills tend to reuse the same few images.
 
         :param url: URL to be checked
 
         :raises: ValueError
         """
 
-        parsed_url = urllib.parse.urlparse(url)
+        error = _image_url_error(url)
+        if error is not None:
+            raise ValueError(error)
+
+    def to_json_bytes(self) -> bytes:
+        """Encode this Card as compact UTF-8 JSON
+
+        Only :meth:`shared` cards keep their encoding; other cards may be
+        modified, so they're encoded again on every call.
 
-        bad_netloc = parsed_url.netloc == '' or '.' not in parsed_url.netloc
-        bad_scheme = parsed_url.scheme == '' or parsed_url.scheme != 'https'
-        if bad_scheme or bad_netloc:
-            raise ValueError('Invalid image URL; received: {url}'.format(url=url))
+        :return: JSON encoding of :meth:`render`
+        """
+
+        try:
+            return self._json_bytes
+        except AttributeError:
+            return to_json_bytes(self.render())
 
-        not_a_jpeg = not url.lower().endswith('.jpeg')
-        not_a_jpg = not url.lower().endswith('.jpg')
-        not_a_png = not url.lower().endswith('.png')
-        if not_a_jpeg and not_a_jpg and not_a_png:
-            raise ValueError('Only JPEG and PNG image types are supported for cards')
+    def encoded_size(self) -> int:
+        """Length in bytes of :meth:`to_json_bytes`
+
+        :return: Encoded length in bytes
+        """
+
+        return len(self.to_json_bytes())
 
     def render(self) -> dict:
         """Return properly-structured object for use in a Response
 
+        :meth:`shared` cards return the same object on every call, so it must
+        not be modified.
+
         :return: dict representation of this Card instance
         """
 
+        try:
+            return self._rendered
+        except AttributeError:
+            pass
+
         if hasattr(self, 'small_image') or hasattr(self, 'large_image'):
             output = {
                 'image': {},
@@ -190,6 +775,6 @@ class Card:
         if hasattr(self, 'small_image'):
             output['image']['smallImageUrl'] = self.small_image
         if hasattr(self, 'large_image'):
-            output['image']['smallImageUrl'] = self.large_image
+            output['image']['largeImageUrl'] = self.large_image
 
         return output
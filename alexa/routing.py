@@ -0,0 +1,272 @@
+"""Declarative routing of requests to handlers.
+
+Handlers register the conditions they handle instead of branching on the
+request themselves::
+
+  router = alexa.routing.Router(fallback=alexa.dispatch.IntentRegistry.discover('intents'))
+
+  @router.route('OrderPizza', dialog_state='STARTED')
+  def start_order(alexa_session, alexa_user, alexa_request, alexa_context):
+      ...
+
+  @router.route('OrderPizza', dialog_state='COMPLETED', confirmation_status='CONFIRMED',
+                filled=['Size', 'Topping'])
+  def place_order(alexa_session, alexa_user, alexa_request, alexa_context):
+      ...
+
+A :class:`Router` can be passed to :func:`lambda_handler.lambda_handler` in
+place of an :class:`IntentRegistry <alexa.dispatch.IntentRegistry>`.
+"""
+
+#: Values of ``IntentRequest.dialog_state``.
+DIALOG_STATES = frozenset(['STARTED', 'IN_PROGRESS', 'COMPLETED'])
+
+#: Values of ``confirmation_status`` on intents and slots.
+CONFIRMATION_STATUSES = frozenset(['NONE', 'CONFIRMED', 'DENIED'])
+
+
+class Rule:
+    """A handler and the conditions a request must meet to be routed to it.
+
+    Conditions left as None match any value.
+    """
+
+    __slots__ = (
+        'handler', 'name', 'dialog_state', 'confirmation_status', 'filled',
+        'missing', 'slot_confirmations')
+
+    def __init__(
+            self, handler, name: str, dialog_state: str=None,
+            confirmation_status: str=None, filled=(), missing=(),
+            slot_confirmations: dict=None):
+        """
+        :param handler: Handler function
+        :param name: Intent name, or request type such as ``LaunchRequest``
+        :param dialog_state: Required dialog state
+        :param confirmation_status: Required confirmation status of the intent
+        :param filled: Names of slots that must have a value
+        :param missing: Names of slots that must not have a value
+        :param slot_confirmations: dict of slot name to its required
+            confirmation status
+
+        :raises: ValueError
+        """
+
+        slot_confirmations = dict(slot_confirmations or {})
+
+        if dialog_state is not None and dialog_state not in DIALOG_STATES:
+            raise ValueError('Unknown dialog state: {state}'.format(state=dialog_state))
+        for status in [confirmation_status] + list(slot_confirmations.values()):
+            if status is not None and status not in CONFIRMATION_STATUSES:
+                raise ValueError('Unknown confirmation status: {status}'.format(status=status))
+        if set(filled) & set(missing):
+            raise ValueError('Slots cannot be both filled and missing: {slots}'.format(
+                slots=', '.join(sorted(set(filled) & set(missing)))))
+
+        self.handler = handler
+        self.name = name
+        self.dialog_state = dialog_state
+        self.confirmation_status = confirmation_status
+        self.filled = frozenset(filled)
+        self.missing = frozenset(missing)
+        self.slot_confirmations = slot_confirmations
+
+    @property
+    def slot_names(self) -> frozenset:
+        """Names of every slot the rule has a condition on"""
+
+        return self.filled | self.missing | self.slot_confirmations.keys()
+
+    @property
+    def specificity(self) -> int:
+        """Number of conditions; more specific rules are tried first"""
+
+        return (
+            (self.dialog_state is not None) + (self.confirmation_status is not None)
+            + len(self.filled) + len(self.missing) + len(self.slot_confirmations))
+
+    def matches(self, dialog_state: str, confirmation_status: str, slot_states: dict) -> bool:
+        """Check a request's state against this rule's conditions.
+
+        :param dialog_state: The request's dialog state, or None
+        :param confirmation_status: The intent's confirmation status, or None
+        :param slot_states: dict of slot name to a tuple of whether it's
+            filled and its confirmation status
+
+        :return: Whether the rule applies
+        """
+
+        if self.dialog_state is not None and self.dialog_state != dialog_state:
+            return False
+        if (self.confirmation_status is not None
+                and self.confirmation_status != confirmation_status):
+            return False
+        for name in self.filled:
+            if not slot_states[name][0]:
+                return False
+        for name in self.missing:
+            if slot_states[name][0]:
+                return False
+        for name, status in self.slot_confirmations.items():
+            if slot_states[name][1] != status:
+                return False
+
+        return True
+
+
+class _RuleTable:
+    """The compiled rules for one intent name or request type.
+
+    A request's state is reduced to a key of its dialog state, confirmation
+    status, and the filled state and confirmation status of just the slots
+    the rules mention. Each key is decided once by trying the rules in
+    order, then answered from :attr:`decisions`.
+    """
+
+    __slots__ = ('rules', 'slot_names', 'decisions')
+
+    def __init__(self, rules: list):
+        self.rules = sorted(rules, key=lambda rule: -rule.specificity)
+        self.slot_names = tuple(sorted(frozenset().union(
+            *(rule.slot_names for rule in rules))))
+        self.decisions = {}
+
+    def decide(self, key: tuple):
+        dialog_state, confirmation_status, slot_key = key
+        slot_states = dict(zip(self.slot_names, slot_key))
+
+        for rule in self.rules:
+            if rule.matches(dialog_state, confirmation_status, slot_states):
+                return rule.handler
+
+        return None
+
+
+class Router:
+    """Routes requests to handlers by rules over the intent name, dialog
+    state, slot presence and confirmation status.
+
+    Rules are compiled into one table per intent name on first use, and each
+    distinct request state is decided only once. Routing a request then
+    costs a few dict lookups, however many rules are registered. When
+    several rules match, the one with the most conditions wins, then the one
+    registered first.
+    """
+
+    def __init__(self, fallback=None):
+        """
+        :param fallback: Optional handler for requests no rule matches, or an
+            object with a ``resolve`` method, such as an
+            :class:`IntentRegistry <alexa.dispatch.IntentRegistry>`, to
+            resolve them instead
+        """
+
+        self._rules = []
+        self._tables = None
+
+        if fallback is None:
+            import alexa.dispatch
+
+            fallback = alexa.dispatch.IntentRegistry()
+
+        #: Handler, or resolver, for requests no rule matches.
+        self.fallback = fallback
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def add_rule(self, handler, name: str, **conditions) -> Rule:
+        """Register a handler for requests meeting some conditions.
+
+        :param handler: Handler function
+        :param name: Intent name, or request type such as ``LaunchRequest``
+        :param conditions: Conditions accepted by :class:`Rule`
+
+        :return: The new :class:`Rule`
+
+        :raises: ValueError
+        """
+
+        rule = Rule(handler, name, **conditions)
+        self._rules.append(rule)
+        self._tables = None
+
+        return rule
+
+    def route(self, name: str, **conditions):
+        """Decorator form of :meth:`add_rule`.
+
+        :param name: Intent name, or request type such as ``LaunchRequest``
+        :param conditions: Conditions accepted by :class:`Rule`
+
+        :return: Decorator registering the handler it's applied to
+        """
+
+        def decorator(handler):
+            self.add_rule(handler, name, **conditions)
+
+            return handler
+
+        return decorator
+
+    def compile(self) -> dict:
+        """Compile the registered rules into lookup tables.
+
+        This happens automatically on the first request after a rule is
+        added, but can be done ahead of time during a cold start.
+
+        :return: dict of intent name or request type to its table
+        """
+
+        rules_by_name = {}
+        for rule in self._rules:
+            rules_by_name.setdefault(rule.name, []).append(rule)
+
+        self._tables = {
+            name: _RuleTable(rules) for name, rules in rules_by_name.items()}
+
+        return self._tables
+
+    def resolve(self, alexa_request):
+        """Find the handler for a parsed request.
+
+        :param alexa_request: A parsed :class:`Request <alexa.request.Request>`
+
+        :return: The handler function to call
+        """
+
+        tables = self._tables
+        if tables is None:
+            tables = self.compile()
+
+        intent = getattr(alexa_request, 'intent', None)
+        table = tables.get(alexa_request.request_type if intent is None else intent.name)
+
+        handler = None
+        if table is not None:
+            if intent is None:
+                key = (None, None, ())
+            else:
+                slot_key = ()
+                if table.slot_names:
+                    slots = intent.slots
+                    slot_key = tuple(
+                        (False, None) if slots.get(name) is None
+                        else (bool(slots[name].value), slots[name].confirmation_status)
+                        for name in table.slot_names)
+                key = (
+                    getattr(alexa_request, 'dialog_state', None),
+                    intent.confirmation_status,
+                    slot_key)
+
+            try:
+                handler = table.decisions[key]
+            except KeyError:
+                handler = table.decisions[key] = table.decide(key)
+
+        if handler is not None:
+            return handler
+        if hasattr(self.fallback, 'resolve'):
+            return self.fallback.resolve(alexa_request)
+
+        return self.fallback
@@ -1,3 +1,5 @@
+import collections.abc
+import functools
 
 
 class Session(object):
@@ -23,17 +25,27 @@ class Session(object):
 
     For more information, see `the Alexa Skills Kit docs <https://developer.amazon.com/public/solutions/alexa/alexa-skills-kit/docs/alexa-skills-kit-interface-reference#session-object>`_.
 
-    In addition to the default attributes listed below, any attributes saved to
-    the user's session will be created as attributes directly on the
-    :class:`Session <alexa.session.Session>` instance.
+    Attributes saved to the user's session are available from
+    :attr:`attributes`, a :class:`SessionAttributes
+    <alexa.session.SessionAttributes>` mapping that tracks changes made by the
+    skill. They can also be read as attributes of the
+    :class:`Session <alexa.session.Session>` instance, as long as their names
+    don't clash with the default attributes listed below.
+
+    Pass ``lazy=True`` to defer building the
+    :class:`Application <alexa.session.Application>` and
+    :class:`User <alexa.session.User>` until they're first accessed.
     """
 
-    def __init__(self, session_data: dict):
+    def __init__(self, session_data: dict, lazy: bool=False):
         """
         :param session_data: The ``session`` object from the request sent by
             the Alexa service.
+        :param lazy: Build child objects on first access instead of up front
         """
 
+        self._session_data = session_data
+
         if session_data['new']:
             #: :class:`bool` indicating if this is a request in an ongoing
             #: dialog, or the first request of a new conversation.
@@ -44,17 +56,151 @@ class Session(object):
         #: The session ID as a :class:`str`.
         self.session_id = session_data['sessionId']
 
-        #: Am :class:`Application <alexa.session.Application>` representing the
-        #: Alexa skill application.
-        self.application = Application(session_data['application'])
+        #: Session attributes as a :class:`SessionAttributes
+        #: <alexa.session.SessionAttributes>`.
+        self.attributes = SessionAttributes(session_data.get('attributes'))
+
+        if lazy:
+            return
+
+        self.application
+        self.user
+
+    def __getattr__(self, name: str):
+        # Only reached when normal lookup fails, so session attributes can
+        # never shadow the real fields above
+        attributes = self.__dict__.get('attributes')
+        if attributes is not None and name in attributes:
+            return attributes[name]
+
+        raise AttributeError(
+            "'Session' object has no attribute '{name}'".format(name=name))
+
+    @functools.cached_property
+    def application(self) -> 'Application':
+        """An :class:`Application <alexa.session.Application>` representing
+        the Alexa skill application.
+        """
+
+        return Application(self._session_data['application'])
+
+    @functools.cached_property
+    def user(self) -> 'User':
+        """Represents the Echo user as a :class:`User <alexa.session.User>`."""
+
+        return User(self._session_data['user'])
+
+
+class SessionAttributes(collections.abc.MutableMapping):
+    """The ``attributes`` of a session, with copy-on-write change tracking.
+
+    The dict from the request is wrapped rather than copied, and is never
+    modified. Writes and deletions are kept separately, so the keys a skill
+    changed are known when the response is built::
+
+      >>> alexa_session.attributes['visits'] = alexa_session.attributes.get('visits', 0) + 1
+      >>> alexa_session.attributes.delta()
+      {'visits': 3}
+
+    Changes made inside a mutable value, like appending to a stored list,
+    aren't seen; assign the value back to its key to record them.
+    """
+
+    __slots__ = ('_original', '_changes', '_deleted')
+
+    def __init__(self, attributes: dict=None):
+        """
+        :param attributes: The ``attributes`` object from the request's
+            ``session``, if it has one
+        """
+
+        self._original = {} if attributes is None else attributes
+        self._changes = {}
+        self._deleted = set()
+
+    def __getitem__(self, key: str):
+        if key in self._changes:
+            return self._changes[key]
+        if key in self._deleted:
+            raise KeyError(key)
+
+        return self._original[key]
+
+    def __setitem__(self, key: str, value):
+        self._changes[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+
+        self._changes.pop(key, None)
+        if key in self._original:
+            self._deleted.add(key)
 
-        #: Represents the Echo user as a :class:`User <alexa.session.User>`.
-        self.user = User(session_data['user'])
+    def __contains__(self, key) -> bool:
+        if key in self._changes:
+            return True
 
-        # Set session attributes directly on the instance for ease of access
-        if 'attributes' in session_data:
-            for attribute, value in session_data['attributes'].items():
-                setattr(self, attribute, value)
+        return key in self._original and key not in self._deleted
+
+    def __iter__(self):
+        for key in self._original:
+            if key not in self._deleted and key not in self._changes:
+                yield key
+        yield from self._changes
+
+    def __len__(self) -> int:
+        added = sum(1 for key in self._changes if key not in self._original)
+
+        return len(self._original) - len(self._deleted) + added
+
+    def __repr__(self) -> str:
+        return 'SessionAttributes({attributes!r})'.format(attributes=self.to_dict())
+
+    @property
+    def modified(self) -> bool:
+        """Whether any attribute has been set or deleted"""
+
+        return bool(self._changes or self._deleted)
+
+    @property
+    def dirty(self) -> frozenset:
+        """Keys that have been set or deleted"""
+
+        return frozenset(self._changes).union(self._deleted)
+
+    @property
+    def deleted(self) -> frozenset:
+        """Keys from the request that have been deleted"""
+
+        return frozenset(self._deleted)
+
+    def delta(self) -> dict:
+        """Attributes set since the session was parsed.
+
+        :return: dict of each set key to its new value; deleted keys are
+            listed by :attr:`deleted`
+        """
+
+        return dict(self._changes)
+
+    def to_dict(self) -> dict:
+        """The attributes to send back in the response.
+
+        :return: The request's own dict if nothing changed, otherwise a new
+            dict sharing every unchanged value
+        """
+
+        if not self.modified:
+            return self._original
+
+        attributes = {
+            key: value for key, value in self._original.items()
+            if key not in self._deleted}
+        attributes.update(self._changes)
+
+        return attributes
 
 
 class Application(object):
@@ -106,8 +252,16 @@ class User(object):
           "accessToken": "<token>"
       }
 
+    When a :class:`ProfileCache <alexa.profile.ProfileCache>` is attached,
+    the user's profile starts loading in the background as soon as the
+    ``user`` object is parsed, and is read from :attr:`profile`.
     """
 
+    #: :class:`ProfileCache <alexa.profile.ProfileCache>` prefetching each
+    #: user's profile, set by :meth:`ProfileCache.attach
+    #: <alexa.profile.ProfileCache.attach>`.
+    profile_cache = None
+
     def __init__(self, user_data: dict):
         """
         :param user_data: The ``user`` object from the request sent by the
@@ -136,3 +290,20 @@ class User(object):
             #: `the Alexa Skills Kit documentation <https://developer.amazon.com/public/solutions/alexa/alexa-skills-kit/docs/linking-an-alexa-user-with-a-user-in-your-system>`_
             #: for direction on setting up service integration.
             self.access_token = user_data['accessToken']
+
+        if self.profile_cache is not None:
+            self.profile_cache.prefetch(self)
+
+    @property
+    def profile(self):
+        """The user's profile from the attached :class:`ProfileCache
+        <alexa.profile.ProfileCache>`, waiting for it if it's still loading;
+        None if the user has no profile.
+
+        :raises: RuntimeError
+        """
+
+        if self.profile_cache is None:
+            raise RuntimeError('No profile cache is attached to alexa.session.User')
+
+        return self.profile_cache.get(self)
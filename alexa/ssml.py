@@ -0,0 +1,352 @@
+"""Compose and validate Speech Synthesis Markup Language.
+
+:class:`Speech` builds SSML from text and markup, escaping text as it's
+added and joining everything once when the markup is requested::
+
+  speech = (
+      alexa.ssml.Speech()
+      .say('Your order total is')
+      .say_as('12.50', 'unit')
+      .pause(300)
+      .emphasis('Thank you!', level='strong'))
+
+  builder.speak(alexa.response.SSML, speech.to_ssml())
+
+Hand-written markup can be checked with :func:`validate`, which streams
+through the tags without building a document tree. Markup that's the same on
+every invocation should go through :func:`fragment`, which validates each
+distinct string only once per process.
+"""
+import functools
+import re
+
+_FRAGMENT_CACHE_SIZE = 256
+
+#: Elements Alexa supports inside ``<speak>``.
+ALLOWED_ELEMENTS = frozenset([
+    'amazon:domain', 'amazon:effect', 'amazon:emotion', 'audio', 'break',
+    'emphasis', 'lang', 'p', 'phoneme', 'prosody', 's', 'say-as', 'speak',
+    'sub', 'voice', 'w',
+])
+
+#: Values of the ``strength`` attribute of ``<break>``.
+BREAK_STRENGTHS = frozenset(['none', 'x-weak', 'weak', 'medium', 'strong', 'x-strong'])
+
+#: Values of the ``level`` attribute of ``<emphasis>``.
+EMPHASIS_LEVELS = frozenset(['strong', 'moderate', 'reduced'])
+
+_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;',
+})
+
+_TOKENS = re.compile(r'''
+    <(?P<closing>/)?(?P<name>[A-Za-z][\w.:-]*)
+        (?P<attributes>(?:\s+[\w.:-]+\s*=\s*(?:"[^"<]*"|'[^'<]*'))*)
+        \s*(?P<empty>/)?>
+    | (?P<stray_tag><)
+    | (?P<stray_ampersand>&(?!(?:amp|lt|gt|quot|apos|\#[0-9]+|\#x[0-9A-Fa-f]+);))
+''', re.VERBOSE)
+
+
+def escape(text: str) -> str:
+    """Escape text for use in SSML, as element content or an attribute value
+
+    :param text: Text to escape
+
+    :return: The escaped text
+    """
+
+    return text.translate(_ESCAPES)
+
+
+def validate(markup: str, fragment: bool=False):
+    """Check that markup is well-formed SSML using only supported elements
+
+    Tags are checked one at a time against a stack of open elements, so no
+    document tree is built. Attribute values aren't checked.
+
+    :param markup: SSML to check
+    :param fragment: Whether the markup is a piece of speech to be placed
+        inside ``<speak>``, rather than a whole ``<speak>`` document
+
+    :raises: ValueError
+    """
+
+    open_elements = []
+    for token in _TOKENS.finditer(markup):
+        if token.group('stray_tag') is not None:
+            raise ValueError('Unescaped "<" at position {position}'.format(
+                position=token.start()))
+        if token.group('stray_ampersand') is not None:
+            raise ValueError('Unescaped "&" at position {position}'.format(
+                position=token.start()))
+
+        name = token.group('name')
+        if name not in ALLOWED_ELEMENTS:
+            raise ValueError('Unsupported SSML element <{name}> at position {position}'.format(
+                name=name, position=token.start()))
+
+        if token.group('closing'):
+            if token.group('attributes') or token.group('empty'):
+                raise ValueError('Malformed closing tag at position {position}'.format(
+                    position=token.start()))
+            if not open_elements or open_elements[-1] != name:
+                raise ValueError('Unexpected </{name}> at position {position}'.format(
+                    name=name, position=token.start()))
+            open_elements.pop()
+            if not open_elements and not fragment and token.end() != len(markup):
+                raise ValueError('Content after </speak> at position {position}'.format(
+                    position=token.end()))
+            continue
+
+        if name == 'speak':
+            if fragment or open_elements:
+                raise ValueError('<speak> can only be the outermost element')
+            if token.start() != 0:
+                raise ValueError('Content before <speak>')
+        elif not fragment and not open_elements:
+            raise ValueError('SSML must be wrapped in <speak>')
+
+        if not token.group('empty'):
+            open_elements.append(name)
+
+    if open_elements:
+        raise ValueError('Unclosed <{name}>'.format(name=open_elements[-1]))
+    if not fragment and not markup.startswith('<speak'):
+        raise ValueError('SSML must be wrapped in <speak>')
+
+
+def truncate(markup: str, max_length: int) -> str:
+    """Shorten an SSML document, keeping it well-formed
+
+    The markup is cut between words where possible, and never inside a tag
+    or character reference; elements left open by the cut are then closed.
+
+    :param markup: Valid SSML document
+    :param max_length: Most characters the result may have
+
+    :return: The markup, or as much of it as fits followed by closing tags
+
+    :raises: ValueError
+    """
+
+    if len(markup) <= max_length:
+        return markup
+
+    open_elements = []
+    best = None
+    position = 0
+    tokens = _TOKENS.finditer(markup)
+    while True:
+        token = next(tokens, None)
+        end = len(markup) if token is None else token.start()
+
+        # Text between tags can be cut anywhere that leaves room to close
+        # every open element
+        closing_length = sum(len(name) + 3 for name in open_elements)
+        cut = min(end, max_length - closing_length)
+        if open_elements and cut >= position:
+            if cut < end:
+                space = markup.rfind(' ', position, cut + 1)
+                if space > position:
+                    cut = space
+                ampersand = markup.rfind('&', position, cut)
+                if ampersand != -1 and markup.find(';', ampersand, cut) == -1:
+                    cut = ampersand
+            best = (cut, list(open_elements))
+
+        if token is None or end >= max_length:
+            break
+
+        name = token.group('name')
+        if token.group('closing'):
+            open_elements.pop()
+        elif name is not None and not token.group('empty'):
+            open_elements.append(name)
+        position = token.end()
+
+    if best is None:
+        raise ValueError('SSML cannot be shortened to {max_length} characters'.format(
+            max_length=max_length))
+
+    cut, open_elements = best
+
+    return markup[:cut] + ''.join(
+        '</{name}>'.format(name=name) for name in reversed(open_elements))
+
+
+class Fragment(str):
+    """SSML markup that has already been validated, as returned by
+    :func:`fragment`
+    """
+
+    __slots__ = ()
+
+
+@functools.lru_cache(maxsize=_FRAGMENT_CACHE_SIZE)
+def fragment(markup: str) -> Fragment:
+    """Validate a piece of SSML once, and reuse the result for every later
+    call with the same markup
+
+    :param markup: SSML to be placed inside ``<speak>``
+
+    :return: The validated markup, which :meth:`Speech.add` accepts without
+        checking again
+
+    :raises: ValueError
+    """
+
+    validate(markup, fragment=True)
+
+    return Fragment(markup)
+
+
+class Speech:
+    """Composes SSML from text and markup.
+
+    Each method adds to the end of the speech and returns the builder, so
+    calls can be chained. Parts are kept in a list and only joined by
+    :meth:`to_ssml`.
+    """
+
+    __slots__ = ('_parts', )
+
+    def __init__(self, text: str=None):
+        """
+        :param text: Optional text to start with
+        """
+
+        self._parts = ['<speak>']
+        if text:
+            self.say(text)
+
+    def __str__(self) -> str:
+        return self.to_ssml()
+
+    def say(self, text: str) -> 'Speech':
+        """Speak text; any markup characters in it are escaped
+
+        :param text: Text to speak
+
+        :return: This builder, for chaining
+        """
+
+        self._parts.append(escape(text))
+
+        return self
+
+    def pause(self, time=None, strength: str=None) -> 'Speech':
+        """Insert a ``<break>``
+
+        :param time: Length of the pause, in milliseconds or as a string
+            such as ``'1s'``
+        :param strength: Strength of the pause, from :data:`BREAK_STRENGTHS`,
+            used when no time is given
+
+        :return: This builder, for chaining
+
+        :raises: ValueError
+        """
+
+        if time is not None:
+            if isinstance(time, int):
+                time = '{time}ms'.format(time=time)
+            self._parts.append('<break time="{time}"/>'.format(time=escape(time)))
+        elif strength is not None:
+            if strength not in BREAK_STRENGTHS:
+                raise ValueError('Unknown break strength: {strength}'.format(strength=strength))
+            self._parts.append('<break strength="{strength}"/>'.format(strength=strength))
+        else:
+            self._parts.append('<break/>')
+
+        return self
+
+    def emphasis(self, text: str, level: str='moderate') -> 'Speech':
+        """Speak text with ``<emphasis>``
+
+        :param text: Text to speak
+        :param level: Level of emphasis, from :data:`EMPHASIS_LEVELS`
+
+        :return: This builder, for chaining
+
+        :raises: ValueError
+        """
+
+        if level not in EMPHASIS_LEVELS:
+            raise ValueError('Unknown emphasis level: {level}'.format(level=level))
+
+        self._parts.extend([
+            '<emphasis level="', level, '">', escape(text), '</emphasis>'])
+
+        return self
+
+    def say_as(self, text: str, interpret_as: str, format: str=None) -> 'Speech':
+        """Speak text with ``<say-as>``, such as a number read as digits
+
+        :param text: Text to speak
+        :param interpret_as: How the text is interpreted, such as
+            ``'digits'``, ``'date'`` or ``'unit'``
+        :param format: Optional format, for dates
+
+        :return: This builder, for chaining
+        """
+
+        self._parts.extend(['<say-as interpret-as="', escape(interpret_as), '"'])
+        if format is not None:
+            self._parts.extend([' format="', escape(format), '"'])
+        self._parts.extend(['>', escape(text), '</say-as>'])
+
+        return self
+
+    def audio(self, url: str) -> 'Speech':
+        """Play an audio clip
+
+        :param url: HTTPS URL of an MP3 file
+
+        :return: This builder, for chaining
+
+        :raises: ValueError
+        """
+
+        if not url.startswith('https://'):
+            raise ValueError('Audio must be served over HTTPS; received: {url}'.format(url=url))
+
+        self._parts.extend(['<audio src="', escape(url), '"/>'])
+
+        return self
+
+    def add(self, markup) -> 'Speech':
+        """Insert SSML markup, or another builder's speech
+
+        :param markup: A :class:`Fragment` or :class:`Speech`, which are
+            added as they are, or a string of markup, which is validated first
+
+        :return: This builder, for chaining
+
+        :raises: ValueError
+        """
+
+        if isinstance(markup, Speech):
+            self._parts.extend(markup._parts[1:])
+        else:
+            if not isinstance(markup, Fragment):
+                validate(markup, fragment=True)
+            self._parts.append(markup)
+
+        return self
+
+    def to_ssml(self) -> str:
+        """Join the speech into an SSML document
+
+        :return: The speech wrapped in ``<speak>``
+        """
+
+        self._parts.append('</speak>')
+        try:
+            return ''.join(self._parts)
+        finally:
+            self._parts.pop()
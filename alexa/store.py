@@ -0,0 +1,377 @@
+"""Persistent state for Alexa skills, beyond what session attributes hold.
+
+Session attributes are size-limited and lost when a session ends. A state
+store keeps per-user or per-session state in a backend, such as the bundled
+SQLite store, behind a read-through cache that survives warm invocations.
+Writes are collected during the invocation and written in a single batch
+after the response is built::
+
+  def handle_intent(alexa_session, alexa_user, alexa_request, alexa_context):
+      store = alexa.store.default_store()
+      key = alexa.store.user_key(alexa_user)
+
+      state = store.get(key)
+      state['visits'] = state.get('visits', 0) + 1
+      store.set(key, state)
+
+Session attributes can be kept past the end of a session, writing only the
+attributes that changed during the invocation::
+
+  store.save_attributes(key, alexa_session.attributes)
+
+:func:`lambda_handler.lambda_handler` flushes the default store once the
+response is built, and discards its pending changes if the invocation fails.
+Pending changes are kept per invocation, so invocations running at the same
+time on other threads don't affect each other.
+"""
+import abc
+import contextvars
+import os
+import threading
+
+import alexa.cache
+
+#: SQLite database used by :func:`default_store`. Lambda functions may only
+#: write under /tmp, which also survives warm invocations.
+DEFAULT_DATABASE = os.environ.get('ALEXA_STATE_DATABASE', '/tmp/alexa-state.sqlite3')
+
+
+def user_key(alexa_user) -> str:
+    """Key for state that follows a user across sessions.
+
+    :param alexa_user: A :class:`User <alexa.session.User>`
+
+    :return: Store key
+    """
+
+    return 'user:' + alexa_user.user_id
+
+
+def session_key(alexa_session) -> str:
+    """Key for state that lasts as long as a session.
+
+    :param alexa_session: A :class:`Session <alexa.session.Session>`
+
+    :return: Store key
+    """
+
+    return 'session:' + alexa_session.session_id
+
+
+# Cached or pending in place of the state of a key that has none
+_DELETED = object()
+
+
+class StateStore(abc.ABC):
+    """Interface for state store backends.
+
+    Values are JSON-serializable dicts keyed by strings.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> dict:
+        """Read a key's state.
+
+        :param key: Store key
+
+        :return: The stored state, or None if there isn't any
+        """
+
+    @abc.abstractmethod
+    def put_many(self, items: dict):
+        """Write several keys' state in one batch.
+
+        :param items: dict of store key to state
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        """Remove a key's state.
+
+        :param key: Store key
+        """
+
+
+class SQLiteStateStore(StateStore):
+    """State store backed by a local SQLite database.
+
+    Connections are shared by every store using the same database file, so
+    they're opened once per process and reused across warm invocations.
+    """
+
+    _connections = {}
+    _connections_lock = threading.Lock()
+
+    def __init__(self, database: str=DEFAULT_DATABASE, table: str='state'):
+        """
+        :param database: Path of the database file, or ``:memory:``
+        :param table: Table the state is kept in
+        """
+
+        if not table.isidentifier():
+            raise ValueError('Invalid table name: {table}'.format(table=table))
+
+        self.database = database
+        self.table = table
+        self._connection, self._lock = self._connect(database)
+
+        with self._lock:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS {table} '
+                '(key TEXT PRIMARY KEY, value TEXT NOT NULL)'.format(table=table))
+
+    @classmethod
+    def _connect(cls, database: str) -> tuple:
+        """Open a database, or reuse this process's existing connection to it.
+
+        :param database: Path of the database file, or ``:memory:``
+
+        :return: Tuple of the connection and the lock guarding it
+        """
+
+        with cls._connections_lock:
+            if database not in cls._connections:
+                import sqlite3
+
+                connection = sqlite3.connect(
+                    database, check_same_thread=False, isolation_level=None)
+                if database != ':memory:':
+                    connection.execute('PRAGMA journal_mode=WAL')
+                    connection.execute('PRAGMA synchronous=NORMAL')
+                cls._connections[database] = (connection, threading.Lock())
+
+            return cls._connections[database]
+
+    def get(self, key: str) -> dict:
+        import json
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value FROM {table} WHERE key = ?'.format(table=self.table),
+                (key, )).fetchone()
+
+        return None if row is None else json.loads(row[0])
+
+    def put_many(self, items: dict):
+        import json
+
+        rows = [(key, json.dumps(value)) for key, value in items.items()]
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                self._connection.executemany(
+                    'INSERT OR REPLACE INTO {table} (key, value) VALUES (?, ?)'.format(
+                        table=self.table),
+                    rows)
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute(
+                'DELETE FROM {table} WHERE key = ?'.format(table=self.table), (key, ))
+
+
+class CachedStateStore:
+    """Read-through, write-behind cache in front of a :class:`StateStore`.
+
+    Reads are served from memory after the first lookup of a key. Writes
+    only reach the backend when :meth:`flush` is called, all in one batch.
+
+    Pending writes belong to the invocation that made them: each thread, or
+    asyncio task, has its own, and only sees its own. The cache holds state
+    once it's written to the backend, so concurrent invocations, such as
+    those of :func:`lambda_handler.batch_handler`, never read, flush or
+    discard each other's unfinished changes.
+    """
+
+    def __init__(self, backend: StateStore, max_entries: int=1024):
+        """
+        :param backend: Store that state is read from and written to
+        :param max_entries: Most keys kept in memory
+        """
+
+        self.backend = backend
+        self._cache = alexa.cache.LRUCache(max_entries)
+        self._writes = contextvars.ContextVar('alexa_store_writes', default=None)
+
+    @property
+    def pending(self) -> frozenset:
+        """Keys this invocation has written or deleted since its last flush"""
+
+        return frozenset(self._writes.get() or ())
+
+    def get(self, key: str) -> dict:
+        """Read a key's state.
+
+        The state is a copy, so changing it has no effect until it's passed
+        to :meth:`set`.
+
+        :param key: Store key
+
+        :return: The key's state; an empty dict if it has none
+        """
+
+        import copy
+
+        value = (self._writes.get() or {}).get(key, alexa.cache.MISS)
+        if value is alexa.cache.MISS:
+            value = self._cache.get(key)
+            if value is alexa.cache.MISS:
+                value = self.backend.get(key)
+                if value is None:
+                    value = _DELETED
+                self._cache.put(key, value)
+
+        return {} if value is _DELETED else copy.deepcopy(value)
+
+    def set(self, key: str, value: dict):
+        """Replace a key's state; it's written to the backend on the next
+        :meth:`flush`.
+
+        :param key: Store key
+        :param value: New state
+        """
+
+        import copy
+
+        self._write_set()[key] = copy.deepcopy(value)
+
+    def update(self, key: str, changes: dict, removed=()):
+        """Merge changes into a key's state; it's written to the backend on
+        the next :meth:`flush`.
+
+        :param key: Store key
+        :param changes: Fields to add or replace
+        :param removed: Fields to remove
+        """
+
+        value = self.get(key)
+        value.update(changes)
+        for field in removed:
+            value.pop(field, None)
+        self.set(key, value)
+
+    def delete(self, key: str):
+        """Remove a key's state; it's deleted from the backend on the next
+        :meth:`flush`.
+
+        :param key: Store key
+        """
+
+        self._write_set()[key] = _DELETED
+
+    def save_attributes(self, key: str, attributes) -> bool:
+        """Persist only the session attributes a skill changed.
+
+        :param key: Store key
+        :param attributes: A session's
+            :class:`SessionAttributes <alexa.session.SessionAttributes>`
+
+        :return: Whether there were changes to save
+        """
+
+        if not attributes.modified:
+            return False
+
+        self.update(key, attributes.delta(), attributes.deleted)
+
+        return True
+
+    def flush(self) -> int:
+        """Write this invocation's pending changes to the backend in one
+        batch. If the backend fails, they stay pending.
+
+        :return: Number of keys written or deleted
+        """
+
+        pending = self._writes.get()
+        if not pending:
+            return 0
+
+        items = {key: value for key, value in pending.items() if value is not _DELETED}
+        if items:
+            self.backend.put_many(items)
+        for key, value in pending.items():
+            if value is _DELETED:
+                self.backend.delete(key)
+            self._cache.put(key, value)
+
+        count = len(pending)
+        pending.clear()
+
+        return count
+
+    def discard(self) -> int:
+        """Drop this invocation's pending changes, such as those of a failed
+        invocation, so they're never written.
+
+        :return: Number of keys discarded
+        """
+
+        pending = self._writes.get()
+        if not pending:
+            return 0
+
+        count = len(pending)
+        pending.clear()
+
+        return count
+
+    def _write_set(self) -> dict:
+        """Pending changes of the running invocation, by key"""
+
+        pending = self._writes.get()
+        if pending is None:
+            pending = {}
+            self._writes.set(pending)
+
+        return pending
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def default_store() -> CachedStateStore:
+    """Return the process-wide store, backed by :data:`DEFAULT_DATABASE`.
+
+    :return: The shared cached store
+    """
+
+    global _default_store
+
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = CachedStateStore(SQLiteStateStore(DEFAULT_DATABASE))
+
+    return _default_store
+
+
+def flush_default_store() -> int:
+    """Flush the running invocation's changes to the process-wide store, if
+    it's been used.
+
+    :return: Number of keys written
+    """
+
+    if _default_store is None:
+        return 0
+
+    return _default_store.flush()
+
+
+def discard_default_store() -> int:
+    """Drop the running invocation's pending changes to the process-wide
+    store, if it's been used.
+
+    :return: Number of keys discarded
+    """
+
+    if _default_store is None:
+        return 0
+
+    return _default_store.discard()
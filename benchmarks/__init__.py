@@ -0,0 +1,6 @@
+"""Benchmarks for the Alexa event model and request pipeline.
+
+Run a benchmark from the repository root as a module, for example::
+
+  $ python -m benchmarks.lazy_parsing
+"""
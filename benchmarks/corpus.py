@@ -0,0 +1,451 @@
+"""Generate a synthetic corpus of Alexa events as JSON lines.
+
+Events are complete and schema-valid, built from the same ID formats,
+confirmation statuses, dialog states and error types as the unit test
+generators in :mod:`tests`. Output is reproducible for a given seed,
+regardless of the number of worker processes::
+
+  $ python -m benchmarks.corpus --count 10000000 --output corpus.jsonl \\
+        --mix intent=0.8,launch=0.1,session_ended=0.1 \\
+        --slots 0=0.4,2=0.4,10=0.2 --locales en-US=0.8,en-GB=0.2 --seed 7
+
+Distributions are given as comma-separated ``value=weight`` pairs.
+"""
+import argparse
+import bisect
+import collections
+import datetime
+import itertools
+import multiprocessing
+import random
+import sys
+import time
+
+import alexa.response
+import tests
+
+REQUEST_TYPES = {
+    'intent': 'IntentRequest',
+    'launch': 'LaunchRequest',
+    'session_ended': 'SessionEndedRequest',
+}
+
+SESSION_ENDED_REASONS = ('USER_INITIATED', 'ERROR', 'EXCEEDED_MAX_REPROMPTS')
+
+INTERFACES = ('AudioPlayer', 'Display', 'VideoApp')
+
+START_TIME = datetime.datetime(2017, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def parse_distribution(text: str, value_type=str) -> tuple:
+    """Parses a ``value=weight,value=weight`` distribution.
+
+    :param text: Distribution to parse
+    :param value_type: Type to convert each value to
+
+    :return: Tuple of a list of values and a list of their weights
+
+    :raises: argparse.ArgumentTypeError
+    """
+
+    values = []
+    weights = []
+    try:
+        for item in text.split(','):
+            value, _, weight = item.partition('=')
+            values.append(value_type(value.strip()))
+            weights.append(float(weight) if weight else 1.0)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+
+    return values, weights
+
+
+def weighted_sampler(distribution: tuple):
+    """Builds a function drawing values from a distribution.
+
+    Cheaper than :meth:`random.Random.choices` for one value at a time, since
+    the cumulative weights are only summed once.
+
+    :param distribution: Tuple of values and weights, as returned by
+        :func:`parse_distribution`
+
+    :return: Function taking a :class:`random.Random` and returning a value
+    """
+
+    values, weights = distribution
+    cumulative = list(itertools.accumulate(weights))
+    total = cumulative[-1]
+    last = len(values) - 1
+
+    return lambda rng: values[bisect.bisect(cumulative, rng.random() * total, 0, last)]
+
+
+def uniform_sampler(values):
+    """Builds a function drawing values with equal weights.
+
+    Cheaper than :meth:`random.Random.choice`, which draws random bits until
+    it gets an unbiased index.
+
+    :param values: Sequence of values
+
+    :return: Function taking a :class:`random.Random` and returning a value
+    """
+
+    values = list(values)
+    count = len(values)
+
+    return lambda rng: values[int(rng.random() * count)]
+
+
+def random_ids(
+        rng: random.Random, prefix: str, character_set: str, length: int,
+        count: int) -> list:
+    """Generates prefixed random IDs, like the tests' user and device ID
+    generators.
+
+    All the IDs' characters are drawn as one block of random bytes, which
+    slightly favours the first few characters of the set; that doesn't
+    matter for synthetic IDs.
+
+    :param rng: Random number generator to draw from
+    :param prefix: ID prefix
+    :param character_set: Characters to build the IDs from
+    :param length: Length of the random part of each ID
+    :param count: Number of IDs
+
+    :return: List of generated IDs
+    """
+
+    table = bytes(
+        ord(character_set[value % len(character_set)]) for value in range(256))
+    characters = rng.randbytes(length * count).translate(table).decode('ascii')
+
+    return [
+        prefix + '.' + characters[start:start + length]
+        for start in range(0, length * count, length)
+    ]
+
+
+# Masks giving 128 random bits the version and variant bits of a UUID4
+_UUID4_CLEAR = ~((0xf000 << 64) | (0xc000 << 48))
+_UUID4_SET = (0x4000 << 64) | (0x8000 << 48)
+
+
+def prefixed_uuid(rng: random.Random, prefix: str) -> str:
+    """Generates a prefixed ID, like the tests' UUID-based generators.
+
+    :param rng: Random number generator to draw from
+    :param prefix: ID prefix
+
+    :return: Generated ID
+    """
+
+    text = '%032x' % (rng.getrandbits(128) & _UUID4_CLEAR | _UUID4_SET)
+
+    return ''.join([
+        prefix, '.', text[:8], '-', text[8:12], '-', text[12:16], '-',
+        text[16:20], '-', text[20:]])
+
+
+#: IDs shared by every event of a corpus: the skill's application ID, and
+#: user IDs with their devices' IDs and supported interfaces.
+Pools = collections.namedtuple('Pools', ['application_id', 'users', 'devices'])
+
+
+def build_pools(arguments: argparse.Namespace) -> Pools:
+    """Builds the user and device pools that events are drawn from.
+
+    They only depend on the seed, so they're built once and shared by every
+    worker process.
+
+    :param arguments: Parsed command line arguments
+
+    :return: The corpus's :class:`Pools`
+    """
+
+    rng = random.Random(arguments.seed)
+    application_id = prefixed_uuid(rng, tests.APPLICATION_ID_PREFIX)
+    users = random_ids(
+        rng, tests.USER_ID_PREFIX, tests.USER_ID_CHARACTER_SET,
+        tests.USER_ID_LENGTH, arguments.users)
+    device_ids = random_ids(
+        rng, tests.DEVICE_ID_PREFIX, tests.DEVICE_ID_CHARACTER_SET,
+        tests.DEVICE_ID_LENGTH, arguments.users)
+    devices = [
+        (
+            device_id,
+            {interface: {} for interface in INTERFACES if rng.random() < 0.5},
+        )
+        for device_id in device_ids
+    ]
+
+    return Pools(application_id, users, devices)
+
+
+class EventGenerator:
+    """Builds random events from configured distributions.
+
+    User and device IDs are drawn from fixed-size pools, so the same users
+    and devices recur throughout the corpus as they would in real traffic.
+    Everything that doesn't vary between events, such as slot and attribute
+    names, is worked out up front.
+    """
+
+    def __init__(self, arguments: argparse.Namespace, pools: Pools=None):
+        """
+        :param arguments: Parsed command line arguments
+        :param pools: Pools from :func:`build_pools`, if they're already built
+        """
+
+        self.arguments = arguments
+        self.pools = pools or build_pools(arguments)
+
+        self.mix = weighted_sampler(
+            ([REQUEST_TYPES[request_type] for request_type in arguments.mix[0]],
+             arguments.mix[1]))
+        self.slots = weighted_sampler(arguments.slots)
+        self.locales = weighted_sampler(arguments.locales)
+        self.attributes = weighted_sampler(arguments.attributes)
+
+        self.slot_names = [
+            'slot_{index}'.format(index=index) for index in range(max(arguments.slots[0]))]
+        self.slot_values = uniform_sampler(
+            'value {value}'.format(value=value) for value in range(1000))
+        self.intents = uniform_sampler(arguments.intents)
+        self.dialog_states = uniform_sampler(tests.DIALOG_STATES)
+        self.confirmation_statuses = uniform_sampler(tests.CONFIRMATION_STATUSES)
+        self.session_ended_reasons = uniform_sampler(SESSION_ENDED_REASONS)
+        self.session_ended_errors = uniform_sampler(tests.SESSION_ENDED_ERROR_TYPES)
+        self.users = uniform_sampler(range(len(self.pools.users)))
+        self.attribute_names = [
+            'attribute_{index}'.format(index=index)
+            for index in range(max(arguments.attributes[0]))]
+        self.start_time = START_TIME.timestamp()
+
+    def build_request(self, rng: random.Random, request_type: str) -> dict:
+        """Builds the 'request' object of an event.
+
+        :param rng: Random number generator to draw from
+        :param request_type: Value of :data:`REQUEST_TYPES`
+
+        :return: A 'request' object
+        """
+
+        request = {
+            'type': request_type,
+            'requestId': prefixed_uuid(rng, tests.REQUEST_ID_PREFIX),
+            'timestamp': time.strftime(
+                tests.TIMESTAMP_FORMAT,
+                time.gmtime(self.start_time + int(rng.random() * 10 ** 8))),
+            'locale': self.locales(rng),
+        }
+
+        if request_type == 'IntentRequest':
+            slot_count = self.slots(rng)
+            request['dialogState'] = self.dialog_states(rng)
+            request['intent'] = {
+                'name': self.intents(rng),
+                'confirmationStatus': self.confirmation_statuses(rng),
+            }
+            if slot_count:
+                request['intent']['slots'] = {
+                    name: {
+                        'name': name,
+                        'value': self.slot_values(rng),
+                        'confirmationStatus': self.confirmation_statuses(rng),
+                    }
+                    for name in self.slot_names[:slot_count]
+                }
+        elif request_type == 'SessionEndedRequest':
+            request['reason'] = self.session_ended_reasons(rng)
+            if request['reason'] == 'ERROR':
+                request['error'] = {
+                    'type': self.session_ended_errors(rng),
+                    'message': 'Something went wrong',
+                }
+
+        return request
+
+    def build_event(self, rng: random.Random) -> dict:
+        """Builds a complete event.
+
+        :param rng: Random number generator to draw from
+
+        :return: An event as passed to the Lambda entry point
+        """
+
+        pools = self.pools
+        request_type = self.mix(rng)
+        user_index = self.users(rng)
+        user_id = pools.users[user_index]
+        device_id, supported_interfaces = pools.devices[user_index]
+
+        session = {
+            'new': request_type == 'LaunchRequest',
+            'sessionId': prefixed_uuid(rng, tests.SESSION_ID_PREFIX),
+            'application': {
+                'applicationId': pools.application_id,
+            },
+            'user': {
+                'userId': user_id,
+            },
+        }
+        if rng.random() < self.arguments.consent_rate:
+            session['user']['permissions'] = {
+                'consentToken': tests.generate_consent_token(),
+            }
+
+        attribute_count = self.attributes(rng)
+        if attribute_count and request_type != 'LaunchRequest':
+            # Every value is drawn at once, then split up
+            size = self.arguments.attribute_size
+            values = '%0*x' % (size * attribute_count, rng.getrandbits(4 * size * attribute_count))
+            session['attributes'] = {
+                name: values[start:start + size]
+                for name, start in zip(
+                    self.attribute_names[:attribute_count],
+                    range(0, size * attribute_count, size))
+            }
+
+        return {
+            'version': '1.0',
+            'session': session,
+            'context': {
+                'System': {
+                    'apiEndpoint': 'https://api.amazonalexa.com',
+                    'application': {
+                        'applicationId': pools.application_id,
+                    },
+                    'device': {
+                        'deviceId': device_id,
+                        'supportedInterfaces': supported_interfaces,
+                    },
+                    'user': {
+                        'userId': user_id,
+                    },
+                },
+            },
+            'request': self.build_request(rng, request_type),
+        }
+
+    def build_chunk(self, chunk: tuple) -> bytes:
+        """Builds a chunk of events as JSON lines.
+
+        Each chunk is seeded from the corpus seed and its own index, so
+        output doesn't depend on which process builds it, and no two seeds
+        share a chunk's events.
+
+        :param chunk: Tuple of chunk index and event count
+
+        :return: Encoded JSON lines
+        """
+
+        index, count = chunk
+        rng = random.Random('{seed}:{index}'.format(seed=self.arguments.seed, index=index))
+
+        return b''.join([
+            alexa.response.to_json_bytes(self.build_event(rng)) + b'\n'
+            for _ in range(count)])
+
+
+def iter_chunks(count: int, chunk_size: int):
+    """Splits an event count into chunks.
+
+    :param count: Total number of events
+    :param chunk_size: Events per chunk
+
+    :return: Iterator of (chunk index, event count) tuples
+    """
+
+    for index, start in enumerate(range(0, count, chunk_size)):
+        yield index, min(chunk_size, count - start)
+
+
+_generator = None
+
+
+def _init_worker(arguments: argparse.Namespace, pools: Pools):
+    global _generator
+    _generator = EventGenerator(arguments, pools)
+
+
+def _build_chunk(chunk: tuple) -> bytes:
+    return _generator.build_chunk(chunk)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--count', type=int, default=100000,
+        help='number of events to generate (default: %(default)s)')
+    parser.add_argument(
+        '--output', help='JSONL file to write (default: stdout)')
+    parser.add_argument(
+        '--seed', type=int, default=0,
+        help='seed for reproducible output (default: %(default)s)')
+    parser.add_argument(
+        '--workers', type=int, default=multiprocessing.cpu_count(),
+        help='generator processes (default: %(default)s)')
+    parser.add_argument(
+        '--chunk-size', type=int, default=10000,
+        help='events per unit of work (default: %(default)s)')
+    parser.add_argument(
+        '--mix', default='intent=0.8,launch=0.1,session_ended=0.1',
+        type=parse_distribution,
+        help='request type distribution over {types} (default: %(default)s)'.format(
+            types=', '.join(REQUEST_TYPES)))
+    parser.add_argument(
+        '--intents', default='GetWeather,GetForecast,AMAZON.HelpIntent,AMAZON.StopIntent',
+        type=lambda text: text.split(','),
+        help='comma-separated intent names (default: %(default)s)')
+    parser.add_argument(
+        '--slots', default='0=0.3,1=0.3,3=0.3,10=0.1',
+        type=lambda text: parse_distribution(text, int),
+        help='slot count distribution (default: %(default)s)')
+    parser.add_argument(
+        '--locales', default='en-US=0.7,en-GB=0.1,de-DE=0.1,ja-JP=0.1',
+        type=parse_distribution,
+        help='locale distribution (default: %(default)s)')
+    parser.add_argument(
+        '--attributes', default='0=0.5,5=0.4,100=0.1',
+        type=lambda text: parse_distribution(text, int),
+        help='session attribute count distribution (default: %(default)s)')
+    parser.add_argument(
+        '--attribute-size', type=int, default=32,
+        help='length of each session attribute value (default: %(default)s)')
+    parser.add_argument(
+        '--users', type=int, default=10000,
+        help='distinct users and devices (default: %(default)s)')
+    parser.add_argument(
+        '--consent-rate', type=float, default=0.3,
+        help='fraction of users granting permissions (default: %(default)s)')
+    arguments = parser.parse_args()
+
+    unknown_types = set(arguments.mix[0]) - set(REQUEST_TYPES)
+    if unknown_types:
+        parser.error('unknown request types: {types}'.format(
+            types=', '.join(sorted(unknown_types))))
+
+    pools = build_pools(arguments)
+    chunks = iter_chunks(arguments.count, arguments.chunk_size)
+    output = open(arguments.output, 'wb') if arguments.output else sys.stdout.buffer
+    try:
+        if arguments.workers > 1:
+            with multiprocessing.Pool(
+                    arguments.workers, _init_worker, (arguments, pools)) as pool:
+                for data in pool.imap(_build_chunk, chunks):
+                    output.write(data)
+        else:
+            generator = EventGenerator(arguments, pools)
+            for chunk in chunks:
+                output.write(generator.build_chunk(chunk))
+    finally:
+        if arguments.output:
+            output.close()
+
+
+if __name__ == '__main__':
+    main()
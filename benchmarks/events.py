@@ -0,0 +1,197 @@
+import tests
+
+
+def build_slots(slot_count: int) -> dict:
+    """Builds the 'slots' object of an intent with the given number of slots.
+
+    :param slot_count: Number of slots to generate
+
+    :return: dict of slot name to slot object
+    """
+
+    slots = {}
+    for index in range(slot_count):
+        name = 'slot_{index}'.format(index=index)
+        slots[name] = {
+            'name': name,
+            'value': 'value {index}'.format(index=index),
+            'confirmationStatus': tests.generate_confirmation_status(),
+        }
+
+    return slots
+
+
+def build_attributes(attribute_count: int, value_size: int=32) -> dict:
+    """Builds session attributes of a given size.
+
+    :param attribute_count: Number of attributes to generate
+    :param value_size: Length of each attribute's string value
+
+    :return: dict of session attributes
+    """
+
+    return {
+        'attribute_{index}'.format(index=index): 'x' * value_size
+        for index in range(attribute_count)
+    }
+
+
+def build_catalog(entry_count: int) -> list:
+    """Builds the values of a custom slot type catalog.
+
+    Each entry has a three word name and a two word synonym, drawn from a
+    fixed vocabulary so the catalog is the same on every run.
+
+    :param entry_count: Number of entries to generate
+
+    :return: List of catalog values
+    """
+
+    words = ['word{index}'.format(index=index) for index in range(1000)]
+
+    return [
+        {
+            'id': 'ENTRY-{index}'.format(index=index),
+            'name': {
+                'value': ' '.join(
+                    words[(index * step) % len(words)] for step in (1, 7, 31)),
+                'synonyms': [' '.join(
+                    words[(index * step) % len(words)] for step in (3, 11))],
+            },
+        }
+        for index in range(entry_count)
+    ]
+
+
+def build_session(
+        application_id: str, user_id: str, attributes: dict=None,
+        new: bool=False) -> dict:
+    """Builds the 'session' object of an event.
+
+    :param application_id: Skill application ID
+    :param user_id: Alexa user ID
+    :param attributes: Optional session attributes
+    :param new: Whether this is the first request of the session
+
+    :return: A 'session' object
+    """
+
+    session = {
+        'new': new,
+        'sessionId': tests.generate_session_id(),
+        'application': {
+            'applicationId': application_id,
+        },
+        'user': {
+            'userId': user_id,
+            'permissions': {
+                'consentToken': tests.generate_consent_token(),
+            },
+            'accessToken': tests.generate_access_token(),
+        },
+    }
+    if attributes:
+        session['attributes'] = attributes
+
+    return session
+
+
+def build_context(application_id: str, user_id: str) -> dict:
+    """Builds the 'context' object of an event.
+
+    :param application_id: Skill application ID
+    :param user_id: Alexa user ID
+
+    :return: A 'context' object
+    """
+
+    return {
+        'AudioPlayer': {
+            'playerActivity': 'IDLE',
+        },
+        'System': {
+            'apiEndpoint': 'https://api.amazonalexa.com',
+            'application': {
+                'applicationId': application_id,
+            },
+            'device': {
+                'deviceId': tests.generate_device_id(),
+                'supportedInterfaces': {
+                    'AudioPlayer': {},
+                },
+            },
+            'user': {
+                'userId': user_id,
+            },
+        },
+    }
+
+
+def build_intent_request(intent_name: str, slot_count: int=0) -> dict:
+    """Builds the 'request' object of an IntentRequest event.
+
+    :param intent_name: Name of the requested intent
+    :param slot_count: Number of slots on the intent
+
+    :return: A 'request' object
+    """
+
+    request = {
+        'type': 'IntentRequest',
+        'requestId': tests.generate_request_id(),
+        'timestamp': tests.generate_timestamp(),
+        'locale': 'en-US',
+        'dialogState': tests.generate_dialog_state(),
+        'intent': {
+            'name': intent_name,
+            'confirmationStatus': tests.generate_confirmation_status(),
+        },
+    }
+    if slot_count:
+        request['intent']['slots'] = build_slots(slot_count)
+
+    return request
+
+
+def build_session_ended_request(reason: str='USER_INITIATED') -> dict:
+    """Builds the 'request' object of a SessionEndedRequest event.
+
+    :param reason: Reason the session ended
+
+    :return: A 'request' object
+    """
+
+    request = {
+        'type': 'SessionEndedRequest',
+        'requestId': tests.generate_request_id(),
+        'timestamp': tests.generate_timestamp(),
+        'locale': 'en-US',
+        'reason': reason,
+    }
+    if reason == 'ERROR':
+        request['error'] = {
+            'type': tests.generate_session_ended_error_type(),
+            'message': 'Something went wrong',
+        }
+
+    return request
+
+
+def build_event(request: dict, attributes: dict=None) -> dict:
+    """Builds a complete event around a 'request' object.
+
+    :param request: The event's 'request' object
+    :param attributes: Optional session attributes
+
+    :return: An event as passed to the Lambda entry point
+    """
+
+    application_id = tests.generate_application_id()
+    user_id = tests.generate_user_id()
+
+    return {
+        'version': '1.0',
+        'session': build_session(application_id, user_id, attributes),
+        'context': build_context(application_id, user_id),
+        'request': request,
+    }
@@ -0,0 +1,179 @@
+"""Report the cold-start import cost of the skill's modules.
+
+Each target is imported in a fresh interpreter run with ``-X importtime``.
+The report lists the total import time, the number of modules loaded
+beyond a bare interpreter, and the most expensive imports::
+
+  $ python -m benchmarks.importtime alexa lambda_handler
+  $ python -m benchmarks.importtime --json lambda_handler
+  $ python -m benchmarks.importtime --check
+
+With ``--check``, the run exits non-zero if any target took longer to
+import than its budget in :data:`TIME_BUDGETS_US`. Wall-clock times vary
+between machines, so the unit tests only fail past twice these budgets;
+the exact check is meant for a quiet machine, such as before a release.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+DEFAULT_TARGETS = ('alexa', 'lambda_handler')
+
+#: Most microseconds each target may take to import, checked by ``--check``.
+#: Generous enough to absorb noise, tight enough to catch eager imports of
+#: packages like asyncio.
+TIME_BUDGETS_US = {
+    'alexa': 10000,
+    'lambda_handler': 40000,
+}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(output: str) -> list:
+    """Parses the stderr of ``python -X importtime``.
+
+    :param output: Text written to stderr
+
+    :return: List of dicts with the module name, its nesting depth, and its
+        self and cumulative import times in microseconds
+    """
+
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_time, cumulative_time, name = line[len('import time:'):].split('|')
+        imports.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2,
+            'self_us': int(self_time),
+            'cumulative_us': int(cumulative_time),
+        })
+
+    return imports
+
+
+def run_importtime(statement: str) -> list:
+    """Runs a statement in a fresh interpreter with import timing enabled.
+
+    :param statement: Python statement to run, such as ``import alexa``
+
+    :return: Parsed imports, as returned by :func:`parse_importtime`
+
+    :raises: subprocess.CalledProcessError
+    """
+
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    environment.pop('PYTHONPROFILEIMPORTTIME', None)
+
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, env=environment, cwd=ROOT, check=True)
+
+    return parse_importtime(completed.stderr)
+
+
+def measure_import(module: str, repeat: int=3) -> dict:
+    """Measures the cold import cost of a module.
+
+    The fastest of several runs is reported, since the slower runs mostly
+    measure noise from the rest of the system.
+
+    :param module: Dotted name of the module to import
+    :param repeat: Number of fresh interpreters to measure in
+
+    :return: dict with the import time in microseconds, the modules loaded
+        beyond a bare interpreter, and the top-level import's breakdown
+    """
+
+    baseline = {entry['module'] for entry in run_importtime('pass')}
+
+    best = None
+    for _ in range(repeat):
+        imports = run_importtime('import {module}'.format(module=module))
+        total = sum(entry['cumulative_us'] for entry in imports if entry['depth'] == 0
+                    and entry['module'] not in baseline)
+        if best is None or total < best[0]:
+            best = (total, imports)
+
+    total, imports = best
+    modules = [entry['module'] for entry in imports if entry['module'] not in baseline]
+
+    return {
+        'module': module,
+        'total_us': total,
+        'module_count': len(modules),
+        'modules': modules,
+        'slowest': sorted(
+            (entry for entry in imports if entry['module'] not in baseline),
+            key=lambda entry: entry['self_us'], reverse=True)[:10],
+    }
+
+
+def over_budget(report: dict, budgets: dict=TIME_BUDGETS_US) -> bool:
+    """Checks a report against its target's import time budget.
+
+    :param report: Report returned by :func:`measure_import`
+    :param budgets: Budgets in microseconds by module name
+
+    :return: True if the import took longer than its budget; targets
+        without a budget never do
+    """
+
+    budget = budgets.get(report['module'])
+
+    return budget is not None and report['total_us'] > budget
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'targets', nargs='*', default=DEFAULT_TARGETS,
+        help='modules to measure (default: {targets})'.format(
+            targets=' '.join(DEFAULT_TARGETS)))
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='fresh interpreters per target (default: %(default)s)')
+    parser.add_argument(
+        '--json', action='store_true', help='print the report as JSON')
+    parser.add_argument(
+        '--check', action='store_true',
+        help='exit non-zero if any target is over its import time budget')
+    arguments = parser.parse_args()
+
+    reports = [measure_import(target, arguments.repeat) for target in arguments.targets]
+    regressed = arguments.check and any(over_budget(report) for report in reports)
+
+    if arguments.json:
+        json.dump(reports, sys.stdout, indent=2)
+        print()
+        if regressed:
+            sys.exit(1)
+        return
+
+    for report in reports:
+        flag = ''
+        if arguments.check and over_budget(report):
+            flag = '  OVER BUDGET ({budget:.1f} ms)'.format(
+                budget=TIME_BUDGETS_US[report['module']] / 1000)
+        print('{module}: {total:.1f} ms, {count} modules{flag}'.format(
+            module=report['module'], total=report['total_us'] / 1000,
+            count=report['module_count'], flag=flag))
+        for entry in report['slowest']:
+            print('  {self:>8.2f} ms self {cumulative:>8.2f} ms cumulative  {module}'.format(
+                self=entry['self_us'] / 1000,
+                cumulative=entry['cumulative_us'] / 1000,
+                module=entry['module']))
+        print()
+
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
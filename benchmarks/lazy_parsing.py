@@ -0,0 +1,72 @@
+"""Compare eager and lazy parsing of the Alexa event model.
+
+Handlers that only read ``intent.name`` shouldn't pay to build every Slot or
+copy every session attribute. This benchmark parses the same events in both
+modes and then reads only the intent name::
+
+  $ python -m benchmarks.lazy_parsing
+"""
+import argparse
+import timeit
+
+import alexa.context
+import alexa.request
+import alexa.session
+
+from . import events
+
+CASES = [
+    ('0 slots, no attributes', 0, 0),
+    ('10 slots, 10 attributes', 10, 10),
+    ('100 slots, 1000 attributes', 100, 1000),
+]
+
+
+def parse_event(event: dict, lazy: bool) -> str:
+    """Parse a whole event and read the intent name, as a simple handler would.
+
+    :param event: Event to parse
+    :param lazy: Whether to parse lazily
+
+    :return: The requested intent's name
+    """
+
+    alexa.session.Session(event['session'], lazy=lazy)
+    alexa.context.Context(event['context'], lazy=lazy)
+    request = alexa.request.parse_request(event['request'], lazy=lazy)
+
+    return request.intent.name
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--number', type=int, default=10000,
+        help='parses per timing run (default: %(default)s)')
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='timing runs per case; the best is reported (default: %(default)s)')
+    arguments = parser.parse_args()
+
+    print('{case:<28} {eager:>12} {lazy:>12} {speedup:>8}'.format(
+        case='case', eager='eager (us)', lazy='lazy (us)', speedup='speedup'))
+
+    for name, slot_count, attribute_count in CASES:
+        event = events.build_event(
+            events.build_intent_request('GetWeather', slot_count),
+            events.build_attributes(attribute_count))
+
+        results = {}
+        for lazy in (False, True):
+            best = min(timeit.repeat(
+                lambda: parse_event(event, lazy),
+                number=arguments.number, repeat=arguments.repeat))
+            results[lazy] = best / arguments.number * 1e6
+
+        print('{case:<28} {eager:>12.2f} {lazy:>12.2f} {speedup:>7.1f}x'.format(
+            case=name, eager=results[False], lazy=results[True],
+            speedup=results[False] / results[True]))
+
+
+if __name__ == '__main__':
+    main()
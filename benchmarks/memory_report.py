@@ -0,0 +1,151 @@
+"""Compare allocations of the default and compact (slotted) event models.
+
+Each model parses the same kind of events while :mod:`tracemalloc` records
+allocations; the report shows retained bytes and allocated blocks per event,
+along with attribute access time. Every model is measured in a fresh
+interpreter, so none of them reuses what another left in process-wide
+caches::
+
+  $ python -m benchmarks.memory_report
+"""
+import argparse
+import gc
+import multiprocessing
+import timeit
+import tracemalloc
+
+import alexa.compact
+import alexa.context
+import alexa.request
+import alexa.session
+
+from . import events
+
+
+def parse_default(event: dict) -> tuple:
+    """Parse an event with the default model classes.
+
+    :param event: Event to parse
+
+    :return: Parsed session, context and request
+    """
+
+    return (
+        alexa.session.Session(event['session']),
+        alexa.context.Context(event['context']),
+        alexa.request.parse_request(event['request']),
+    )
+
+
+def parse_compact(event: dict) -> tuple:
+    """Parse an event with the compact model classes.
+
+    :param event: Event to parse
+
+    :return: Parsed session, context and request
+    """
+
+    return (
+        alexa.compact.Session(event['session']),
+        alexa.compact.Context(event['context']),
+        alexa.compact.parse_request(event['request']),
+    )
+
+
+def measure_allocations(parse, event_batch: list) -> tuple:
+    """Parse a batch of events and measure what the parsed objects retain.
+
+    :param parse: Function parsing a single event
+    :param event_batch: Events to parse
+
+    :return: Tuple of retained bytes and retained blocks
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    parsed = [parse(event) for event in event_batch]
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    statistics = after.compare_to(before, 'filename')
+    size = sum(statistic.size_diff for statistic in statistics)
+    blocks = sum(statistic.count_diff for statistic in statistics)
+    del parsed
+
+    return size, blocks
+
+
+#: Parse function of each model, by name.
+MODELS = {
+    'default': parse_default,
+    'compact': parse_compact,
+}
+
+
+def measure_model(model: str, event_count: int, slot_count: int) -> tuple:
+    """Measure one model in the current process.
+
+    :param model: Key of :data:`MODELS`
+    :param event_count: Events to parse
+    :param slot_count: Slots per intent
+
+    :return: Tuple of retained bytes per event, retained blocks per event, and
+        attribute access time in nanoseconds
+    """
+
+    parse = MODELS[model]
+    event_batch = [
+        events.build_event(events.build_intent_request('GetWeather', slot_count))
+        for _ in range(event_count)
+    ]
+
+    size, blocks = measure_allocations(parse, event_batch)
+
+    session, context, request = parse(event_batch[0])
+    access = min(timeit.repeat(
+        lambda: (session.user.user_id, context.device.device_id, request.intent.name),
+        number=100000, repeat=5)) / 100000 * 1e9
+
+    return size / event_count, blocks / event_count, access
+
+
+def measure_isolated(model: str, event_count: int, slot_count: int) -> tuple:
+    """Measure one model in a fresh interpreter.
+
+    :param model: Key of :data:`MODELS`
+    :param event_count: Events to parse
+    :param slot_count: Slots per intent
+
+    :return: The results of :func:`measure_model`
+    """
+
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        return pool.apply(measure_model, (model, event_count, slot_count))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--events', type=int, default=1000,
+        help='events parsed per measurement (default: %(default)s)')
+    parser.add_argument(
+        '--slots', type=int, default=10,
+        help='slots per intent (default: %(default)s)')
+    arguments = parser.parse_args()
+
+    print('{model:<10} {size:>14} {blocks:>15} {access:>14}'.format(
+        model='model', size='bytes/event', blocks='blocks/event',
+        access='access (ns)'))
+
+    for name in MODELS:
+        size, blocks, access = measure_isolated(name, arguments.events, arguments.slots)
+
+        print('{model:<10} {size:>14.0f} {blocks:>15.1f} {access:>14.1f}'.format(
+            model=name, size=size, blocks=blocks, access=access))
+
+
+if __name__ == '__main__':
+    main()
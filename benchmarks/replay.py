@@ -0,0 +1,374 @@
+"""Replay a JSONL event log through the Lambda handler across processes.
+
+The log is memory-mapped and split into one byte range per worker, so it
+is never read into memory as a whole. Each worker times every invocation
+and records it in a latency histogram per request type and intent; the
+histograms are merged when the workers finish::
+
+  $ python -m benchmarks.corpus --count 1000000 --output corpus.jsonl
+  $ python -m benchmarks.replay corpus.jsonl --workers 8 --intent-package intents
+"""
+import argparse
+import collections
+import importlib
+import json
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+
+import lambda_handler
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in the style of HdrHistogram.
+
+    Values are bucketed by their top :attr:`SIGNIFICANT_BITS` bits, so every
+    recorded value keeps a relative precision of better than 1% no matter its
+    magnitude, and the histogram's size only grows with the range of values
+    seen, not their count.
+    """
+
+    SIGNIFICANT_BITS = 8
+
+    def __init__(self):
+        self.buckets = collections.Counter()
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, value: int):
+        """Records a value.
+
+        :param value: Non-negative integer value, such as nanoseconds
+        """
+
+        shift = max(value.bit_length() - self.SIGNIFICANT_BITS, 0)
+        self.buckets[(shift, value >> shift)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: 'LatencyHistogram'):
+        """Adds another histogram's values to this one.
+
+        :param other: Histogram to merge in
+        """
+
+        if not other.count:
+            return
+
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> int:
+        """Estimates the value at a percentile.
+
+        :param percentile: Percentile between 0 and 100
+
+        :return: The midpoint of the bucket holding the percentile, clamped
+            to the recorded range
+        """
+
+        if not self.count:
+            return 0
+
+        target = max(1, round(self.count * percentile / 100))
+        seen = 0
+        for shift, mantissa in sorted(self.buckets, key=lambda key: key[1] << key[0]):
+            seen += self.buckets[(shift, mantissa)]
+            if seen >= target:
+                value = (mantissa << shift) + ((1 << shift) >> 1)
+                return min(max(value, self.min), self.max)
+
+        return self.max
+
+    def summary(self) -> dict:
+        """Summarizes the histogram in milliseconds.
+
+        :return: dict of count, mean, min, max and percentiles
+        """
+
+        summary = {
+            'count': self.count,
+            'mean_ms': self.total / self.count / 1e6 if self.count else 0.0,
+            'min_ms': (self.min or 0) / 1e6,
+            'max_ms': (self.max or 0) / 1e6,
+        }
+        for percentile in PERCENTILES:
+            summary['p{percentile:g}_ms'.format(percentile=percentile)] = (
+                self.percentile(percentile) / 1e6)
+
+        return summary
+
+
+def event_key(event: dict) -> str:
+    """Groups an event by request type and, for intents, intent name.
+
+    :param event: Event to classify
+
+    :return: Key such as ``IntentRequest/GetWeather`` or ``LaunchRequest``
+    """
+
+    request = event.get('request', {})
+    request_type = request.get('type', 'Unknown')
+    if request_type == 'IntentRequest':
+        return '/'.join([request_type, request.get('intent', {}).get('name', 'Unknown')])
+
+    return request_type
+
+
+def split_ranges(mapped: mmap.mmap, parts: int) -> list:
+    """Splits a mapped file into byte ranges that start and end on line
+    boundaries.
+
+    :param mapped: Memory-mapped JSONL file
+    :param parts: Number of ranges wanted
+
+    :return: List of (start, end) offsets; there may be fewer than ``parts``
+    """
+
+    size = len(mapped)
+    boundaries = [0]
+    for part in range(1, parts):
+        newline = mapped.find(b'\n', max(size * part // parts, boundaries[-1]))
+        if newline == -1:
+            break
+        boundaries.append(newline + 1)
+    boundaries.append(size)
+
+    return [
+        (start, end)
+        for start, end in zip(boundaries, boundaries[1:])
+        if end > start
+    ]
+
+
+def load_handler(path: str):
+    """Imports the handler to replay events through.
+
+    :param path: ``module:function`` path to the handler
+
+    :return: The handler function
+    """
+
+    module_path, _, function_name = path.partition(':')
+
+    return getattr(importlib.import_module(module_path), function_name or 'lambda_handler')
+
+
+def prepare_handler(arguments: argparse.Namespace):
+    """Imports the handler and, for the entry points of :mod:`lambda_handler`,
+    builds the intent registry up front, so the replay only times handling
+    events and fails fast if there are no handlers to dispatch to.
+
+    :param arguments: Parsed command line arguments
+
+    :return: The handler function
+
+    :raises: RuntimeError
+    """
+
+    if arguments.intent_package:
+        lambda_handler.INTENT_PACKAGE = arguments.intent_package
+    if arguments.manifest:
+        lambda_handler.INTENT_MANIFEST = arguments.manifest
+    handler = load_handler(arguments.handler)
+
+    if getattr(handler, '__module__', None) == lambda_handler.__name__:
+        try:
+            lambda_handler.get_registry()
+        except Exception as error:
+            raise RuntimeError(
+                'Cannot build the intent registry ({type}: {error}); '
+                'pass --intent-package or --manifest'.format(
+                    type=type(error).__name__, error=error)) from error
+
+    return handler
+
+
+def replay_range(arguments: argparse.Namespace, start: int, end: int) -> tuple:
+    """Replays the events in one byte range of the log.
+
+    :param arguments: Parsed command line arguments
+    :param start: Offset of the first line in the range
+    :param end: Offset just past the last line in the range
+
+    :return: Tuple of histograms by key, error counts by key, and error
+        counts and an example message by exception type
+
+    :raises: RuntimeError
+    """
+
+    handler = prepare_handler(arguments)
+
+    histograms = collections.defaultdict(LatencyHistogram)
+    errors = collections.Counter()
+    error_types = {}
+    clock = time.perf_counter_ns
+
+    with open(arguments.log, 'rb') as log_file:
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            position = start
+            while position < end:
+                line_end = mapped.find(b'\n', position, end)
+                if line_end == -1:
+                    line_end = end
+                line = mapped[position:line_end]
+                position = line_end + 1
+                if not line.strip():
+                    continue
+
+                event = json.loads(line)
+                key = event_key(event)
+                began = clock()
+                try:
+                    handler(event, None)
+                except Exception as error:
+                    errors[key] += 1
+                    error_type = error_types.setdefault(
+                        type(error).__name__, {'count': 0, 'example': str(error)})
+                    error_type['count'] += 1
+                    continue
+                histograms[key].record(clock() - began)
+
+    return dict(histograms), errors, error_types
+
+
+def _replay_range(task: tuple) -> tuple:
+    return replay_range(*task)
+
+
+def replay(arguments: argparse.Namespace) -> dict:
+    """Replays a whole log and merges the results from every worker.
+
+    :param arguments: Parsed command line arguments
+
+    :return: Report with throughput and latency summaries
+
+    :raises: RuntimeError
+    """
+
+    # Fail before starting any workers if the handler can't be set up
+    prepare_handler(arguments)
+
+    with open(arguments.log, 'rb') as log_file:
+        if os.fstat(log_file.fileno()).st_size == 0:
+            ranges = []
+        else:
+            with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                ranges = split_ranges(mapped, arguments.workers)
+
+    tasks = [(arguments, start, end) for start, end in ranges]
+    began = time.perf_counter()
+    if arguments.workers > 1 and len(tasks) > 1:
+        with multiprocessing.Pool(len(tasks)) as pool:
+            results = pool.map(_replay_range, tasks)
+    else:
+        results = [_replay_range(task) for task in tasks]
+    elapsed = time.perf_counter() - began
+
+    histograms = collections.defaultdict(LatencyHistogram)
+    overall = LatencyHistogram()
+    errors = collections.Counter()
+    error_types = {}
+    for worker_histograms, worker_errors, worker_error_types in results:
+        errors.update(worker_errors)
+        for name, worker_error_type in worker_error_types.items():
+            error_type = error_types.setdefault(
+                name, {'count': 0, 'example': worker_error_type['example']})
+            error_type['count'] += worker_error_type['count']
+        for key, histogram in worker_histograms.items():
+            histograms[key].merge(histogram)
+            overall.merge(histogram)
+
+    total = overall.count + sum(errors.values())
+
+    return {
+        'events': total,
+        'errors': sum(errors.values()),
+        'errors_by_type': dict(sorted(
+            error_types.items(), key=lambda item: (-item[1]['count'], item[0]))),
+        'workers': len(tasks),
+        'elapsed_s': elapsed,
+        'throughput_per_s': total / elapsed if elapsed else 0.0,
+        'overall': overall.summary(),
+        'by_key': {
+            key: dict(histograms[key].summary(), errors=errors[key])
+            for key in sorted(histograms.keys() | errors.keys())
+        },
+    }
+
+
+def print_report(report: dict):
+    """Prints a report as a table.
+
+    :param report: Report returned by :func:`replay`
+    """
+
+    print('{events} events ({errors} errors) in {elapsed:.2f}s on {workers} workers: '
+          '{throughput:,.0f} events/s'.format(
+              events=report['events'], errors=report['errors'],
+              elapsed=report['elapsed_s'], workers=report['workers'],
+              throughput=report['throughput_per_s']))
+    for name, error_type in report['errors_by_type'].items():
+        print('  {count:>9} {name}: {example}'.format(
+            count=error_type['count'], name=name, example=error_type['example']))
+    print()
+
+    columns = ['p{percentile:g}_ms'.format(percentile=percentile) for percentile in PERCENTILES]
+    print('{key:<45} {count:>9} {errors:>7} {mean:>9} {percentiles} {max:>9}'.format(
+        key='request', count='count', errors='errors', mean='mean',
+        percentiles=' '.join('{column:>9}'.format(column=column[:-3]) for column in columns),
+        max='max'))
+    rows = [('(all)', dict(report['overall'], errors=report['errors']))]
+    rows.extend(report['by_key'].items())
+    for key, summary in rows:
+        print('{key:<45} {count:>9} {errors:>7} {mean:>9.3f} {percentiles} {max:>9.3f}'.format(
+            key=key, count=summary['count'], errors=summary['errors'],
+            mean=summary['mean_ms'],
+            percentiles=' '.join(
+                '{value:>9.3f}'.format(value=summary[column]) for column in columns),
+            max=summary['max_ms']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('log', help='JSONL file of events to replay')
+    parser.add_argument(
+        '--workers', type=int, default=multiprocessing.cpu_count(),
+        help='replay processes (default: %(default)s)')
+    parser.add_argument(
+        '--handler', default='lambda_handler:lambda_handler',
+        help='module:function to invoke per event (default: %(default)s)')
+    parser.add_argument(
+        '--intent-package', help='package of intent handler modules')
+    parser.add_argument(
+        '--manifest', help='intent manifest to load instead of scanning a package')
+    parser.add_argument(
+        '--json', action='store_true', help='print the report as JSON')
+    arguments = parser.parse_args()
+
+    try:
+        report = replay(arguments)
+    except RuntimeError as error:
+        parser.exit(1, 'error: {error}\n'.format(error=error))
+    if arguments.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
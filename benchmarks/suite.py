@@ -0,0 +1,310 @@
+"""Benchmark the parse and render hot paths and write the results as JSON.
+
+Every case is timed with :mod:`timeit` and reported as the best and mean
+time per call across several runs::
+
+  $ python -m benchmarks.suite --output results.json
+  $ python -m benchmarks.suite --compare results.json
+
+Comparing against an earlier results file prints the change for each case
+and exits non-zero if any case slowed down by more than ``--threshold``.
+"""
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import sys
+import timeit
+
+import alexa.context
+import alexa.dispatch
+import alexa.request
+import alexa.resolution
+import alexa.response
+import alexa.session
+import alexa.ssml
+import lambda_handler
+
+from . import events
+
+SLOT_COUNTS = (0, 10, 100)
+
+ATTRIBUTE_SIZES = {
+    'small': (5, 32),
+    'huge': (500, 256),
+}
+
+IMAGE_URL = 'https://example.com/images/forecast.png'
+
+CATALOG_SIZE = 20000
+
+
+def handle_benchmark(alexa_session, alexa_user, alexa_request, alexa_context):
+    """Intent handler that reads a little of the event, updates the session
+    attributes and sends them back, like a typical skill would, so larger
+    sessions cost more to handle.
+    """
+
+    attributes = alexa_session.attributes
+    attributes['turns'] = attributes.get('turns', 0) + 1
+
+    return alexa.response.build_response(
+        alexa.response.PLAIN_TEXT,
+        'Hello from {intent}'.format(intent=alexa_request.intent.name),
+        attributes, should_end_session=False)
+
+
+def build_cases() -> list:
+    """Builds every benchmark case.
+
+    :return: List of (name, parameters, function) tuples
+    """
+
+    cases = []
+
+    for size, (count, value_size) in ATTRIBUTE_SIZES.items():
+        session_data = events.build_event(
+            events.build_intent_request('Benchmark'),
+            events.build_attributes(count, value_size))['session']
+        cases.append((
+            'parse.session', {'attributes': size},
+            lambda data=session_data: alexa.session.Session(data)))
+
+    context_data = events.build_event(events.build_intent_request('Benchmark'))['context']
+    cases.append((
+        'parse.context', {},
+        lambda: alexa.context.Context(context_data)))
+
+    for slot_count in SLOT_COUNTS:
+        request_data = events.build_intent_request('Benchmark', slot_count)
+        cases.append((
+            'parse.intent_request', {'slots': slot_count},
+            lambda data=request_data: alexa.request.IntentRequest(data)))
+
+    for reason in ('USER_INITIATED', 'ERROR'):
+        request_data = events.build_session_ended_request(reason)
+        cases.append((
+            'parse.session_ended_request', {'reason': reason},
+            lambda data=request_data: alexa.request.SessionEndedRequest(data)))
+
+    cases.extend([
+        ('card.validate', {'images': 0},
+            lambda: alexa.response.Card('Sunny and 75', title='Forecast')),
+        ('card.validate', {'images': 2},
+            lambda: alexa.response.Card(
+                'Sunny and 75', title='Forecast', small_image=IMAGE_URL,
+                large_image=IMAGE_URL)),
+        ('card.shared', {'images': 2},
+            lambda: alexa.response.Card.shared(
+                'Sunny and 75', title='Forecast', small_image=IMAGE_URL,
+                large_image=IMAGE_URL)),
+    ])
+
+    ssml = (
+        alexa.ssml.Speech('Today in Seattle')
+        .pause(300)
+        .say_as('75', 'cardinal')
+        .say(' degrees & ')
+        .emphasis('sunny', level='strong')
+        .audio('https://example.com/sounds/sun.mp3')
+        .to_ssml())
+    cases.extend([
+        ('ssml.compose', {},
+            lambda: alexa.ssml.Speech('Today in Seattle').pause(300)
+            .say_as('75', 'cardinal').say(' degrees & ').emphasis('sunny', level='strong')
+            .audio('https://example.com/sounds/sun.mp3').to_ssml()),
+        ('ssml.validate', {}, lambda: alexa.ssml.validate(ssml)),
+    ])
+
+    for size, (count, value_size) in ATTRIBUTE_SIZES.items():
+        attributes = events.build_attributes(count, value_size)
+        cases.append((
+            'response.build_response', {'attributes': size},
+            lambda attributes=attributes: alexa.response.build_response(
+                alexa.response.PLAIN_TEXT, 'Sunny and 75', attributes)))
+        builder = alexa.response.ResponseBuilder(
+            alexa.response.PLAIN_TEXT, 'Sunny and 75').set_card(
+                alexa.response.Card('Sunny and 75', title='Forecast'))
+        builder.set_session_attributes(attributes)
+        cases.append((
+            'response.to_json_bytes', {'attributes': size},
+            builder.to_json_bytes))
+
+    catalog_values = events.build_catalog(CATALOG_SIZE)
+    catalog = alexa.resolution.SlotCatalog(catalog_values)
+    value = catalog_values[CATALOG_SIZE // 2]['name']['value']
+    cases.extend([
+        ('resolution.resolve', {'entries': CATALOG_SIZE, 'match': 'exact'},
+            lambda: catalog.resolve(value)),
+        ('resolution.resolve', {'entries': CATALOG_SIZE, 'match': 'contained'},
+            lambda: catalog.resolve('can I get the {value} please'.format(value=value))),
+        ('resolution.resolve', {'entries': CATALOG_SIZE, 'match': 'none'},
+            lambda: catalog.resolve('something that is not in the catalog')),
+    ])
+
+    try:
+        from alexa import fuzzy
+    except ImportError:
+        # Fuzzy matching needs NumPy, which is optional
+        pass
+    else:
+        matcher = fuzzy.FuzzyMatcher(catalog)
+        misheard = value.replace('word', 'wurd', 1)
+        cases.append((
+            'fuzzy.match', {'entries': CATALOG_SIZE},
+            lambda: matcher.match(misheard)))
+
+    registry = alexa.dispatch.IntentRegistry({'Benchmark': handle_benchmark})
+    for slot_count in SLOT_COUNTS:
+        for size, (count, value_size) in ATTRIBUTE_SIZES.items():
+            event = events.build_event(
+                events.build_intent_request('Benchmark', slot_count),
+                events.build_attributes(count, value_size))
+            # The response is encoded, as the Lambda runtime would
+            cases.append((
+                'lambda_handler', {'slots': slot_count, 'attributes': size},
+                lambda event=event: alexa.response.to_json_bytes(
+                    lambda_handler.lambda_handler(event, None, registry=registry))))
+
+    return cases
+
+
+def case_key(name: str, parameters: dict) -> str:
+    """Builds a stable identifier for a case and its parameters.
+
+    :param name: Case name
+    :param parameters: Case parameters
+
+    :return: Identifier such as ``parse.intent_request[slots=10]``
+    """
+
+    if not parameters:
+        return name
+
+    return '{name}[{parameters}]'.format(
+        name=name,
+        parameters=','.join(
+            '{key}={value}'.format(key=key, value=value)
+            for key, value in sorted(parameters.items())))
+
+
+def time_case(function, repeat: int) -> dict:
+    """Times a single case.
+
+    :param function: Zero-argument function to time
+    :param repeat: Number of timing runs
+
+    :return: Timing results, in microseconds per call
+    """
+
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    timings = [
+        total / number * 1e6
+        for total in timer.repeat(repeat=repeat, number=number)
+    ]
+
+    return {
+        'iterations': number,
+        'best_us': min(timings),
+        'mean_us': statistics.mean(timings),
+        'stdev_us': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'ops_per_sec': 1e6 / min(timings),
+    }
+
+
+def run(case_filter: str=None, repeat: int=5) -> dict:
+    """Runs the benchmark suite.
+
+    :param case_filter: Optional substring; only matching cases are run
+    :param repeat: Number of timing runs per case
+
+    :return: Machine-readable results
+    """
+
+    results = []
+    for name, parameters, function in build_cases():
+        key = case_key(name, parameters)
+        if case_filter and case_filter not in key:
+            continue
+
+        result = {'case': key, 'name': name, 'parameters': parameters}
+        result.update(time_case(function, repeat))
+        results.append(result)
+
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    """Prints the change in each case relative to a baseline.
+
+    :param baseline: Earlier results
+    :param current: New results
+    :param threshold: Fractional slowdown counted as a regression
+
+    :return: True if any case regressed past the threshold
+    """
+
+    baseline_results = {
+        result['case']: result for result in baseline['results']}
+
+    regressed = False
+    for result in current['results']:
+        previous = baseline_results.get(result['case'])
+        if previous is None:
+            continue
+
+        change = result['best_us'] / previous['best_us'] - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressed = True
+        print('{case:<55} {before:>10.2f} {after:>10.2f} {change:>+8.1%}{flag}'.format(
+            case=result['case'], before=previous['best_us'],
+            after=result['best_us'], change=change, flag=flag))
+
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--output', help='file to write JSON results to (default: stdout)')
+    parser.add_argument(
+        '--compare', metavar='BASELINE',
+        help='earlier results file to compare against')
+    parser.add_argument(
+        '--threshold', type=float, default=0.10,
+        help='slowdown counted as a regression (default: %(default)s)')
+    parser.add_argument(
+        '--filter', help='only run cases containing this substring')
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='timing runs per case (default: %(default)s)')
+    arguments = parser.parse_args()
+
+    results = run(arguments.filter, arguments.repeat)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+    elif not arguments.compare:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        if compare(baseline, results, arguments.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,45 +1,263 @@
-import importlib
+import os
+import sys
 
+import alexa.context
+import alexa.dispatch
+import alexa.metrics
+import alexa.request
+import alexa.response
 import alexa.session
-import alexa.user
 
+#: Package scanned for intent handler modules at cold start.
+INTENT_PACKAGE = os.environ.get('ALEXA_INTENT_PACKAGE', 'intents')
 
-def lambda_handler(event: dict, context) -> dict:
+#: Optional prebuilt manifest; when set, the intent package isn't scanned.
+INTENT_MANIFEST = os.environ.get('ALEXA_INTENT_MANIFEST')
+
+#: Default number of threads used by :func:`batch_handler`.
+BATCH_WORKERS = int(os.environ.get('ALEXA_BATCH_WORKERS', '8'))
+
+_registry = None
+
+
+def get_registry() -> alexa.dispatch.IntentRegistry:
+    """Return the process-wide intent registry, building it on first use so
+    warm invocations skip handler discovery entirely.
+
+    :return: The shared intent registry
+    """
+
+    global _registry
+
+    if _registry is None:
+        if INTENT_MANIFEST:
+            _registry = alexa.dispatch.IntentRegistry.from_manifest(INTENT_MANIFEST)
+        else:
+            _registry = alexa.dispatch.IntentRegistry.discover(INTENT_PACKAGE)
+
+    return _registry
+
+
+def lambda_handler(event: dict, context, registry=None) -> dict:
     """Main entry point to be called by the Lambda service.
 
     :param event: Lambda event object passed to all functions by the Lambda
                   service
     :param context: Lambda context object passed to all Lambda functions
+    :param registry: Optional registry to dispatch with instead of the
+                     process-wide one
+
+    :return: An Alexa skill-structured response object
+    """
+
+    if registry is None:
+        registry = get_registry()
+
+    timer = alexa.metrics.start_timer()
+    handler_arguments = None
+    try:
+        handler_arguments = _parse_event(event, timer)
+        intent_handler = registry.resolve(handler_arguments[2])
+        timer.mark('HandlerResolution')
+
+        handler_result = intent_handler(*handler_arguments)
+        timer.mark('HandlerExecution')
+
+        response = _build_response(handler_result)
+        timer.mark('ResponseBuild')
+
+        _flush_state()
+        timer.mark('StateFlush')
+    except BaseException:
+        # The next warm invocation mustn't write this one's partial state
+        _discard_state()
+        raise
+    finally:
+        timer.emit(handler_arguments and handler_arguments[2])
+
+    return response
+
+
+def async_lambda_handler(event: dict, context, registry=None) -> dict:
+    """Entry point for skills with coroutine intent handlers.
+
+    Handlers may be ``async def`` functions, which are awaited on the
+    process-wide event loop, or plain functions, which are called as usual.
+
+    :param event: Lambda event object passed to all functions by the Lambda
+                  service
+    :param context: Lambda context object passed to all Lambda functions
+    :param registry: Optional registry to dispatch with instead of the
+                     process-wide one
+
+    :return: An Alexa skill-structured response object
+    """
+
+    import alexa.aio
+
+    return alexa.aio.run(handle_event_async(event, context, registry))
+
+
+async def handle_event_async(event: dict, context, registry=None) -> dict:
+    """Coroutine equivalent of :func:`lambda_handler`, for callers that
+    already run an event loop.
+
+    :param event: Lambda event object passed to all functions by the Lambda
+                  service
+    :param context: Lambda context object passed to all Lambda functions
+    :param registry: Optional registry to dispatch with instead of the
+                     process-wide one
 
     :return: An Alexa skill-structured response object
     """
 
-    session_data = event['session']
-    context_data = event['context']
-    request_data = event['request']
-
-    keyword_parameters = {}
-    if not session_data['new']:
-        keyword_parameters['new'] = False
-    if 'attributes' in session_data and session_data['attributes']:
-        keyword_parameters['attributes'] = session_data['attributes']
-    if keyword_parameters:
-        alexa_session = alexa.session.Session(
-            session_data['sessionId'],
-            session_data['application']['applicationId'],
-            **keyword_parameters)
-    else:
-        alexa_session = alexa.session.Session(
-            session_data['sessionId'],
-            session_data['application']['applicationId'])
+    import alexa.aio
 
+    if registry is None:
+        registry = get_registry()
+
+    timer = alexa.metrics.start_timer()
+    handler_arguments = None
     try:
-        alexa_user = alexa.user.User(
-            session_data['user']['userId'],
-            consent_token=session_data['user']['permissions']['consentToken'])
-    except KeyError:
-        alexa_user = alexa.user.User(session_data['user']['userId'])
+        handler_arguments = _parse_event(event, timer)
+        intent_handler = registry.resolve(handler_arguments[2])
+        timer.mark('HandlerResolution')
+
+        handler_result = await alexa.aio.call_handler(intent_handler, *handler_arguments)
+        timer.mark('HandlerExecution')
+
+        response = _build_response(handler_result)
+        timer.mark('ResponseBuild')
+
+        _flush_state()
+        timer.mark('StateFlush')
+    except BaseException:
+        # The next warm invocation mustn't write this one's partial state
+        _discard_state()
+        raise
+    finally:
+        timer.emit(handler_arguments and handler_arguments[2])
+
+    return response
 
-    intent_handler = importlib('.'.join(['intents', request_data['intent']['name']]))
 
-    return intent_handler.handle_intent(alexa_session, alexa_user)
+def _flush_state():
+    """Write the invocation's changes to the default state store.
+
+    The store is only imported by handlers that use it, so it isn't loaded at
+    cold start; if it hasn't been imported, there's nothing to write.
+    """
+
+    store = sys.modules.get('alexa.store')
+    if store is not None:
+        store.flush_default_store()
+
+
+def _discard_state():
+    """Drop the invocation's pending changes to the default state store."""
+
+    store = sys.modules.get('alexa.store')
+    if store is not None:
+        store.discard_default_store()
+
+
+def _build_response(handler_result) -> dict:
+    """Turn what an intent handler returned into a response object.
+
+    :param handler_result: A response dict, or a
+        :class:`ResponseBuilder <alexa.response.ResponseBuilder>`
+
+    :return: An Alexa skill-structured response object
+    """
+
+    if isinstance(handler_result, alexa.response.ResponseBuilder):
+        return handler_result.build()
+
+    return handler_result
+
+
+def _parse_event(event: dict, timer) -> tuple:
+    """Parse an event into the arguments passed to intent handlers.
+
+    :param event: Lambda event object passed to all functions by the Lambda
+                  service
+    :param timer: Timer from :func:`alexa.metrics.start_timer`
+
+    :return: Tuple of session, user, request and context
+    """
+
+    # Parse lazily so handlers only pay for the parts of the event they read
+    alexa_session = alexa.session.Session(event['session'], lazy=True)
+    timer.mark('SessionParse')
+    alexa_user = alexa_session.user
+    timer.mark('UserParse')
+    alexa_context = alexa.context.Context(event['context'], lazy=True)
+    alexa_request = alexa.request.parse_request(event['request'], lazy=True)
+    timer.mark('RequestParse')
+
+    return alexa_session, alexa_user, alexa_request, alexa_context
+
+
+def batch_handler(events, context, registry=None, max_workers: int=None) -> list:
+    """Entry point for a batch of events, such as replayed or queued requests.
+
+    Each event runs through the same pipeline as :func:`lambda_handler` on a
+    bounded thread pool. Only a few events per worker are in flight at once,
+    so ``events`` may be a long-running iterator.
+
+    A failing event doesn't fail the batch; each result is either
+    ``{'response': <response>}`` or
+    ``{'error': {'type': <exception class>, 'message': <str>}}``.
+
+    :param events: A list or iterator of Lambda event objects
+    :param context: Lambda context object passed to all Lambda functions
+    :param registry: Optional registry to dispatch with instead of the
+                     process-wide one
+    :param max_workers: Optional thread pool size; defaults to
+                        :data:`BATCH_WORKERS`
+
+    :return: List of results in the same order as ``events``
+    """
+
+    import collections
+    import concurrent.futures
+    import itertools
+
+    if registry is None:
+        registry = get_registry()
+    if max_workers is None:
+        max_workers = BATCH_WORKERS
+
+    events = iter(events)
+    results = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        pending = collections.deque(
+            executor.submit(lambda_handler, event, context, registry)
+            for event in itertools.islice(events, max_workers * 2))
+
+        while pending:
+            results.append(_batch_result(pending.popleft()))
+            for event in itertools.islice(events, 1):
+                pending.append(
+                    executor.submit(lambda_handler, event, context, registry))
+
+    return results
+
+
+def _batch_result(future: 'concurrent.futures.Future') -> dict:
+    """Wait for one event of a batch and wrap its response or error.
+
+    :param future: Future of a :func:`lambda_handler` call
+
+    :return: Batch result for the event
+    """
+
+    try:
+        return {'response': future.result()}
+    except Exception as error:
+        return {
+            'error': {
+                'type': type(error).__name__,
+                'message': str(error),
+            },
+        }
@@ -1,5 +1,8 @@
 import datetime
+import http.server
 import random
+import threading
+import time
 import uuid
 
 APPLICATION_ID_PREFIX = 'amzn1.ask.skill'
@@ -167,3 +170,80 @@ def generate_user_id(
         user_id += random.choice(character_set)
 
     return '.'.join([prefix, user_id])
+
+
+class StubAPIServer:
+    """Local HTTP server standing in for the Alexa service APIs.
+
+    Requests are answered from :attr:`responses` and recorded in
+    :attr:`requests`. Connections are kept alive, as the real APIs do::
+
+      with StubAPIServer({('GET', '/v1/thing'): (200, b'{}')}) as server:
+          client = alexa.api.APIClient(server.endpoint)
+    """
+
+    def __init__(self, responses: dict=None, delay: float=0.0):
+        """
+        :param responses: dict of (method, path) to a tuple of the status and
+            body to answer with; other requests are answered with 404
+        :param delay: Seconds to wait before answering each request
+        """
+
+        self.responses = dict(responses or {})
+        self.delay = delay
+
+        #: List of (method, path, headers, body, client port) for each request
+        #: received, in order.
+        self.requests = []
+
+        #: :class:`threading.Event` set whenever a request is received.
+        self.received = threading.Event()
+
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self.answer()
+
+            def do_POST(self):
+                self.answer()
+
+            def answer(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                stub.requests.append(
+                    (self.command, self.path, self.headers, body, self.client_address[1]))
+                stub.received.set()
+
+                time.sleep(stub.delay)
+
+                status, response_body = stub.responses.get(
+                    (self.command, self.path), (404, b''))
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(response_body)))
+                self.end_headers()
+                self.wfile.write(response_body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+
+    @property
+    def endpoint(self) -> str:
+        """Base URL of the server"""
+
+        return 'http://127.0.0.1:{port}'.format(port=self._server.server_address[1])
+
+    def __enter__(self) -> 'StubAPIServer':
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.05, ), daemon=True).start()
+
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
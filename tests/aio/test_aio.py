@@ -0,0 +1,57 @@
+import asyncio
+import time
+import unittest
+
+import alexa.aio
+
+
+async def slow_value(value, delay: float=0.1):
+    await asyncio.sleep(delay)
+    return value
+
+
+def blocking_value(value, delay: float=0.1):
+    time.sleep(delay)
+    return value
+
+
+class Gather(unittest.TestCase):
+
+    def test_results_by_name(self):
+        # Results are keyed by the name each awaitable was passed under
+
+        results = alexa.aio.run(alexa.aio.gather(
+            profile=slow_value('profile', 0), device=slow_value('device', 0)))
+
+        self.assertEqual(results, {'profile': 'profile', 'device': 'device'})
+
+    def test_calls_run_concurrently(self):
+        # Three coroutine and blocking calls cost about as long as one
+
+        start = time.monotonic()
+        alexa.aio.run(alexa.aio.gather(
+            first=slow_value(1),
+            second=alexa.aio.run_blocking(blocking_value, 2),
+            third=alexa.aio.run_blocking(blocking_value, 3, delay=0.1)))
+
+        self.assertLess(time.monotonic() - start, 0.25)
+
+
+class CallHandler(unittest.TestCase):
+
+    def test_plain_function(self):
+        self.assertEqual(alexa.aio.run(alexa.aio.call_handler(max, 1, 2)), 2)
+
+    def test_coroutine_function(self):
+        self.assertEqual(
+            alexa.aio.run(alexa.aio.call_handler(slow_value, 'done', 0)), 'done')
+
+    def test_loop_is_reused(self):
+        # Warm invocations share one event loop
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        loops = [alexa.aio.run(current_loop()) for _ in range(2)]
+
+        self.assertIs(loops[0], loops[1])
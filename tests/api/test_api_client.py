@@ -0,0 +1,177 @@
+import http.client
+import socket
+import threading
+import unittest
+
+import alexa.api
+
+from .. import StubAPIServer, generate_consent_token
+
+ADDRESS_PATH = '/v1/devices/device/settings/address'
+
+
+class APIClientTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubAPIServer({
+            ('GET', ADDRESS_PATH): (200, b'{"city":"Seattle"}'),
+            ('GET', '/v1/empty'): (204, b''),
+            ('GET', '/v1/forbidden'): (403, b'{"type":"FORBIDDEN"}'),
+            ('POST', '/v1/directives'): (204, b''),
+        })
+        self.server.__enter__()
+        self.client = alexa.api.APIClient(self.server.endpoint, timeout=2.0)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_get(self):
+        token = generate_consent_token()
+
+        self.assertEqual(self.client.get(ADDRESS_PATH, token), {'city': 'Seattle'})
+
+        _, path, headers, _, _ = self.server.requests[0]
+        self.assertEqual(path, ADDRESS_PATH)
+        self.assertEqual(headers['Authorization'], 'Bearer ' + token)
+
+    def test_post(self):
+        self.assertIsNone(self.client.post('/v1/directives', {'header': {'requestId': 'id'}}))
+
+        method, _, headers, body, _ = self.server.requests[0]
+        self.assertEqual(method, 'POST')
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        self.assertEqual(body, b'{"header":{"requestId":"id"}}')
+
+    def test_connection_reused(self):
+        # Later calls are sent over the connection opened by the first
+
+        self.client.get(ADDRESS_PATH)
+        self.client.get('/v1/empty')
+        self.client.post('/v1/directives', {})
+
+        self.assertEqual(len({request[4] for request in self.server.requests}), 1)
+        self.assertEqual(len(self.client), 1)
+
+    def test_error_status(self):
+        with self.assertRaises(alexa.api.APIError) as raised:
+            self.client.get('/v1/forbidden')
+
+        self.assertEqual(raised.exception.status, 403)
+        self.assertEqual(raised.exception.body, b'{"type":"FORBIDDEN"}')
+
+        # An error response leaves the connection usable
+        self.assertEqual(len(self.client), 1)
+
+    def test_timeout(self):
+        self.server.delay = 0.5
+
+        with self.assertRaises(TimeoutError):
+            self.client.get(ADDRESS_PATH, timeout=0.05)
+
+        # The timed out connection isn't put back in the pool
+        self.assertEqual(len(self.client), 0)
+
+    def test_base_path(self):
+        client = alexa.api.APIClient(self.server.endpoint + '/v1/')
+        try:
+            self.assertEqual(client.get('/empty'), None)
+        finally:
+            client.close()
+
+        self.assertEqual(self.server.requests[0][1], '/v1/empty')
+
+
+class ClosingServer:
+    """Raw server answering the first request on each connection with a
+    kept-alive response, then closing the connection either straight away or
+    once the next request arrives, without answering it.
+    """
+
+    RESPONSE = b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}'
+
+    def __init__(self, close_when_idle: bool):
+        self.close_when_idle = close_when_idle
+        self.connections = 0
+        self.requests = 0
+
+        self._socket = socket.create_server(('127.0.0.1', 0))
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    @property
+    def endpoint(self) -> str:
+        return 'http://127.0.0.1:{port}'.format(port=self._socket.getsockname()[1])
+
+    def close(self):
+        self._socket.close()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self._socket.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._answer_once, args=(connection, ), daemon=True).start()
+
+    def _answer_once(self, connection):
+        with connection:
+            connection.recv(65536)
+            self.requests += 1
+            connection.sendall(self.RESPONSE)
+            if not self.close_when_idle and connection.recv(65536):
+                self.requests += 1
+
+
+class StaleConnections(unittest.TestCase):
+
+    def serve(self, close_when_idle: bool) -> alexa.api.APIClient:
+        self.server = ClosingServer(close_when_idle)
+        self.addCleanup(self.server.close)
+        client = alexa.api.APIClient(self.server.endpoint, timeout=2.0)
+        self.addCleanup(client.close)
+
+        self.assertEqual(client.get('/v1/first'), {})
+        self.assertEqual(len(client), 1)
+
+        return client
+
+    def test_closed_idle_connection_dropped(self):
+        # A connection the server closed while idle isn't used at all, so
+        # even a POST goes through
+
+        client = self.serve(close_when_idle=True)
+
+        self.assertEqual(client.post('/v1/directives', {}), {})
+        self.assertEqual(self.server.connections, 2)
+
+    def test_idempotent_request_retried(self):
+        client = self.serve(close_when_idle=False)
+
+        self.assertEqual(client.get('/v1/second'), {})
+        self.assertEqual(self.server.connections, 2)
+        self.assertEqual(self.server.requests, 3)
+
+    def test_sent_post_not_retried(self):
+        # The server may have acted on a POST it received, so it isn't sent
+        # again
+
+        client = self.serve(close_when_idle=False)
+
+        with self.assertRaises((http.client.RemoteDisconnected, ConnectionResetError)):
+            client.post('/v1/directives', {})
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.server.requests, 2)
+
+
+class GetClient(unittest.TestCase):
+
+    def test_shared_per_endpoint(self):
+        client = alexa.api.get_client('https://api.amazonalexa.com')
+
+        self.assertIs(alexa.api.get_client('https://api.amazonalexa.com'), client)
+        self.assertIsNot(alexa.api.get_client('https://api.eu.amazonalexa.com'), client)
+
+    def test_unsupported_endpoint(self):
+        with self.assertRaises(ValueError):
+            alexa.api.APIClient('ftp://api.amazonalexa.com')
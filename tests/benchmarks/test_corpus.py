@@ -0,0 +1,104 @@
+import argparse
+import collections
+import json
+import random
+import unittest
+
+import alexa.dispatch
+import benchmarks.corpus
+import lambda_handler
+import tests
+
+
+class ParseDistributionTests(unittest.TestCase):
+
+    def test_weights(self):
+        self.assertEqual(
+            benchmarks.corpus.parse_distribution('0=0.5, 2=0.5,10', int),
+            ([0, 2, 10], [0.5, 0.5, 1.0]))
+
+    def test_invalid(self):
+        with self.assertRaises(argparse.ArgumentTypeError):
+            benchmarks.corpus.parse_distribution('a=b')
+
+
+class SamplerTests(unittest.TestCase):
+
+    def test_weighted(self):
+        # Every value with weight is drawn, in proportion to its weight
+
+        sample = benchmarks.corpus.weighted_sampler((['a', 'b', 'c'], [1.0, 0.0, 3.0]))
+        rng = random.Random(0)
+        counts = collections.Counter(sample(rng) for _ in range(4000))
+
+        self.assertEqual(set(counts), {'a', 'c'})
+        self.assertAlmostEqual(counts['c'] / counts['a'], 3.0, delta=0.3)
+
+    def test_uniform(self):
+        sample = benchmarks.corpus.uniform_sampler(range(3))
+        rng = random.Random(0)
+
+        self.assertEqual({sample(rng) for _ in range(100)}, {0, 1, 2})
+
+
+class IterChunksTests(unittest.TestCase):
+
+    def test_chunks(self):
+        self.assertEqual(
+            list(benchmarks.corpus.iter_chunks(25, 10)), [(0, 10), (1, 10), (2, 5)])
+
+
+class EventGeneratorTests(unittest.TestCase):
+
+    def setUp(self):
+        self.arguments = argparse.Namespace(
+            seed=7, users=5, consent_rate=0.5, attribute_size=8,
+            mix=benchmarks.corpus.parse_distribution('intent=0.6,launch=0.2,session_ended=0.2'),
+            intents=['GetWeather', 'AMAZON.HelpIntent'],
+            slots=benchmarks.corpus.parse_distribution('0,3', int),
+            locales=benchmarks.corpus.parse_distribution('en-US'),
+            attributes=benchmarks.corpus.parse_distribution('0,2', int))
+
+    def build_chunk(self, chunk: tuple) -> bytes:
+        return benchmarks.corpus.EventGenerator(self.arguments).build_chunk(chunk)
+
+    def test_reproducible(self):
+        # Output depends only on the seed and the chunk, not the process
+
+        self.assertEqual(self.build_chunk((3, 20)), self.build_chunk((3, 20)))
+        self.assertNotEqual(self.build_chunk((3, 20)), self.build_chunk((4, 20)))
+
+    def test_seeds_dont_share_chunks(self):
+        # No chunk of one seed repeats a chunk of another
+
+        pools = benchmarks.corpus.build_pools(self.arguments)
+        first = benchmarks.corpus.EventGenerator(self.arguments, pools).build_chunk((1000003, 5))
+        self.arguments.seed = 8
+        second = benchmarks.corpus.EventGenerator(self.arguments, pools).build_chunk((0, 5))
+
+        self.assertNotEqual(first, second)
+
+    def test_shared_pools(self):
+        # Workers reuse the pools built once by the parent process
+
+        pools = benchmarks.corpus.build_pools(self.arguments)
+        generator = benchmarks.corpus.EventGenerator(self.arguments, pools)
+
+        self.assertIs(generator.pools, pools)
+        self.assertEqual(pools, benchmarks.corpus.build_pools(self.arguments))
+        self.assertEqual(generator.build_chunk((2, 10)), self.build_chunk((2, 10)))
+        self.assertEqual(len(pools.users), self.arguments.users)
+        for user_id in pools.users:
+            self.assertEqual(
+                len(user_id), len(tests.USER_ID_PREFIX) + 1 + tests.USER_ID_LENGTH)
+
+    def test_events_are_handled(self):
+        # Every generated event parses and dispatches
+
+        registry = alexa.dispatch.IntentRegistry(fallback=lambda *arguments: {})
+        lines = self.build_chunk((0, 50)).splitlines()
+
+        self.assertEqual(len(lines), 50)
+        for line in lines:
+            event = json.loads(line)
+            self.assertEqual(lambda_handler.lambda_handler(event, None, registry), {})
@@ -0,0 +1,23 @@
+import unittest
+
+import benchmarks.memory_report
+
+
+class MeasureModelTests(unittest.TestCase):
+
+    def test_models(self):
+        for model in benchmarks.memory_report.MODELS:
+            with self.subTest(model=model):
+                size, blocks, access = benchmarks.memory_report.measure_model(model, 20, 2)
+
+                self.assertGreater(size, 0)
+                self.assertGreater(blocks, 0)
+                self.assertGreater(access, 0)
+
+    def test_isolated(self):
+        # The model is measured in a fresh interpreter
+
+        results = benchmarks.memory_report.measure_isolated('compact', 20, 2)
+
+        self.assertEqual(len(results), 3)
+        self.assertGreater(results[0], 0)
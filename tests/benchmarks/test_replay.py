@@ -0,0 +1,146 @@
+import argparse
+import json
+import mmap
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+import benchmarks.events
+import benchmarks.replay
+import lambda_handler
+
+
+def handle_event(event: dict, context):
+    # Handler replayed by the tests; fails for one intent
+
+    if event['request']['intent']['name'] == 'Broken':
+        raise KeyError('Broken')
+
+    return {}
+
+
+class LatencyHistogramTests(unittest.TestCase):
+
+    def setUp(self):
+        self.histogram = benchmarks.replay.LatencyHistogram()
+
+    def test_empty(self):
+        self.assertEqual(self.histogram.percentile(50), 0)
+
+    def test_percentiles(self):
+        # Each value keeps better than 1% precision, however large
+
+        for value in range(1, 10001):
+            self.histogram.record(value * 1000)
+
+        for percentile in (1, 50, 90, 99, 99.9, 100):
+            with self.subTest(percentile=percentile):
+                expected = percentile * 100 * 1000
+                self.assertAlmostEqual(
+                    self.histogram.percentile(percentile), expected, delta=expected * 0.01)
+        self.assertAlmostEqual(self.histogram.percentile(0), 1000, delta=10)
+
+    def test_small_values_exact(self):
+        for value in (3, 1, 2):
+            self.histogram.record(value)
+
+        self.assertEqual(
+            [self.histogram.percentile(percentile) for percentile in (33, 66, 100)], [1, 2, 3])
+
+    def test_merge(self):
+        other = benchmarks.replay.LatencyHistogram()
+        for value in range(100):
+            self.histogram.record(value)
+            other.record(value + 100)
+        self.histogram.merge(other)
+        self.histogram.merge(benchmarks.replay.LatencyHistogram())
+
+        self.assertEqual(self.histogram.count, 200)
+        self.assertEqual(self.histogram.total, sum(range(200)))
+        self.assertEqual((self.histogram.min, self.histogram.max), (0, 199))
+        self.assertEqual(self.histogram.percentile(50), 99)
+
+
+class SplitRangesTests(unittest.TestCase):
+
+    def split(self, data: bytes, parts: int) -> list:
+        with tempfile.TemporaryFile() as log_file:
+            log_file.write(data)
+            log_file.flush()
+            with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return benchmarks.replay.split_ranges(mapped, parts)
+
+    def test_line_boundaries(self):
+        data = b''.join(b'line %d\n' % index for index in range(100))
+        ranges = self.split(data, 4)
+
+        self.assertEqual(len(ranges), 4)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(data))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[start - 1:start], b'\n')
+
+    def test_fewer_lines_than_parts(self):
+        self.assertEqual(self.split(b'one\n', 4), [(0, 4)])
+
+    def test_no_trailing_newline(self):
+        self.assertEqual(self.split(b'one\ntwo', 2), [(0, 4), (4, 7)])
+
+
+class ReplayTests(unittest.TestCase):
+
+    def setUp(self):
+        for name, value in [('INTENT_PACKAGE', 'intents'), ('INTENT_MANIFEST', None),
+                            ('_registry', None)]:
+            patcher = unittest.mock.patch.object(lambda_handler, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        log_file = tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False)
+        self.addCleanup(os.remove, log_file.name)
+        with log_file:
+            for intent_name in ['Benchmark'] * 8 + ['Broken'] * 2:
+                log_file.write(json.dumps(benchmarks.events.build_event(
+                    benchmarks.events.build_intent_request(intent_name))) + '\n')
+        self.log = log_file.name
+
+    def arguments(self, **arguments) -> argparse.Namespace:
+        defaults = {
+            'log': self.log, 'workers': 1, 'handler': 'lambda_handler:lambda_handler',
+            'intent_package': None, 'manifest': None,
+        }
+        defaults.update(arguments)
+
+        return argparse.Namespace(**defaults)
+
+    def test_errors_by_type(self):
+        report = benchmarks.replay.replay(self.arguments(handler=__name__ + ':handle_event'))
+
+        self.assertEqual(report['events'], 10)
+        self.assertEqual(report['errors'], 2)
+        self.assertEqual(
+            report['errors_by_type'], {'KeyError': {'count': 2, 'example': "'Broken'"}})
+        self.assertEqual(report['by_key']['IntentRequest/Broken']['errors'], 2)
+        self.assertEqual(report['by_key']['IntentRequest/Benchmark']['count'], 8)
+
+    def test_missing_registry_fails_fast(self):
+        # Without handlers, the replay stops instead of timing failed imports
+
+        with self.assertRaises(RuntimeError):
+            benchmarks.replay.replay(self.arguments(intent_package='no_such_intents'))
+
+    def test_lambda_handler(self):
+        manifest = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+        self.addCleanup(os.remove, manifest.name)
+        with manifest:
+            json.dump({'Benchmark': 'benchmarks.suite:handle_benchmark'}, manifest)
+
+        report = benchmarks.replay.replay(self.arguments(manifest=manifest.name))
+
+        self.assertEqual(report['events'], 10)
+        self.assertEqual(report['overall']['count'], 10)
+        # The unregistered intent goes to the fallback handler
+        self.assertEqual(report['by_key']['IntentRequest/Broken']['count'], 2)
+        self.assertEqual(report['errors_by_type'], {})
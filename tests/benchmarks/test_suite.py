@@ -0,0 +1,64 @@
+import contextlib
+import io
+import json
+import unittest
+
+import benchmarks.suite
+
+
+class BuildCasesTests(unittest.TestCase):
+
+    def test_cases_run(self):
+        # Every case runs once without error, under a unique key
+
+        cases = benchmarks.suite.build_cases()
+        keys = [benchmarks.suite.case_key(name, parameters) for name, parameters, _ in cases]
+
+        self.assertEqual(len(set(keys)), len(keys))
+        for key, (_, _, function) in zip(keys, cases):
+            with self.subTest(case=key):
+                function()
+
+
+    def test_lambda_handler_sends_attributes(self):
+        # The handler echoes the session attributes, so larger sessions
+        # produce larger responses
+
+        sizes = {}
+        for name, parameters, function in benchmarks.suite.build_cases():
+            if name == 'lambda_handler' and parameters['slots'] == 0:
+                response = json.loads(function())
+                self.assertEqual(response['sessionAttributes']['turns'], 1)
+                sizes[parameters['attributes']] = len(response['sessionAttributes'])
+
+        self.assertEqual(
+            sorted(sizes.values()),
+            [count + 1 for count, _ in sorted(benchmarks.suite.ATTRIBUTE_SIZES.values())])
+
+
+class CaseKeyTests(unittest.TestCase):
+
+    def test_parameters_sorted(self):
+        self.assertEqual(benchmarks.suite.case_key('parse.context', {}), 'parse.context')
+        self.assertEqual(
+            benchmarks.suite.case_key('lambda_handler', {'slots': 10, 'attributes': 'small'}),
+            'lambda_handler[attributes=small,slots=10]')
+
+
+class CompareTests(unittest.TestCase):
+
+    @staticmethod
+    def results(**timings) -> dict:
+        return {'results': [
+            {'case': case, 'best_us': best_us} for case, best_us in timings.items()]}
+
+    def compare(self, current: dict) -> bool:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return benchmarks.suite.compare(
+                self.results(first=10.0, second=20.0), current, threshold=0.10)
+
+    def test_within_threshold(self):
+        self.assertFalse(self.compare(self.results(first=10.9, second=15.0, new=1.0)))
+
+    def test_regression(self):
+        self.assertTrue(self.compare(self.results(first=10.0, second=22.5)))
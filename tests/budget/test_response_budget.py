@@ -0,0 +1,143 @@
+import json
+import unittest
+
+import alexa.budget
+import alexa.response
+import alexa.session
+import alexa.ssml
+import alexa.store
+
+from .. import generate_application_id, generate_session_id, generate_user_id
+from ..store.test_state_store import RecordingStore
+
+IMAGE_URL = 'https://example.com/images/forecast.png'
+
+
+class ResponseBudgetTestsMixin:
+
+    SPEECH = 'The forecast is sunny and warm for the rest of the week. ' * 10
+
+    # Includes floats whose formatting differs between JSON encoders
+    ATTRIBUTES = {'history': ['x' * 100] * 5, 'total': 1e16, 'rate': 1.5e-7}
+
+    def setUp(self):
+        self.store = alexa.store.CachedStateStore(RecordingStore())
+        self.session = alexa.session.Session({
+            'new': False,
+            'sessionId': generate_session_id(),
+            'application': {'applicationId': generate_application_id()},
+            'user': {'userId': generate_user_id()},
+            'attributes': dict(self.ATTRIBUTES),
+        })
+        self.builder = (
+            alexa.response.ResponseBuilder(self.response_type, self.build_speech())
+            .set_card(alexa.response.Card(
+                'Sunny', title='Forecast', small_image=IMAGE_URL, large_image=IMAGE_URL))
+            .set_session_attributes(self.session.attributes))
+        self.full_size = self.builder.encoded_size()
+        self.assertEqual(self.full_size, len(self.builder.to_json_bytes()))
+
+    def fit(self, max_size: int, *strategies) -> list:
+        budget = alexa.budget.ResponseBudget(max_size, strategies)
+        self.builder.set_budget(budget, self.session)
+        response = self.builder.to_json_bytes()
+        self.assertLessEqual(len(response), max_size)
+        self.assertEqual(json.loads(response), self.builder.build())
+
+        return budget.fit(self.builder, self.session)
+
+    def test_within_budget(self):
+        self.assertEqual(self.fit(self.full_size, alexa.budget.truncate_speech), [])
+        self.assertEqual(self.builder.encoded_size(), self.full_size)
+
+    def test_drop_card_image(self):
+        self.fit(self.full_size - 1, alexa.budget.drop_card_image)
+
+        self.assertEqual(self.builder.build()['response']['card']['type'], 'Simple')
+
+    def test_truncate_speech(self):
+        self.fit(self.full_size - 100, alexa.budget.truncate_speech)
+
+        output_speech = self.builder.build()['response']['outputSpeech']
+        self.assertLess(len(output_speech.get('text', output_speech.get('ssml'))),
+                        len(self.build_speech()))
+
+    def test_offload_session_attributes(self):
+        strategy = alexa.budget.offload_session_attributes(self.store)
+        self.fit(self.full_size - 100, strategy)
+
+        attributes = self.builder.build()['sessionAttributes']
+        self.assertEqual(list(attributes), [alexa.budget.OFFLOADED_ATTRIBUTE])
+
+        # The next request restores them
+        self.session.attributes = alexa.session.SessionAttributes(attributes)
+        self.assertTrue(alexa.budget.restore_session_attributes(self.session, self.store))
+        self.assertEqual(dict(self.session.attributes), self.ATTRIBUTES)
+        self.assertFalse(alexa.budget.restore_session_attributes(self.session, self.store))
+
+    def test_strategies_in_order(self):
+        applied = []
+
+        def record(name):
+            def strategy(builder, overflow, alexa_session):
+                applied.append(name)
+                return False
+            return strategy
+
+        budget = alexa.budget.ResponseBudget(
+            self.full_size - 1, [record('first'), alexa.budget.drop_card_image, record('last')])
+
+        self.assertEqual(budget.fit(self.builder), [alexa.budget.drop_card_image])
+        self.assertEqual(applied, ['first'])
+
+    def test_over_budget(self):
+        budget = alexa.budget.ResponseBudget(100, [alexa.budget.drop_card_image])
+
+        with self.assertRaises(ValueError):
+            budget.fit(self.builder)
+
+
+class PlainTextBudget(ResponseBudgetTestsMixin, unittest.TestCase):
+
+    response_type = alexa.response.PLAIN_TEXT
+
+    def build_speech(self):
+        return self.SPEECH
+
+
+class SSMLBudget(ResponseBudgetTestsMixin, unittest.TestCase):
+
+    response_type = alexa.response.SSML
+
+    def build_speech(self):
+        return alexa.ssml.Speech(self.SPEECH).emphasis(self.SPEECH).to_ssml()
+
+    def test_truncated_ssml_is_valid(self):
+        self.fit(self.full_size - len(self.SPEECH) - 10, alexa.budget.truncate_speech)
+
+        ssml = self.builder.build()['response']['outputSpeech']['ssml']
+        alexa.ssml.validate(ssml)
+        self.assertTrue(ssml.endswith('</speak>'))
+
+
+class IncrementalSizing(unittest.TestCase):
+
+    def test_unchanged_parts_are_not_measured_again(self):
+        attributes = alexa.session.SessionAttributes({'count': 1})
+        builder = (
+            alexa.response.ResponseBuilder(alexa.response.PLAIN_TEXT, 'Hi')
+            .set_card(alexa.response.Card.shared('Hello'))
+            .set_session_attributes(attributes))
+        size = builder.encoded_size()
+
+        # Shared cards keep their own encoding, so only other parts' sizes
+        # are kept by the builder
+        self.assertEqual(set(builder._part_sizes), {'outputSpeech'})
+        builder.speak(alexa.response.PLAIN_TEXT, 'Hello')
+        self.assertEqual(set(builder._part_sizes), set())
+        self.assertEqual(builder.encoded_size(), size + 3)
+
+        # Changed session attributes are measured again
+        attributes['count'] = 10
+        self.assertEqual(builder.encoded_size(), size + 4)
+        self.assertEqual(builder.encoded_size(), len(builder.to_json_bytes()))
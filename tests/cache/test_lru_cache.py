@@ -0,0 +1,89 @@
+import unittest
+
+import alexa.cache
+
+
+class LRUCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = alexa.cache.LRUCache(max_entries=2)
+
+    def test_miss(self):
+        self.assertIs(self.cache.get('missing'), alexa.cache.MISS)
+        self.assertIsNone(self.cache.get('missing', None))
+
+    def test_cached_none(self):
+        # None is a valid cached value, distinct from a miss
+
+        self.cache.put('key', None)
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put('first', 1)
+        self.cache.put('second', 2)
+        self.cache.get('first')
+        self.cache.put('third', 3)
+
+        self.assertIn('first', self.cache)
+        self.assertNotIn('second', self.cache)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_pop_and_clear(self):
+        self.cache.put('first', 1)
+        self.assertEqual(self.cache.pop('first'), 1)
+        self.assertIsNone(self.cache.pop('first'))
+
+        self.cache.put('second', 2)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            alexa.cache.LRUCache(max_entries=0)
+
+
+class TTLCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.cache = alexa.cache.TTLCache(max_entries=2, ttl=10.0, clock=lambda: self.now)
+
+    def test_expires(self):
+        self.cache.put('key', 'value')
+        self.now = 9.0
+        self.assertIn('key', self.cache)
+        self.assertEqual(self.cache.get('key'), 'value')
+
+        self.now = 10.0
+        self.assertNotIn('key', self.cache)
+        self.assertIs(self.cache.get('key'), alexa.cache.MISS)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_put_renews(self):
+        self.cache.put('key', 'old')
+        self.now = 8.0
+        self.cache.put('key', 'new')
+        self.now = 15.0
+        self.assertEqual(self.cache.get('key'), 'new')
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put('first', 1)
+        self.cache.put('second', 2)
+        self.cache.get('first')
+        self.cache.put('third', 3)
+
+        self.assertEqual(self.cache.get('first'), 1)
+        self.assertNotIn('second', self.cache)
+
+    def test_pop(self):
+        self.cache.put('key', 'value')
+        self.assertEqual(self.cache.pop('key'), 'value')
+        self.assertIsNone(self.cache.pop('key'))
+
+    def test_ttl_per_entry(self):
+        self.cache.put('short', 1, ttl=1.0)
+        self.cache.put('long', 2)
+        self.now = 5.0
+
+        self.assertNotIn('short', self.cache)
+        self.assertIn('long', self.cache)
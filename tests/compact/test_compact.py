@@ -0,0 +1,188 @@
+import pickle
+import unittest
+
+import alexa.compact
+import alexa.context
+
+from .. import (
+    generate_application_id, generate_consent_token, generate_device_id,
+    generate_dialog_state, generate_request_id, generate_session_ended_error_type,
+    generate_session_id, generate_timestamp, generate_user_id)
+
+
+class CompactModelTestsMixin:
+
+    def test_no_instance_dict(self):
+        # Slotted instances don't carry a per-instance __dict__
+
+        self.assertFalse(hasattr(self.model, '__dict__'))
+
+    def test_attributes(self):
+        # Check every field for its expected value, including MISSING defaults
+
+        for attribute, expected_value in self.attributes:
+            actual_value = getattr(self.model, attribute)
+            self.assertEqual(
+                actual_value, expected_value,
+                msg="Attribute '{attribute}' equals '{actual}'; expected '{expected}'".format(
+                    attribute=attribute, actual=actual_value,
+                    expected=expected_value))
+
+
+class CompactSession(CompactModelTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.test_input = {
+            'new': True,
+            'sessionId': generate_session_id(),
+            'application': {
+                'applicationId': generate_application_id(),
+            },
+            'user': {
+                'userId': generate_user_id(),
+            },
+        }
+        self.attributes = [
+            ('new', True),
+            ('session_id', self.test_input['sessionId']),
+            ('attributes', alexa.compact.MISSING),
+        ]
+
+        self.model = alexa.compact.Session(self.test_input)
+
+    def test_user(self):
+        # Absent user tokens default to MISSING
+
+        self.assertEqual(self.model.user.user_id, self.test_input['user']['userId'])
+        self.assertIs(self.model.user.consent_token, alexa.compact.MISSING)
+        self.assertIs(self.model.user.access_token, alexa.compact.MISSING)
+
+
+class CompactUserWithConsentToken(CompactModelTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.test_input = {
+            'userId': generate_user_id(),
+            'permissions': {
+                'consentToken': generate_consent_token(),
+            },
+        }
+        self.attributes = [
+            ('user_id', self.test_input['userId']),
+            ('consent_token', self.test_input['permissions']['consentToken']),
+            ('access_token', alexa.compact.MISSING),
+        ]
+
+        self.model = alexa.compact.User(self.test_input)
+
+
+class CompactDevice(CompactModelTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.test_input = {
+            'deviceId': generate_device_id(),
+            'supportedInterfaces': {
+                'AudioPlayer': {},
+            },
+        }
+        self.attributes = [
+            ('device_id', self.test_input['deviceId']),
+            ('capabilities', alexa.context.Capability.AUDIO_PLAYER),
+            ('supports_streaming', True),
+        ]
+
+        self.model = alexa.compact.Device(self.test_input)
+
+    def test_supports(self):
+        self.assertTrue(self.model.supports(alexa.context.Capability.AUDIO_PLAYER))
+        self.assertFalse(self.model.supports(alexa.context.Capability.DISPLAY))
+
+
+class CompactContext(CompactModelTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.test_input = {
+            'System': {
+                'apiEndpoint': 'https://api.amazonalexa.com',
+                'device': {
+                    'deviceId': generate_device_id(),
+                    'supportedInterfaces': {},
+                },
+            },
+        }
+        self.attributes = [
+            ('api_endpoint', 'https://api.amazonalexa.com'),
+            ('api_access_token', alexa.compact.MISSING),
+        ]
+
+        self.model = alexa.compact.Context(self.test_input)
+
+
+class CompactIntentRequest(CompactModelTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.test_input = {
+            'type': 'IntentRequest',
+            'requestId': generate_request_id(),
+            'timestamp': generate_timestamp(),
+            'locale': 'en-US',
+            'dialogState': generate_dialog_state(),
+            'intent': {
+                'name': 'my_sweet_intent',
+                'confirmationStatus': 'NONE',
+                'slots': {
+                    'slot_1': {
+                        'name': 'slot_1',
+                        'value': 'value_1',
+                        'confirmationStatus': 'NONE',
+                    },
+                },
+            },
+        }
+        self.attributes = [
+            ('request_type', 'IntentRequest'),
+            ('request_id', self.test_input['requestId']),
+            ('dialog_state', self.test_input['dialogState']),
+            ('intent_name', 'my_sweet_intent'),
+        ]
+
+        self.model = alexa.compact.parse_request(self.test_input)
+
+    def test_slots(self):
+        # Slots are parsed into slotted Slot objects
+
+        self.assertEqual(self.model.intent.slots['slot_1'].value, 'value_1')
+        self.assertFalse(hasattr(self.model.intent.slots['slot_1'], '__dict__'))
+
+
+class CompactSessionEndedRequest(CompactModelTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.test_input = {
+            'type': 'SessionEndedRequest',
+            'requestId': generate_request_id(),
+            'timestamp': generate_timestamp(),
+            'locale': 'en-US',
+            'reason': 'ERROR',
+            'error': {
+                'type': generate_session_ended_error_type(),
+            },
+        }
+        self.attributes = [
+            ('reason', 'ERROR'),
+            ('error_type', self.test_input['error']['type']),
+            ('error_message', alexa.compact.MISSING),
+        ]
+
+        self.model = alexa.compact.parse_request(self.test_input)
+
+
+class MissingSentinel(unittest.TestCase):
+
+    def test_falsy(self):
+        self.assertFalse(alexa.compact.MISSING)
+
+    def test_pickle_preserves_identity(self):
+        self.assertIs(
+            pickle.loads(pickle.dumps(alexa.compact.MISSING)),
+            alexa.compact.MISSING)
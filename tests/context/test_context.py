@@ -7,11 +7,14 @@ from .. import generate_application_id, generate_device_id, generate_user_id
 
 class ContextTests:
 
+    lazy = False
+
     BASE_INPUT = {
         'AudioPlayer': {
             'playerActivity': 'IDLE',
         },
         'System': {
+            'apiAccessToken': 'api-access-token',
             'apiEndpoint': 'https://api.amazonalexa.com',
             'application': {
                 'applicationId': '',
@@ -35,18 +38,47 @@ class ContextTests:
         self.test_input['System']['device']['deviceId'] = generate_device_id()
         self.test_input['System']['user']['userId'] = generate_user_id()
 
-        self.context = alexa.context.Context(self.test_input)
+        self.context = alexa.context.Context(self.test_input, lazy=self.lazy)
 
     def test_default_attributes(self):
         # All Context objects should have these attributes
 
-        for attribute in ['device', ]:
+        for attribute in ['device', 'api_endpoint', 'api_access_token', ]:
             self.assertTrue(
                 hasattr(self.context, attribute),
                 msg="Context object is missing expected attribute '{attribute}'".format(
                     attribute=attribute))
 
+        self.assertEqual(self.context.api_endpoint, self.test_input['System']['apiEndpoint'])
+        self.assertEqual(
+            self.context.api_access_token, self.test_input['System']['apiAccessToken'])
+
 
 class SimpleContext(ContextTests, unittest.TestCase):
 
     test_input = ContextTests.BASE_INPUT
+
+
+class NoAPIEndpoint(unittest.TestCase):
+
+    def test_missing_endpoint(self):
+        # Requests without the API fields still parse
+
+        context = alexa.context.Context({
+            'System': {'device': {'deviceId': generate_device_id(), 'supportedInterfaces': {}}},
+        })
+
+        self.assertIsNone(context.api_endpoint)
+        self.assertIsNone(context.api_access_token)
+
+
+class LazyContext(ContextTests, unittest.TestCase):
+
+    lazy = True
+    test_input = ContextTests.BASE_INPUT
+
+    def test_device_is_deferred(self):
+        # The Device is only built on first access, then cached
+
+        self.assertNotIn('device', vars(self.context))
+        self.assertIs(self.context.device, self.context.device)
@@ -0,0 +1,54 @@
+import unittest
+
+import alexa.context
+
+from .. import generate_device_id
+
+
+class DeviceCapabilitiesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.device_id = generate_device_id()
+
+    def parse(self, *interfaces):
+        return alexa.context.Device({
+            'deviceId': self.device_id,
+            'supportedInterfaces': {interface: {} for interface in interfaces},
+        })
+
+    def test_capabilities(self):
+        device = self.parse('AudioPlayer', 'Alexa.Presentation.APL', 'SomeFutureInterface')
+
+        self.assertEqual(
+            device.capabilities,
+            alexa.context.Capability.AUDIO_PLAYER | alexa.context.Capability.APL)
+        self.assertTrue(device.supports_streaming)
+        self.assertTrue(device.supports(alexa.context.Capability.APL))
+        self.assertTrue(device.supports(
+            alexa.context.Capability.AUDIO_PLAYER | alexa.context.Capability.APL))
+        self.assertFalse(device.supports(
+            alexa.context.Capability.APL | alexa.context.Capability.VIDEO_APP))
+
+    def test_no_capabilities(self):
+        device = self.parse()
+
+        self.assertEqual(device.capabilities, 0)
+        self.assertFalse(device.supports_streaming)
+        self.assertFalse(device.supports(alexa.context.Capability.DISPLAY))
+
+    def test_interfaces_change(self):
+        # A device reporting new interfaces gets its new capabilities at once
+
+        self.parse('Display')
+        device = self.parse('Display', 'VideoApp')
+
+        self.assertEqual(
+            device.capabilities,
+            alexa.context.Capability.DISPLAY | alexa.context.Capability.VIDEO_APP)
+
+    def test_device_capabilities(self):
+        # The helper shared with the compact model
+
+        self.assertEqual(
+            alexa.context.device_capabilities({'Geolocation': {}, 'Unknown': {}}),
+            alexa.context.Capability.GEOLOCATION)
@@ -0,0 +1,173 @@
+import unittest
+
+import alexa.dialog
+import alexa.request
+import alexa.session
+
+from .. import generate_application_id, generate_session_id, generate_user_id
+
+
+def ask_size(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'size'
+
+
+def ask_topping(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'topping'
+
+
+def place_order(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'done'
+
+
+def build_request(
+        name: str, dialog_state: str='IN_PROGRESS',
+        confirmation_status: str='NONE') -> alexa.request.IntentRequest:
+    return alexa.request.parse_request({
+        'type': 'IntentRequest',
+        'requestId': 'amzn1.echo-api.request.1',
+        'timestamp': '2017-01-01T00:00:00Z',
+        'locale': 'en-US',
+        'dialogState': dialog_state,
+        'intent': {
+            'name': name,
+            'confirmationStatus': confirmation_status,
+        },
+    })
+
+
+class DialogMachineTests(unittest.TestCase):
+
+    def setUp(self):
+        self.machine = alexa.dialog.DialogMachine('order', initial='size')
+        self.machine.state('size')(ask_size)
+        self.machine.state('topping')(ask_topping)
+        self.machine.add_state('confirm')
+        self.machine.state('done', final=True)(place_order)
+        self.machine.add_transition('size', 'topping', on='SizeIntent')
+        self.machine.add_transition('topping', 'done', on='ToppingIntent')
+        self.machine.add_transition(alexa.dialog.ANY_STATE, 'size', on='StartOverIntent')
+        self.machine.add_transition('size', 'confirm', on='StartOverIntent')
+
+        self.session = self.build_session({})
+
+    def build_session(self, attributes: dict) -> alexa.session.Session:
+        return alexa.session.Session({
+            'new': not attributes,
+            'sessionId': generate_session_id(),
+            'application': {'applicationId': generate_application_id()},
+            'user': {'userId': generate_user_id()},
+            'attributes': attributes,
+        })
+
+    def handle(self, intent_name: str, **conditions):
+        return self.machine.handle(
+            self.session, None, build_request(intent_name, **conditions), None)
+
+    def test_full_dialog(self):
+        self.assertEqual(self.handle('OrderIntent'), 'size')
+        self.assertEqual(self.machine.current(self.session), 'size')
+        self.assertEqual(self.handle('SizeIntent'), 'topping')
+        self.assertEqual(self.handle('ToppingIntent'), 'done')
+
+        # Finishing the dialog removes its state
+        self.assertIsNone(self.machine.current(self.session))
+        self.assertNotIn(self.machine.attribute, self.session.attributes)
+
+    def test_state_is_compact(self):
+        self.machine.step(self.session, build_request('OrderIntent'))
+        self.machine.step(self.session, build_request('SizeIntent'))
+
+        self.assertEqual(self.session.attributes.delta(), {self.machine.attribute: 'topping'})
+
+    def test_state_survives_reordering(self):
+        # Sessions keep their place when a deploy adds or reorders states
+
+        self.session = self.build_session({self.machine.attribute: 'topping'})
+        machine = alexa.dialog.DialogMachine('order', initial='size')
+        machine.add_state('greeting')
+        machine.state('done', final=True)(place_order)
+        machine.state('topping')(ask_topping)
+        machine.state('size')(ask_size)
+        machine.add_transition('topping', 'done', on='ToppingIntent')
+
+        self.assertEqual(machine.current(self.session), 'topping')
+        self.assertEqual(
+            machine.handle(self.session, None, build_request('HelpIntent'), None), 'topping')
+        self.assertEqual(
+            machine.handle(self.session, None, build_request('ToppingIntent'), None), 'done')
+
+    def test_state_survives_turns(self):
+        # A later turn picks up where the response's attributes left off
+
+        self.handle('OrderIntent')
+        self.handle('SizeIntent')
+        self.session = self.build_session(self.session.attributes.to_dict())
+
+        self.assertEqual(self.handle('ToppingIntent'), 'done')
+
+    def test_unknown_intent_stays(self):
+        # Intents without a transition prompt again without touching the state
+
+        self.session = self.build_session({self.machine.attribute: 'topping'})
+
+        self.assertEqual(self.handle('HelpIntent'), 'topping')
+        self.assertFalse(self.session.attributes.modified)
+
+    def test_any_state_transitions(self):
+        # Transitions from a specific state override those from any state
+
+        self.handle('OrderIntent')
+        self.handle('SizeIntent')
+        self.assertEqual(self.handle('StartOverIntent'), 'size')
+        self.assertEqual(self.machine.step(self.session, build_request('StartOverIntent')),
+                         'confirm')
+
+    def test_missing_handler(self):
+        self.handle('OrderIntent')
+        with self.assertRaises(RuntimeError):
+            self.handle('StartOverIntent')
+
+    def test_invalid_stored_state(self):
+        # Dialogs in a state that no longer exists start over
+
+        for stored in ['removed', 1]:
+            with self.subTest(stored=stored):
+                self.session = self.build_session({self.machine.attribute: stored})
+
+                self.assertIsNone(self.machine.current(self.session))
+                self.assertEqual(self.handle('ToppingIntent'), 'size')
+
+    def test_conditional_transitions(self):
+        # The intent's confirmation status and the dialog state pick between
+        # transitions on the same intent
+
+        self.machine.add_transition(
+            'topping', 'size', on='ToppingIntent', confirmation_status='DENIED')
+        self.machine.add_transition(
+            'topping', 'topping', on='ToppingIntent', dialog_state='STARTED')
+        self.machine.add_transition(
+            'topping', 'size', on='ToppingIntent', dialog_state='STARTED',
+            confirmation_status='CONFIRMED')
+        self.session = self.build_session({self.machine.attribute: 'topping'})
+
+        self.assertEqual(self.handle('ToppingIntent', dialog_state='STARTED'), 'topping')
+        self.assertEqual(self.handle('ToppingIntent', confirmation_status='DENIED'), 'size')
+        self.handle('SizeIntent')
+        self.assertEqual(
+            self.handle('ToppingIntent', dialog_state='STARTED', confirmation_status='CONFIRMED'),
+            'size')
+        self.handle('SizeIntent')
+        self.assertEqual(self.handle('ToppingIntent', confirmation_status='CONFIRMED'), 'done')
+
+    def test_invalid_conditions(self):
+        with self.assertRaises(ValueError):
+            self.machine.add_transition('size', 'topping', on='SizeIntent', dialog_state='DONE')
+        with self.assertRaises(ValueError):
+            self.machine.add_transition(
+                'size', 'topping', on='SizeIntent', confirmation_status='MAYBE')
+
+    def test_unknown_states(self):
+        self.machine.add_transition('size', 'checkout', on='CheckoutIntent')
+
+        with self.assertRaises(ValueError):
+            self.machine.compile()
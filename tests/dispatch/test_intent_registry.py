@@ -0,0 +1,158 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import alexa.dispatch
+import alexa.request
+
+from .. import generate_request_id, generate_timestamp
+
+
+def handle_weather(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'weather'
+
+
+def handle_fallback(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'fallback'
+
+
+class IntentRegistryTestsMixin:
+
+    INTENT_REQUEST = {
+        'type': 'IntentRequest',
+        'requestId': '',
+        'timestamp': '',
+        'locale': 'en-US',
+        'intent': {
+            'name': 'GetWeather',
+            'confirmationStatus': 'NONE',
+        },
+    }
+
+    LAUNCH_REQUEST = {
+        'type': 'LaunchRequest',
+        'requestId': '',
+        'timestamp': '',
+        'locale': 'en-US',
+    }
+
+    def setUp(self):
+        # Randomize some input and build the registry under test
+
+        for request_data in [self.INTENT_REQUEST, self.LAUNCH_REQUEST]:
+            request_data['requestId'] = generate_request_id()
+            request_data['timestamp'] = generate_timestamp()
+
+        self.registry = self.build_registry()
+
+    def test_resolve_intent(self):
+        # Intent requests resolve by intent name
+
+        handler = self.registry.resolve(
+            alexa.request.parse_request(self.INTENT_REQUEST))
+
+        self.assertEqual(handler(None, None, None, None), 'weather')
+
+    def test_resolve_unknown_intent(self):
+        # Unknown intents go to the fallback instead of raising
+
+        self.assertIs(self.registry.resolve_name('NoSuchIntent'), handle_fallback)
+
+    def test_resolve_is_cached(self):
+        # Repeated lookups return the same handler object
+
+        self.assertIs(
+            self.registry.resolve_name('GetWeather'),
+            self.registry.resolve_name('GetWeather'))
+
+
+class RegisteredFunctions(IntentRegistryTestsMixin, unittest.TestCase):
+
+    def build_registry(self):
+        return alexa.dispatch.IntentRegistry(
+            {'GetWeather': handle_weather}, fallback=handle_fallback)
+
+    def test_resolve_request_type(self):
+        # Non-intent requests resolve by request type
+
+        self.registry.register('LaunchRequest', handle_weather)
+        handler = self.registry.resolve(
+            alexa.request.parse_request(self.LAUNCH_REQUEST))
+
+        self.assertIs(handler, handle_weather)
+
+
+class DiscoveredPackage(IntentRegistryTestsMixin, unittest.TestCase):
+
+    PACKAGE_NAME = 'registry_test_intents'
+
+    @classmethod
+    def setUpClass(cls):
+        # Write a throwaway handler package and put it on the path
+
+        cls.package_root = tempfile.TemporaryDirectory()
+        package_path = os.path.join(cls.package_root.name, cls.PACKAGE_NAME)
+        os.mkdir(package_path)
+        open(os.path.join(package_path, '__init__.py'), 'w').close()
+        with open(os.path.join(package_path, 'GetWeather.py'), 'w') as module:
+            module.write(
+                'def handle_intent(alexa_session, alexa_user, alexa_request, alexa_context):\n'
+                "    return 'weather'\n")
+        with open(os.path.join(package_path, '_helpers.py'), 'w') as module:
+            module.write('')
+
+        # Built-in intents live in subpackages named after their namespace
+        amazon_path = os.path.join(package_path, 'AMAZON')
+        os.mkdir(amazon_path)
+        open(os.path.join(amazon_path, '__init__.py'), 'w').close()
+        with open(os.path.join(amazon_path, 'HelpIntent.py'), 'w') as module:
+            module.write(
+                'def handle_intent(alexa_session, alexa_user, alexa_request, alexa_context):\n'
+                "    return 'help'\n")
+
+        sys.path.insert(0, cls.package_root.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path.remove(cls.package_root.name)
+        for name in list(sys.modules):
+            if name.startswith(cls.PACKAGE_NAME):
+                del sys.modules[name]
+        cls.package_root.cleanup()
+
+    def build_registry(self):
+        return alexa.dispatch.IntentRegistry.discover(
+            self.PACKAGE_NAME, fallback=handle_fallback)
+
+    def test_discovered_modules(self):
+        # Private modules, and subpackages without a handler, are skipped
+        # during discovery
+
+        self.assertEqual(len(self.registry), 2)
+        self.assertIn('GetWeather', self.registry)
+        self.assertNotIn('AMAZON', self.registry)
+        self.assertEqual(
+            self.registry.manifest(),
+            {
+                'GetWeather': '.'.join([self.PACKAGE_NAME, 'GetWeather']),
+                'AMAZON.HelpIntent': '.'.join([self.PACKAGE_NAME, 'AMAZON', 'HelpIntent']),
+            })
+
+    def test_resolve_builtin_intent(self):
+        # Built-in intents resolve to modules in their namespace's subpackage
+
+        self.assertEqual(
+            self.registry.resolve_name('AMAZON.HelpIntent')(None, None, None, None), 'help')
+
+
+class ManifestFile(IntentRegistryTestsMixin, unittest.TestCase):
+
+    def build_registry(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as manifest:
+            json.dump({'GetWeather': ':'.join([__name__, 'handle_weather'])}, manifest)
+        self.addCleanup(os.remove, manifest.name)
+
+        return alexa.dispatch.IntentRegistry.from_manifest(
+            manifest.name, fallback=handle_fallback)
@@ -0,0 +1,83 @@
+import unittest
+
+import alexa.request
+import alexa.resolution
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+else:
+    import alexa.fuzzy
+
+CATALOG = [
+    {'id': 'SKU-1', 'name': {'value': 'Pepperoni Pizza', 'synonyms': ['pepperoni pie']}},
+    {'id': 'SKU-2', 'name': {'value': 'Margherita Pizza', 'synonyms': ['cheese pizza']}},
+    {'id': 'SKU-3', 'name': {'value': 'Garlic Bread'}},
+    {'id': 'SKU-4', 'name': {'value': 'Crème Brûlée'}},
+]
+
+
+@unittest.skipUnless(numpy, 'NumPy is not installed')
+class FuzzyMatcherTests(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = alexa.fuzzy.FuzzyMatcher(alexa.resolution.SlotCatalog(CATALOG))
+
+    def test_near_miss(self):
+        candidates = self.matcher.match('peperoni piza')
+
+        self.assertEqual(candidates[0].id, 'SKU-1')
+        self.assertEqual(candidates[0].matched, 'pepperoni pizza')
+        self.assertLess(candidates[0].score, 1.0)
+        self.assertEqual(
+            [candidate.score for candidate in candidates],
+            sorted((candidate.score for candidate in candidates), reverse=True))
+
+    def test_exact_scores_one(self):
+        self.assertEqual(self.matcher.match('creme brulee', k=1), [
+            ('SKU-4', 'Crème Brûlée', 'creme brulee', 1.0)])
+
+    def test_best_synonym_per_entry(self):
+        # Each entry is listed once, by its most similar value or synonym
+
+        candidates = self.matcher.match('cheese piza')
+        ids = [candidate.id for candidate in candidates]
+
+        self.assertEqual(ids[0], 'SKU-2')
+        self.assertEqual(candidates[0].matched, 'cheese pizza')
+        self.assertEqual(len(ids), len(set(ids)))
+
+    def test_limits(self):
+        self.assertEqual(len(self.matcher.match('pizza', k=1)), 1)
+        self.assertTrue(all(
+            candidate.score > 0.5 for candidate in self.matcher.match('pizza', min_score=0.5)))
+
+    def test_no_match(self):
+        self.assertEqual(self.matcher.match('xyzzy'), [])
+        self.assertEqual(self.matcher.match(''), [])
+        self.assertEqual(self.matcher.match(None), [])
+
+    def test_scores_every_phrase(self):
+        scores = self.matcher.scores('garlic bread')
+
+        self.assertEqual(len(scores), len(self.matcher))
+        self.assertEqual(scores.argmax(), 4)
+
+    def test_intent_slots(self):
+        intent = alexa.request.Intent({
+            'confirmationStatus': 'NONE',
+            'name': 'OrderIntent',
+            'slots': {
+                'Product': {
+                    'confirmationStatus': 'NONE',
+                    'name': 'Product',
+                    'value': 'garlik bred',
+                },
+            },
+        })
+
+        self.assertEqual(intent.slots['Product'].matches(self.matcher, k=1)[0].id, 'SKU-3')
+        matches = intent.match_slots({'Product': self.matcher, 'Size': self.matcher}, k=2)
+        self.assertEqual(list(matches), ['Product'])
+        self.assertEqual(len(matches['Product']), 2)
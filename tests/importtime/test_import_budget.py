@@ -0,0 +1,67 @@
+import unittest
+
+from benchmarks.importtime import TIME_BUDGETS_US, measure_import, over_budget
+
+#: Multiple of each module's benchmark time budget allowed in the unit tests.
+#: Wide enough that a busy machine doesn't fail them, while still catching a
+#: module that gets several times slower to import.
+TIME_MARGIN = 2
+
+
+class ImportBudgetTestsMixin:
+
+    deferred = ()
+
+    def setUp(self):
+        # Import the module in fresh interpreters and keep the fastest run
+
+        self.report = measure_import(self.module)
+
+    def test_module_count(self):
+        # Modules loaded beyond a bare interpreter; heavy dependencies such as
+        # asyncio or json must be imported where they're used
+
+        self.assertLessEqual(
+            self.report['module_count'], self.max_modules,
+            msg="Importing '{module}' loads {count} modules; budget is {budget}: {modules}".format(
+                module=self.module, count=self.report['module_count'],
+                budget=self.max_modules, modules=', '.join(self.report['modules'])))
+
+    def test_deferred_modules(self):
+        # Modules only some invocations need aren't loaded at cold start
+
+        for module in self.deferred:
+            self.assertNotIn(module, self.report['modules'])
+
+    def test_import_time(self):
+        # Precise budgets are checked by ``python -m benchmarks.importtime
+        # --check`` on a quiet machine; this only catches large regressions
+
+        budget = TIME_BUDGETS_US[self.module] * TIME_MARGIN
+        self.assertLessEqual(
+            self.report['total_us'], budget,
+            msg="Importing '{module}' took {actual} us; budget is {budget} us".format(
+                module=self.module, actual=self.report['total_us'], budget=budget))
+
+
+class AlexaPackage(ImportBudgetTestsMixin, unittest.TestCase):
+
+    module = 'alexa'
+    max_modules = 2
+
+
+class LambdaHandlerModule(ImportBudgetTestsMixin, unittest.TestCase):
+
+    module = 'lambda_handler'
+    max_modules = 25
+    deferred = ('alexa.store', 'asyncio', 'json')
+
+
+class OverBudgetTests(unittest.TestCase):
+
+    def test_over_budget(self):
+        self.assertTrue(over_budget({'module': 'alexa', 'total_us': 10001}))
+        self.assertFalse(over_budget({'module': 'alexa', 'total_us': 10000}))
+
+    def test_no_budget(self):
+        self.assertFalse(over_budget({'module': 'alexa.ssml', 'total_us': 10 ** 9}))
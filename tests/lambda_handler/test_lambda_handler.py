@@ -0,0 +1,211 @@
+import copy
+import unittest
+
+import alexa.dispatch
+import alexa.response
+import lambda_handler
+
+from .. import (
+    generate_application_id, generate_device_id, generate_request_id,
+    generate_session_id, generate_timestamp, generate_user_id)
+
+
+def handle_weather(alexa_session, alexa_user, alexa_request, alexa_context):
+    return {
+        'intent': alexa_request.intent.name,
+        'user_id': alexa_user.user_id,
+        'device_id': alexa_context.device.device_id,
+    }
+
+
+async def handle_weather_async(alexa_session, alexa_user, alexa_request, alexa_context):
+    return handle_weather(alexa_session, alexa_user, alexa_request, alexa_context)
+
+
+def handle_goodbye(alexa_session, alexa_user, alexa_request, alexa_context):
+    return alexa.response.ResponseBuilder(alexa.response.PLAIN_TEXT, 'Goodbye!')
+
+
+def handle_failure(alexa_session, alexa_user, alexa_request, alexa_context):
+    raise RuntimeError('backend unavailable')
+
+
+class LambdaHandlerTestsMixin:
+
+    BASE_INPUT = {
+        'version': '1.0',
+        'session': {
+            'new': True,
+            'sessionId': '',
+            'application': {
+                'applicationId': '',
+            },
+            'user': {
+                'userId': '',
+            },
+        },
+        'context': {
+            'System': {
+                'application': {
+                    'applicationId': '',
+                },
+                'device': {
+                    'deviceId': '',
+                    'supportedInterfaces': {},
+                },
+                'user': {
+                    'userId': '',
+                },
+            },
+        },
+        'request': {
+            'type': 'IntentRequest',
+            'requestId': '',
+            'timestamp': '',
+            'locale': 'en-US',
+            'intent': {
+                'name': '',
+                'confirmationStatus': 'NONE',
+            },
+        },
+    }
+
+    def setUp(self):
+        # Randomize some input and build a registry with a single intent
+
+        self.test_input = copy.deepcopy(self.BASE_INPUT)
+        application_id = generate_application_id()
+        user_id = generate_user_id()
+
+        self.test_input['session']['sessionId'] = generate_session_id()
+        self.test_input['session']['application']['applicationId'] = application_id
+        self.test_input['session']['user']['userId'] = user_id
+        self.test_input['context']['System']['application']['applicationId'] = application_id
+        self.test_input['context']['System']['user']['userId'] = user_id
+        self.test_input['context']['System']['device']['deviceId'] = generate_device_id()
+        self.test_input['request']['requestId'] = generate_request_id()
+        self.test_input['request']['timestamp'] = generate_timestamp()
+        self.test_input['request']['intent']['name'] = self.intent_name
+
+        self.registry = alexa.dispatch.IntentRegistry({
+            'GetWeather': handle_weather,
+            'Fail': handle_failure,
+            'GetWeatherAsync': handle_weather_async,
+            'Goodbye': handle_goodbye,
+        })
+
+
+class KnownIntent(LambdaHandlerTestsMixin, unittest.TestCase):
+
+    intent_name = 'GetWeather'
+
+    def test_dispatch(self):
+        # The registered handler receives the parsed event
+
+        response = lambda_handler.lambda_handler(
+            self.test_input, None, registry=self.registry)
+
+        self.assertEqual(response, {
+            'intent': 'GetWeather',
+            'user_id': self.test_input['session']['user']['userId'],
+            'device_id': self.test_input['context']['System']['device']['deviceId'],
+        })
+
+
+class UnknownIntent(LambdaHandlerTestsMixin, unittest.TestCase):
+
+    intent_name = 'NoSuchIntent'
+
+    def test_dispatch(self):
+        # Unknown intents are answered by the fallback handler
+
+        response = lambda_handler.lambda_handler(
+            self.test_input, None, registry=self.registry)
+
+        self.assertEqual(response['response']['outputSpeech']['type'], 'PlainText')
+
+
+class BuilderResponse(LambdaHandlerTestsMixin, unittest.TestCase):
+
+    intent_name = 'Goodbye'
+
+    def test_builder_is_built(self):
+        # Handlers may return a ResponseBuilder instead of a dict
+
+        response = lambda_handler.lambda_handler(
+            self.test_input, None, registry=self.registry)
+
+        self.assertEqual(response['response']['outputSpeech']['text'], 'Goodbye!')
+
+
+class AsyncHandlers(LambdaHandlerTestsMixin, unittest.TestCase):
+
+    intent_name = 'GetWeatherAsync'
+
+    def test_coroutine_handler(self):
+        # Coroutine handlers are awaited
+
+        response = lambda_handler.async_lambda_handler(
+            self.test_input, None, registry=self.registry)
+
+        self.assertEqual(response['intent'], 'GetWeatherAsync')
+
+    def test_plain_handler(self):
+        # Plain handlers keep working from the async entry point
+
+        self.test_input['request']['intent']['name'] = 'GetWeather'
+        response = lambda_handler.async_lambda_handler(
+            self.test_input, None, registry=self.registry)
+
+        self.assertEqual(response['intent'], 'GetWeather')
+
+
+class BatchOfEvents(LambdaHandlerTestsMixin, unittest.TestCase):
+
+    intent_name = 'GetWeather'
+
+    def build_batch(self, size: int) -> list:
+        # Give each event its own request ID so results can be matched up
+
+        batch = []
+        for _ in range(size):
+            event = copy.deepcopy(self.test_input)
+            event['request']['requestId'] = generate_request_id()
+            batch.append(event)
+
+        return batch
+
+    def test_results_in_input_order(self):
+        # Responses come back in input order, even from an iterator
+
+        batch = self.build_batch(50)
+        results = lambda_handler.batch_handler(
+            iter(batch), None, registry=self.registry, max_workers=4)
+
+        self.assertEqual(len(results), len(batch))
+        for result, event in zip(results, batch):
+            self.assertEqual(
+                result['response']['device_id'],
+                event['context']['System']['device']['deviceId'])
+
+    def test_per_item_errors(self):
+        # A failing event is reported without failing the rest of the batch
+
+        batch = self.build_batch(3)
+        batch[1]['request']['intent']['name'] = 'Fail'
+        del batch[2]['session']
+
+        results = lambda_handler.batch_handler(batch, None, registry=self.registry)
+
+        self.assertIn('response', results[0])
+        self.assertEqual(results[1], {
+            'error': {
+                'type': 'RuntimeError',
+                'message': 'backend unavailable',
+            },
+        })
+        self.assertEqual(results[2]['error']['type'], 'KeyError')
+
+    def test_empty_batch(self):
+        self.assertEqual(
+            lambda_handler.batch_handler([], None, registry=self.registry), [])
@@ -0,0 +1,102 @@
+import contextlib
+import copy
+import io
+import json
+import unittest
+
+import alexa.metrics
+import lambda_handler
+
+from ..lambda_handler.test_lambda_handler import LambdaHandlerTestsMixin
+
+
+class PhaseMetricsTestsMixin(LambdaHandlerTestsMixin):
+
+    intent_name = 'GetWeather'
+
+    def setUp(self):
+        super().setUp()
+
+        enabled = alexa.metrics.enabled
+        alexa.metrics.enabled = self.enabled
+        self.addCleanup(setattr, alexa.metrics, 'enabled', enabled)
+
+    def invoke(self, event: dict) -> list:
+        # Run an event through the handler and return the lines it logged
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            try:
+                lambda_handler.lambda_handler(event, None, registry=self.registry)
+            except KeyError:
+                pass
+
+        return output.getvalue().splitlines()
+
+
+class MetricsEnabled(PhaseMetricsTestsMixin, unittest.TestCase):
+
+    enabled = True
+
+    def test_one_line_per_invocation(self):
+        lines = self.invoke(self.test_input)
+
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0])
+
+        self.assertEqual(record['Intent'], 'GetWeather')
+        self.assertEqual(record['RequestId'], self.test_input['request']['requestId'])
+        for phase in alexa.metrics.PHASES + ('Total', ):
+            self.assertIsInstance(record[phase], float, msg=phase)
+
+    def test_embedded_metric_format(self):
+        # Every timed phase is declared as a metric under the Intent dimension
+
+        record = json.loads(self.invoke(self.test_input)[0])
+        directive = record['_aws']['CloudWatchMetrics'][0]
+
+        self.assertIsInstance(record['_aws']['Timestamp'], int)
+        self.assertEqual(directive['Namespace'], alexa.metrics.NAMESPACE)
+        self.assertEqual(directive['Dimensions'], [['Intent']])
+        self.assertEqual(
+            [metric['Name'] for metric in directive['Metrics']],
+            list(alexa.metrics.PHASES) + ['Total'])
+
+    def test_failed_invocation(self):
+        # Phases completed before a failure are still reported
+
+        event = copy.deepcopy(self.test_input)
+        del event['context']
+        record = json.loads(self.invoke(event)[0])
+
+        self.assertEqual(record['Intent'], 'Unknown')
+        self.assertIn('UserParse', record)
+        self.assertNotIn('HandlerExecution', record)
+
+    def test_malformed_intent(self):
+        # Reporting a request whose intent can't be parsed doesn't replace
+        # the original error
+
+        event = copy.deepcopy(self.test_input)
+        del event['request']['intent']['confirmationStatus']
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            with self.assertRaises(KeyError) as raised:
+                lambda_handler.lambda_handler(event, None, registry=self.registry)
+
+        self.assertEqual(raised.exception.args, ('confirmationStatus', ))
+        self.assertEqual(json.loads(output.getvalue())['Intent'], 'GetWeather')
+
+
+class MetricsDisabled(PhaseMetricsTestsMixin, unittest.TestCase):
+
+    enabled = False
+
+    def test_nothing_logged(self):
+        self.assertEqual(self.invoke(self.test_input), [])
+
+    def test_shared_timer(self):
+        # Disabled timers aren't allocated per invocation
+
+        self.assertIs(alexa.metrics.start_timer(), alexa.metrics.start_timer())
@@ -0,0 +1,124 @@
+import threading
+import time
+import unittest
+
+import alexa.profile
+import alexa.session
+
+from .. import generate_user_id
+
+
+class ProfileCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.fetched = []
+        self.profiles = {}
+        self.release = threading.Event()
+        self.release.set()
+
+        self.cache = alexa.profile.ProfileCache(self.fetch)
+        self.user = alexa.session.User({'userId': generate_user_id()})
+
+    def tearDown(self):
+        alexa.session.User.profile_cache = None
+
+    def fetch(self, alexa_user):
+        self.fetched.append(alexa_user.user_id)
+        self.release.wait(1)
+        profile = self.profiles.get(alexa_user.user_id)
+        if isinstance(profile, Exception):
+            raise profile
+
+        return profile
+
+    def test_cached(self):
+        self.profiles[self.user.user_id] = {'name': 'Ada'}
+
+        self.assertEqual(self.cache.get(self.user), {'name': 'Ada'})
+        self.assertEqual(self.cache.get(self.user), {'name': 'Ada'})
+        self.assertEqual(len(self.fetched), 1)
+
+    def test_negative_cached(self):
+        # Users without a profile aren't fetched again on every turn
+
+        self.assertIsNone(self.cache.get(self.user))
+        self.assertIsNone(self.cache.get(self.user))
+        self.assertEqual(len(self.fetched), 1)
+
+    def test_negative_ttl(self):
+        self.cache.negative_ttl = 0
+
+        self.cache.get(self.user)
+        self.cache.get(self.user)
+        self.assertEqual(len(self.fetched), 2)
+
+    def test_errors_not_cached(self):
+        self.profiles[self.user.user_id] = KeyError('profile')
+
+        with self.assertRaises(KeyError):
+            self.cache.get(self.user)
+
+        self.profiles[self.user.user_id] = {'name': 'Ada'}
+        self.assertEqual(self.cache.get(self.user), {'name': 'Ada'})
+
+    def test_single_fetch_while_loading(self):
+        # Requests for a profile that's still loading share one fetch
+
+        self.release.clear()
+        self.profiles[self.user.user_id] = {'name': 'Ada'}
+
+        future = self.cache.prefetch(self.user)
+        self.assertIs(self.cache.prefetch(self.user), future)
+        self.release.set()
+
+        self.assertEqual(self.cache.get(self.user), {'name': 'Ada'})
+        self.assertEqual(len(self.fetched), 1)
+        self.assertIsNone(self.cache.prefetch(self.user))
+
+    def test_timeout(self):
+        self.release.clear()
+
+        with self.assertRaises(TimeoutError):
+            self.cache.get(self.user, timeout=0.01)
+
+        self.release.set()
+
+    def test_invalidate(self):
+        self.profiles[self.user.user_id] = {'name': 'Ada'}
+        self.cache.get(self.user)
+
+        self.profiles[self.user.user_id] = {'name': 'Grace'}
+        self.cache.invalidate(self.user.user_id)
+        self.assertEqual(self.cache.get(self.user), {'name': 'Grace'})
+
+
+class AttachedProfileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.started = threading.Event()
+
+        def fetch(alexa_user):
+            self.started.set()
+            time.sleep(0.05)
+
+            return {'user_id': alexa_user.user_id}
+
+        self.cache = alexa.profile.ProfileCache(fetch).attach()
+
+    def tearDown(self):
+        alexa.session.User.profile_cache = None
+
+    def test_prefetch_on_parse(self):
+        # Parsing a user starts loading their profile
+
+        user_id = generate_user_id()
+        alexa_user = alexa.session.User({'userId': user_id})
+
+        self.assertTrue(self.started.wait(1))
+        self.assertEqual(alexa_user.profile, {'user_id': user_id})
+
+    def test_not_attached(self):
+        alexa.session.User.profile_cache = None
+
+        with self.assertRaises(RuntimeError):
+            alexa.session.User({'userId': generate_user_id()}).profile
@@ -0,0 +1,85 @@
+import json
+import time
+import unittest
+
+import alexa.api
+import alexa.context
+import alexa.progressive
+import alexa.request
+import alexa.ssml
+
+from .. import StubAPIServer, generate_device_id, generate_request_id, generate_timestamp
+
+
+class ProgressiveResponseTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubAPIServer({
+            ('POST', alexa.progressive.DIRECTIVES_PATH): (204, b''),
+        })
+        self.server.__enter__()
+
+        self.alexa_request = alexa.request.parse_request({
+            'type': 'LaunchRequest',
+            'requestId': generate_request_id(),
+            'timestamp': generate_timestamp(),
+            'locale': 'en-US',
+        })
+        self.alexa_context = self.parse_context(self.server.endpoint)
+
+    def tearDown(self):
+        alexa.api.get_client(self.server.endpoint).close()
+        self.server.__exit__(None, None, None)
+
+    @staticmethod
+    def parse_context(endpoint: str) -> alexa.context.Context:
+        return alexa.context.Context({
+            'System': {
+                'apiAccessToken': 'api-access-token',
+                'apiEndpoint': endpoint,
+                'device': {'deviceId': generate_device_id(), 'supportedInterfaces': {}},
+            },
+        })
+
+    def test_directive(self):
+        future = alexa.progressive.send(
+            self.alexa_request, self.alexa_context,
+            alexa.ssml.Speech('One moment'))
+        self.assertIsNone(future.result(1))
+
+        _, _, headers, body, _ = self.server.requests[0]
+        self.assertEqual(headers['Authorization'], 'Bearer api-access-token')
+        self.assertEqual(json.loads(body), {
+            'header': {'requestId': self.alexa_request.request_id},
+            'directive': {
+                'type': 'VoicePlayer.Speak',
+                'speech': '<speak>One moment</speak>',
+            },
+        })
+
+    def test_does_not_block(self):
+        # The handler carries on while the directive is being delivered
+
+        self.server.delay = 0.2
+
+        start = time.monotonic()
+        future = alexa.progressive.send(self.alexa_request, self.alexa_context, 'One moment')
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        self.assertTrue(self.server.received.wait(1))
+        future.result(1)
+
+    def test_failure_reported_by_future(self):
+        self.server.responses.clear()
+
+        future = alexa.progressive.send(self.alexa_request, self.alexa_context, 'One moment')
+
+        self.assertIsInstance(future.exception(1), alexa.api.APIError)
+
+    def test_no_endpoint(self):
+        alexa_context = alexa.context.Context({
+            'System': {'device': {'deviceId': generate_device_id(), 'supportedInterfaces': {}}},
+        })
+
+        with self.assertRaises(ValueError):
+            alexa.progressive.send(self.alexa_request, alexa_context, 'One moment')
@@ -9,6 +9,8 @@ from .. import (
 
 class IntentRequestTestsMixin:
 
+    lazy = False
+
     BASE_INPUT = {
         'type': 'IntentRequest',
         'requestId': '',
@@ -27,7 +29,7 @@ class IntentRequestTestsMixin:
         self.test_input['timestamp'] = generate_timestamp()
         self.test_input['intent']['confirmationStatus'] = generate_confirmation_status()
 
-        self.intent_request = alexa.request.IntentRequest(self.test_input)
+        self.intent_request = alexa.request.IntentRequest(self.test_input, lazy=self.lazy)
 
     def test_default_attributes(self):
         # All IntentRequests should have these attributes
@@ -55,6 +57,9 @@ class IntentRequestTestsMixin:
             hasattr(self.intent_request, 'intent'),
             msg="IntentRequest is missing expected attribute 'intent'")
 
+    def test_intent_name(self):
+        self.assertEqual(self.intent_request.intent_name, self.test_input['intent']['name'])
+
     def test_dialog_state_attribute(self):
         # Check the dialog_state if it's in the input
 
@@ -81,3 +86,29 @@ class SimpleIntentRequest(IntentRequestTestsMixin, unittest.TestCase):
 
     test_input = IntentRequestTestsMixin.BASE_INPUT
     test_input['dialogState'] = generate_dialog_state()
+
+
+class LazyIntentRequest(IntentRequestTestsMixin, unittest.TestCase):
+
+    lazy = True
+    test_input = IntentRequestTestsMixin.BASE_INPUT
+
+    def test_intent_is_deferred(self):
+        # The Intent and its Slots are only built on first access, then cached
+
+        self.assertNotIn('intent', vars(self.intent_request))
+        intent = self.intent_request.intent
+        self.assertIs(intent, self.intent_request.intent)
+        self.assertNotIn('slots', vars(intent))
+        self.assertEqual(intent.slots, {})
+
+    def test_intent_name_of_malformed_intent(self):
+        # The name is read without building the Intent, which would fail
+
+        request = alexa.request.IntentRequest(
+            dict(self.test_input, intent={'name': 'my_sweet_intent'}), lazy=True)
+
+        self.assertEqual(request.intent_name, 'my_sweet_intent')
+        self.assertNotIn('intent', vars(request))
+        with self.assertRaises(KeyError):
+            request.intent
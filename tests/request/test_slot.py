@@ -44,3 +44,15 @@ class SlotTestsMixin:
 class SimpleSlot(SlotTestsMixin, unittest.TestCase):
 
     test_input = SlotTestsMixin.BASE_INPUT
+
+
+class UnfilledSlot(SlotTestsMixin, unittest.TestCase):
+    """Test a Slot the user hasn't filled, which has no value"""
+
+    test_input = {
+        'name': 'unfilled_slot',
+        'confirmationStatus': '',
+    }
+
+    def test_default_attributes(self):
+        self.assertIsNone(self.slot.value)
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+import unittest
+
+import alexa.request
+import alexa.resolution
+
+CATALOG = {
+    'name': 'Product',
+    'values': [
+        {
+            'id': 'SKU-1',
+            'name': {
+                'value': 'Pepperoni Pizza',
+                'synonyms': ['pepperoni pie', 'pepperoni'],
+            },
+        },
+        {
+            'id': 'SKU-2',
+            'name': {
+                'value': 'Crème Brûlée',
+            },
+        },
+        {
+            'id': 'SKU-3',
+            'name': {
+                'value': 'Pepperoni',
+            },
+        },
+        {
+            'name': {
+                'value': 'Garlic Bread',
+            },
+        },
+    ],
+}
+
+
+class SlotCatalogTests(unittest.TestCase):
+
+    def setUp(self):
+        self.catalog = alexa.resolution.SlotCatalog(CATALOG['values'])
+
+    def test_normalize(self):
+        self.assertEqual(alexa.resolution.normalize('  Crème-Brûlée!! '), 'creme brulee')
+
+    def test_exact(self):
+        # Values and synonyms match regardless of case, accents or punctuation
+
+        self.assertEqual(
+            self.catalog.resolve('pepperoni pie'),
+            ('SKU-1', 'Pepperoni Pizza', 'pepperoni pie', True))
+        self.assertEqual(self.catalog.resolve('creme brulee').id, 'SKU-2')
+        self.assertEqual(self.catalog.resolve('Garlic-Bread').id, 'Garlic Bread')
+
+    def test_first_entry_wins(self):
+        self.assertEqual(self.catalog.resolve('pepperoni').id, 'SKU-1')
+
+    def test_longest_contained_match(self):
+        match = self.catalog.resolve('a large pepperoni pizza please')
+
+        self.assertEqual(match.id, 'SKU-1')
+        self.assertEqual(match.matched, 'pepperoni pizza')
+        self.assertFalse(match.exact)
+
+    def test_no_match(self):
+        self.assertIsNone(self.catalog.resolve('anchovies'))
+        self.assertIsNone(self.catalog.resolve('pizza'))
+        self.assertIsNone(self.catalog.resolve(''))
+        self.assertIsNone(self.catalog.resolve(None))
+
+    def test_slot(self):
+        slot = alexa.request.Slot({
+            'confirmationStatus': 'NONE',
+            'name': 'Product',
+            'value': 'the pepperoni pie',
+        })
+
+        self.assertEqual(slot.resolve(self.catalog).matched, 'pepperoni pie')
+
+        slot.value = 'garlic knots'
+        self.assertIsNone(slot.resolve(self.catalog))
+
+
+class LoadCatalog(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'products.json')
+        with open(self.path, 'w', encoding='utf-8') as catalog_file:
+            json.dump(CATALOG, catalog_file)
+        self.addCleanup(alexa.resolution._catalogs.pop, self.path, None)
+
+    def test_shared(self):
+        # The index is built once per process
+
+        catalog = alexa.resolution.load_catalog(self.path)
+
+        self.assertEqual(len(catalog), 4)
+        self.assertIs(alexa.resolution.load_catalog(self.path), catalog)
@@ -38,6 +38,20 @@ class CardTestsMixin:
             msg='Rendered Card output is incorrect'
         )
 
+    def test_render_output(self):
+        # Check the full rendered structure, including image URL keys
+
+        self.assertEqual(self.card.render(), self.output)
+
+    def test_render_follows_changes(self):
+        # A Card modified after it's rendered renders its new contents
+
+        self.card.render()
+        self.card.text = 'Changed text'
+
+        self.assertIn('Changed text', self.card.render().values())
+        self.assertIn(b'Changed text', self.card.to_json_bytes())
+
 
 class SimpleCard(CardTestsMixin, unittest.TestCase):
 
@@ -134,3 +148,58 @@ class StandardCardWithEverything(CardTestsMixin, unittest.TestCase):
         'title': CardTestsMixin.CARD_TITLE,
         'type': 'Standard',
     }
+
+
+class CardValidation(unittest.TestCase):
+
+    def test_non_string_input(self):
+        for args, kwargs in [
+            ([42], {}),
+            (['text'], {'title': 42}),
+            (['text'], {'large_image': b'https://coolstuff.com/image.png'}),
+        ]:
+            with self.assertRaises(TypeError):
+                alexa.response.Card(*args, **kwargs)
+
+    def test_card_too_long(self):
+        with self.assertRaises(ValueError):
+            alexa.response.Card(
+                'x' * alexa.response.Card.MAX_CARD_LENGTH, title='x')
+
+    def test_bad_image_urls(self):
+        for url in [
+            'http://coolstuff.com/image.jpg',
+            'https://localhost/image.jpg',
+            '/image.jpg',
+            'https://coolstuff.com/image.gif',
+        ]:
+            with self.assertRaises(ValueError, msg=url):
+                alexa.response.Card('text', small_image=url)
+
+    def test_image_urls_are_cached(self):
+        # Repeated image URL's are only parsed once
+
+        url = 'https://coolstuff.com/cached/IMAGE.PNG'
+        alexa.response.Card('text', small_image=url)
+        hits = alexa.response._image_url_error.cache_info().hits
+        alexa.response.Card('other text', large_image=url)
+
+        self.assertEqual(alexa.response._image_url_error.cache_info().hits, hits + 1)
+
+
+class SharedCard(unittest.TestCase):
+
+    def test_same_inputs_share_a_card(self):
+        first = alexa.response.Card.shared(
+            CardTestsMixin.CARD_TEXT, title=CardTestsMixin.CARD_TITLE)
+        second = alexa.response.Card.shared(
+            CardTestsMixin.CARD_TEXT, title=CardTestsMixin.CARD_TITLE)
+
+        self.assertIs(first, second)
+        self.assertIs(first.render(), second.render())
+        self.assertIs(first.to_json_bytes(), second.to_json_bytes())
+
+    def test_different_inputs(self):
+        self.assertIsNot(
+            alexa.response.Card.shared(CardTestsMixin.CARD_TEXT),
+            alexa.response.Card.shared(CardTestsMixin.CARD_TITLE))
@@ -0,0 +1,176 @@
+import json
+import sys
+import unittest
+import unittest.mock
+
+import alexa.response
+import alexa.session
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Floats whose formatting differs between encoders
+AWKWARD_FLOATS = [
+    0.1, -0.0, 1e16, 1.5e-7, 1e300, 5e-324, 123456789012345680.0,
+    float('nan'), float('inf'), float('-inf'),
+]
+
+
+class JsonEncodingTestsMixin:
+
+    def test_round_trip(self):
+        # Encoded bytes decode back to the built response
+
+        self.assertEqual(json.loads(self.builder.to_json_bytes()), self.builder.build())
+
+    def test_matches_generic_encoding(self):
+        # Fragment assembly produces exactly what encoding the dict would
+
+        self.assertEqual(
+            self.builder.to_json_bytes(),
+            alexa.response.to_json_bytes(self.builder.build()))
+
+    def test_encoded_size(self):
+        # Size is computed without encoding and matches the real encoding
+
+        self.assertEqual(
+            self.builder.encoded_size(), len(self.builder.to_json_bytes()))
+        self.assertEqual(
+            alexa.response.encoded_size(self.builder.build()),
+            len(self.builder.to_json_bytes()))
+
+
+class SimpleResponseEncoding(JsonEncodingTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.builder = alexa.response.ResponseBuilder(
+            alexa.response.PLAIN_TEXT, 'It\'s "sunny" today\n')
+
+
+class FullResponseEncoding(JsonEncodingTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.builder = (
+            alexa.response.ResponseBuilder(should_end_session=False)
+            .speak(alexa.response.SSML, '<speak>Café au lait \U0001f600</speak>')
+            .reprompt(alexa.response.PLAIN_TEXT, 'Anything else?')
+            .set_card(alexa.response.Card('Café', title='Order'))
+            .add_directive({'type': 'Dialog.Delegate', 'updatedIntent': None})
+            .set_session_attributes({'count': 3, 'ratio': 0.5, 'tags': ['a', True]}))
+
+    def test_parts_are_cached(self):
+        # Encoding again reuses each part's bytes until it changes
+
+        self.builder.to_json_bytes()
+        reprompt_bytes = self.builder._encoded_parts['reprompt']
+        self.builder.to_json_bytes()
+        self.assertIs(self.builder._encoded_parts['reprompt'], reprompt_bytes)
+
+        self.builder.speak(alexa.response.PLAIN_TEXT, 'Changed')
+        self.assertIn(b'"Changed"', self.builder.to_json_bytes())
+
+    def test_card_changes_are_sent(self):
+        # A card that isn't shared may change after it's set
+
+        self.builder.to_json_bytes()
+        self.builder._card.text = 'Thé'
+
+        self.assertIn('"content":"Thé"'.encode(), self.builder.to_json_bytes())
+        self.assertEqual(self.builder.encoded_size(), len(self.builder.to_json_bytes()))
+
+    def test_shared_card_bytes_reused(self):
+        card = alexa.response.Card.shared('Café', title='Order')
+        self.builder.set_card(card)
+
+        self.assertIn(card.to_json_bytes(), self.builder.to_json_bytes())
+        self.assertIs(self.builder._encoded_part('card', card), card.to_json_bytes())
+
+
+class SessionAttributesEncoding(JsonEncodingTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.attributes = alexa.session.SessionAttributes({'count': 3, 'city': 'Seattle'})
+        self.builder = (
+            alexa.response.ResponseBuilder(alexa.response.PLAIN_TEXT, 'Hello!')
+            .set_session_attributes(self.attributes))
+
+    def test_later_changes_are_sent(self):
+        self.attributes['count'] = 4
+        del self.attributes['city']
+
+        self.assertEqual(self.builder.build()['sessionAttributes'], {'count': 4})
+        self.assertIn(b'"sessionAttributes":{"count":4}', self.builder.to_json_bytes())
+
+
+class FrozenResponseEncoding(JsonEncodingTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.builder = alexa.response.ResponseBuilder(
+            alexa.response.PLAIN_TEXT, 'Goodbye!').freeze()
+
+    def test_encoded_once(self):
+        self.assertIs(self.builder.to_json_bytes(), self.builder.to_json_bytes())
+
+
+class CardEncoding(unittest.TestCase):
+
+    def setUp(self):
+        self.card = alexa.response.Card.shared(
+            'Some text', title='A title',
+            small_image='https://example.com/small.png')
+
+    def test_shared_card_encoded_once(self):
+        self.assertIs(self.card.to_json_bytes(), self.card.to_json_bytes())
+        self.assertEqual(json.loads(self.card.to_json_bytes()), self.card.render())
+        self.assertEqual(self.card.encoded_size(), len(self.card.to_json_bytes()))
+
+
+class StandardLibraryFallback(unittest.TestCase):
+
+    def test_same_output_without_orjson(self):
+        # The stdlib encoder is configured to match orjson's compact output
+
+        response = alexa.response.build_response(
+            alexa.response.SSML, '<speak>Café "quoted"</speak>', {'n': [1, None]})
+
+        with unittest.mock.patch.dict(sys.modules, {'orjson': None}):
+            encode = alexa.response._select_encoder()
+
+        self.assertEqual(encode(response), alexa.response.to_json_bytes(response))
+
+
+class FloatSizeTestsMixin:
+
+    def setUp(self):
+        patcher = unittest.mock.patch.object(alexa.response, '_encode', self.select_encoder())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_float_sizes(self):
+        # Floats are measured the way the active encoder writes them
+
+        for value in AWKWARD_FLOATS:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    alexa.response.encoded_size(value),
+                    len(alexa.response.to_json_bytes(value)))
+
+        self.assertEqual(
+            alexa.response.encoded_size({'values': AWKWARD_FLOATS}),
+            len(alexa.response.to_json_bytes({'values': AWKWARD_FLOATS})))
+
+
+@unittest.skipUnless(orjson, 'orjson is not installed')
+class OrjsonFloatSizes(FloatSizeTestsMixin, unittest.TestCase):
+
+    def select_encoder(self):
+        return alexa.response._select_encoder()
+
+
+class StandardLibraryFloatSizes(FloatSizeTestsMixin, unittest.TestCase):
+
+    def select_encoder(self):
+        with unittest.mock.patch.dict(sys.modules, {'orjson': None}):
+            return alexa.response._select_encoder()
@@ -0,0 +1,102 @@
+import unittest
+
+import alexa.response
+import alexa.session
+
+
+class ResponseBuilderTestsMixin:
+
+    SPEECH = 'Here is the weather'
+    REPROMPT = 'Anything else?'
+
+    def setUp(self):
+        # Create a ResponseBuilder
+
+        self.builder = self.build_builder()
+        self.response = self.builder.build()
+
+    def test_envelope(self):
+        # Every response has a version and shouldEndSession
+
+        self.assertEqual(self.response['version'], '1.0')
+        self.assertIn('shouldEndSession', self.response['response'])
+
+
+class PlainTextResponse(ResponseBuilderTestsMixin, unittest.TestCase):
+
+    def build_builder(self):
+        return alexa.response.ResponseBuilder(alexa.response.PLAIN_TEXT, self.SPEECH)
+
+    def test_output_speech(self):
+        self.assertEqual(self.response['response']['outputSpeech'], {
+            'type': 'PlainText',
+            'text': self.SPEECH,
+        })
+        self.assertNotIn('sessionAttributes', self.response)
+
+    def test_matches_build_response(self):
+        # The builder and build_response produce the same simple response
+
+        self.assertEqual(
+            self.response,
+            alexa.response.build_response(alexa.response.PLAIN_TEXT, self.SPEECH))
+
+    def test_unchanged_session_attributes_are_reused(self):
+        # Attributes the skill didn't change are sent back without copying
+
+        attributes = {'city': 'Seattle'}
+        response = alexa.response.build_response(
+            alexa.response.PLAIN_TEXT, self.SPEECH,
+            alexa.session.SessionAttributes(attributes))
+
+        self.assertIs(response['sessionAttributes'], attributes)
+
+
+class LayeredResponse(ResponseBuilderTestsMixin, unittest.TestCase):
+
+    DIRECTIVE = {'type': 'Dialog.Delegate'}
+
+    def build_builder(self):
+        return (
+            alexa.response.ResponseBuilder(should_end_session=False)
+            .speak(alexa.response.SSML, '<speak>{speech}</speak>'.format(speech=self.SPEECH))
+            .reprompt(alexa.response.PLAIN_TEXT, self.REPROMPT)
+            .set_card(alexa.response.Card(self.SPEECH, title='Weather'))
+            .add_directive(self.DIRECTIVE)
+            .set_session_attributes({'city': 'Seattle'}))
+
+    def test_layers(self):
+        response = self.response['response']
+
+        self.assertEqual(response['outputSpeech']['type'], 'SSML')
+        self.assertIn('ssml', response['outputSpeech'])
+        self.assertEqual(response['reprompt']['outputSpeech']['text'], self.REPROMPT)
+        self.assertEqual(response['card']['title'], 'Weather')
+        self.assertEqual(response['directives'], [self.DIRECTIVE])
+        self.assertFalse(response['shouldEndSession'])
+        self.assertEqual(self.response['sessionAttributes'], {'city': 'Seattle'})
+
+    def test_parts_are_shared(self):
+        # Builds share parts instead of copying them
+
+        self.assertIs(
+            self.builder.build()['response']['outputSpeech'],
+            self.response['response']['outputSpeech'])
+
+    def test_unfrozen_builds_are_new(self):
+        self.assertIsNot(self.builder.build(), self.response)
+
+
+class FrozenResponse(ResponseBuilderTestsMixin, unittest.TestCase):
+
+    def build_builder(self):
+        return alexa.response.ResponseBuilder(
+            alexa.response.PLAIN_TEXT, 'Goodbye!').freeze()
+
+    def test_built_once(self):
+        self.assertTrue(self.builder.frozen)
+        self.assertIs(self.builder.build(), self.response)
+
+    def test_cannot_modify(self):
+        with self.assertRaises(RuntimeError):
+            self.builder.speak(alexa.response.PLAIN_TEXT, 'See you later!')
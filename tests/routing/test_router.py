@@ -0,0 +1,167 @@
+import unittest
+
+import alexa.request
+import alexa.routing
+import lambda_handler
+
+from ..lambda_handler.test_lambda_handler import LambdaHandlerTestsMixin
+
+
+def start_order(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'start'
+
+
+def ask_topping(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'topping'
+
+
+def confirm_size(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'confirm size'
+
+
+def place_order(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'place'
+
+
+def cancel_order(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'cancel'
+
+
+def launch(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'launch'
+
+
+def fallback(alexa_session, alexa_user, alexa_request, alexa_context):
+    return 'fallback'
+
+
+def build_request(
+        dialog_state: str=None, confirmation_status: str='NONE', slots: dict=None,
+        name: str='OrderPizza') -> alexa.request.IntentRequest:
+    """Builds a parsed OrderPizza request
+
+    :param slots: dict of slot name to a (value, confirmation status) tuple
+    """
+
+    request_data = {
+        'type': 'IntentRequest',
+        'requestId': 'amzn1.echo-api.request.1',
+        'timestamp': '2017-01-01T00:00:00Z',
+        'locale': 'en-US',
+        'intent': {
+            'name': name,
+            'confirmationStatus': confirmation_status,
+            'slots': {},
+        },
+    }
+    if dialog_state is not None:
+        request_data['dialogState'] = dialog_state
+    for slot_name, (value, status) in (slots or {}).items():
+        slot = {'name': slot_name, 'confirmationStatus': status}
+        if value is not None:
+            slot['value'] = value
+        request_data['intent']['slots'][slot_name] = slot
+
+    return alexa.request.parse_request(request_data)
+
+
+class RouterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.router = alexa.routing.Router(fallback=fallback)
+        self.router.route('OrderPizza', dialog_state='STARTED')(start_order)
+        self.router.route(
+            'OrderPizza', dialog_state='IN_PROGRESS', filled=['Size'], missing=['Topping'])(
+                ask_topping)
+        self.router.route(
+            'OrderPizza', dialog_state='IN_PROGRESS', slot_confirmations={'Size': 'NONE'})(
+                confirm_size)
+        self.router.route(
+            'OrderPizza', dialog_state='COMPLETED', confirmation_status='CONFIRMED',
+            filled=['Size', 'Topping'])(place_order)
+        self.router.route('OrderPizza', confirmation_status='DENIED')(cancel_order)
+        self.router.route('LaunchRequest')(launch)
+
+    def resolve(self, *args, **kwargs):
+        return self.router.resolve(build_request(*args, **kwargs))
+
+    def test_dialog_state(self):
+        self.assertIs(self.resolve('STARTED'), start_order)
+
+    def test_slot_presence(self):
+        self.assertIs(
+            self.resolve('IN_PROGRESS', slots={
+                'Size': ('large', 'CONFIRMED'), 'Topping': (None, 'NONE')}),
+            ask_topping)
+
+    def test_most_specific_rule_wins(self):
+        # Both IN_PROGRESS rules match; the one with more conditions wins
+
+        self.assertIs(
+            self.resolve('IN_PROGRESS', slots={'Size': ('large', 'NONE')}), ask_topping)
+        self.assertIs(
+            self.resolve('IN_PROGRESS', slots={
+                'Size': ('large', 'NONE'), 'Topping': ('ham', 'NONE')}),
+            confirm_size)
+
+    def test_confirmation_status(self):
+        slots = {'Size': ('large', 'NONE'), 'Topping': ('ham', 'NONE')}
+
+        self.assertIs(self.resolve('COMPLETED', 'CONFIRMED', slots), place_order)
+        self.assertIs(self.resolve('COMPLETED', 'DENIED', slots), cancel_order)
+
+    def test_fallback(self):
+        self.assertIs(self.resolve('COMPLETED', 'NONE'), fallback)
+        self.assertIs(self.resolve(name='NoSuchIntent'), fallback)
+
+    def test_request_type(self):
+        request = alexa.request.parse_request({
+            'type': 'LaunchRequest',
+            'requestId': 'amzn1.echo-api.request.1',
+            'timestamp': '2017-01-01T00:00:00Z',
+            'locale': 'en-US',
+        })
+
+        self.assertIs(self.router.resolve(request), launch)
+
+    def test_decisions_are_cached(self):
+        # Each distinct request state is decided once, then looked up
+
+        for _ in range(3):
+            self.resolve('STARTED')
+            self.resolve('IN_PROGRESS', slots={'Size': ('large', 'NONE')})
+
+        self.assertEqual(len(self.router._tables['OrderPizza'].decisions), 2)
+
+    def test_new_rules_recompile(self):
+        self.resolve('STARTED')
+        self.router.route('OrderPizza', dialog_state='STARTED', filled=['Size'])(place_order)
+
+        self.assertIs(self.resolve('STARTED', slots={'Size': ('large', 'NONE')}), place_order)
+
+    def test_invalid_rules(self):
+        with self.assertRaises(ValueError):
+            self.router.add_rule(launch, 'OrderPizza', dialog_state='FINISHED')
+        with self.assertRaises(ValueError):
+            self.router.add_rule(launch, 'OrderPizza', slot_confirmations={'Size': 'YES'})
+        with self.assertRaises(ValueError):
+            self.router.add_rule(launch, 'OrderPizza', filled=['Size'], missing=['Size'])
+
+
+class RoutedByLambdaHandler(LambdaHandlerTestsMixin, unittest.TestCase):
+
+    intent_name = 'GetWeather'
+
+    def test_dispatch(self):
+        # Unrouted requests fall back to the registry, and routers stand in
+        # for registries in the Lambda handler
+
+        router = alexa.routing.Router(fallback=self.registry)
+        router.route('GetWeather', confirmation_status='CONFIRMED')(launch)
+
+        response = lambda_handler.lambda_handler(self.test_input, None, registry=router)
+        self.assertEqual(response['intent'], 'GetWeather')
+
+        self.test_input['request']['intent']['confirmationStatus'] = 'CONFIRMED'
+        self.assertEqual(
+            lambda_handler.lambda_handler(self.test_input, None, registry=router), 'launch')
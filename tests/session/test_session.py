@@ -9,6 +9,8 @@ from .. import (
 
 class SessionTests:
 
+    lazy = False
+
     BASE_INPUT = {
         'application': {
             'applicationId': '',
@@ -33,7 +35,7 @@ class SessionTests:
         self.test_input['user']['permissions']['consentToken'] = generate_consent_token()
         self.test_input['user']['accessToken'] = generate_access_token()
 
-        self.session = alexa.session.Session(self.test_input)
+        self.session = alexa.session.Session(self.test_input, lazy=self.lazy)
 
     def test_default_attributes(self):
         # All Session objects should have these attributes
@@ -64,6 +66,11 @@ class SessionTests:
                 self.assertTrue(hasattr(self.session, attribute))
                 self.assertEqual(getattr(self.session, attribute), value)
 
+    def test_missing_attribute(self):
+        # Attributes that aren't in the session still raise AttributeError
+
+        self.assertFalse(hasattr(self.session, 'no_such_attribute'))
+
 
 class SimpleSession(SessionTests, unittest.TestCase):
     """Test a Session object with the simple base input"""
@@ -80,3 +87,37 @@ class SessionWithAttributes(SessionTests, unittest.TestCase):
         'attribute2': 'value2',
         'attribute3': 'value3',
     }
+
+
+class LazySessionWithAttributes(SessionTests, unittest.TestCase):
+    """Test a lazily-parsed Session object with persistent attributes"""
+
+    lazy = True
+    test_input = SessionTests.BASE_INPUT
+
+    def test_children_are_deferred(self):
+        # Child objects are only built on first access, then cached
+
+        for attribute in ['application', 'user', 'attribute1', ]:
+            self.assertNotIn(attribute, vars(self.session))
+
+        self.assertIs(self.session.user, self.session.user)
+
+
+class SessionWithShadowingAttributes(SessionTests, unittest.TestCase):
+    """Test a Session object with attributes named like its own fields"""
+
+    test_input = dict(SessionTests.BASE_INPUT, attributes={
+        'new': 'not a bool',
+        'user': 'not a User',
+        'attribute1': 'value1',
+    })
+
+    def test_alexa_session_attributes(self):
+        # Session attributes never shadow the real fields
+
+        self.assertIs(self.session.new, True)
+        self.assertIsInstance(self.session.user, alexa.session.User)
+        self.assertEqual(self.session.attribute1, 'value1')
+        self.assertEqual(self.session.attributes['new'], 'not a bool')
+        self.assertIs(self.session.attributes.to_dict(), self.test_input['attributes'])
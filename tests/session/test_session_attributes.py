@@ -0,0 +1,71 @@
+import unittest
+
+import alexa.session
+
+
+class SessionAttributesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.original = {
+            'attribute1': 'value1',
+            'attribute2': ['value2'],
+        }
+        self.attributes = alexa.session.SessionAttributes(self.original)
+
+    def test_unchanged(self):
+        # Unchanged attributes hand back the request's dict without copying
+
+        self.assertEqual(dict(self.attributes), self.original)
+        self.assertFalse(self.attributes.modified)
+        self.assertEqual(self.attributes.delta(), {})
+        self.assertIs(self.attributes.to_dict(), self.original)
+
+    def test_changes(self):
+        # Writes and deletions are tracked without touching the original
+
+        self.attributes['attribute1'] = 'changed'
+        self.attributes['attribute3'] = 'added'
+        del self.attributes['attribute2']
+
+        self.assertEqual(self.original, {
+            'attribute1': 'value1',
+            'attribute2': ['value2'],
+        })
+        self.assertTrue(self.attributes.modified)
+        self.assertEqual(self.attributes.dirty, {'attribute1', 'attribute2', 'attribute3'})
+        self.assertEqual(self.attributes.deleted, {'attribute2'})
+        self.assertEqual(
+            self.attributes.delta(), {'attribute1': 'changed', 'attribute3': 'added'})
+        self.assertEqual(
+            self.attributes.to_dict(), {'attribute1': 'changed', 'attribute3': 'added'})
+        self.assertEqual(len(self.attributes), 2)
+        self.assertNotIn('attribute2', self.attributes)
+
+    def test_unchanged_values_are_shared(self):
+        self.attributes['attribute1'] = 'changed'
+
+        self.assertIs(self.attributes.to_dict()['attribute2'], self.original['attribute2'])
+
+    def test_restore_deleted(self):
+        del self.attributes['attribute1']
+        self.attributes['attribute1'] = 'value1'
+
+        self.assertIn('attribute1', self.attributes)
+        self.assertEqual(self.attributes.deleted, set())
+        self.assertEqual(len(self.attributes), 2)
+
+    def test_missing_key(self):
+        with self.assertRaises(KeyError):
+            self.attributes['no_such_attribute']
+        with self.assertRaises(KeyError):
+            del self.attributes['no_such_attribute']
+
+        del self.attributes['attribute1']
+        with self.assertRaises(KeyError):
+            self.attributes['attribute1']
+
+    def test_no_attributes(self):
+        attributes = alexa.session.SessionAttributes()
+
+        self.assertEqual(len(attributes), 0)
+        self.assertEqual(attributes.to_dict(), {})
@@ -0,0 +1,128 @@
+import unittest
+
+import alexa.ssml
+
+
+class SpeechTests(unittest.TestCase):
+
+    def test_compose(self):
+        speech = (
+            alexa.ssml.Speech('Your total is')
+            .say_as('12.50', 'unit')
+            .pause(300)
+            .pause(strength='strong')
+            .emphasis('Thank you!', level='strong')
+            .audio('https://example.com/chime.mp3'))
+
+        self.assertEqual(
+            speech.to_ssml(),
+            '<speak>Your total is<say-as interpret-as="unit">12.50</say-as>'
+            '<break time="300ms"/><break strength="strong"/>'
+            '<emphasis level="strong">Thank you!</emphasis>'
+            '<audio src="https://example.com/chime.mp3"/></speak>')
+        alexa.ssml.validate(speech.to_ssml())
+
+    def test_text_is_escaped(self):
+        speech = alexa.ssml.Speech('Fish & chips <cheap>').say_as('1/2', 'date', format='md')
+
+        self.assertEqual(
+            str(speech),
+            '<speak>Fish &amp; chips &lt;cheap&gt;'
+            '<say-as interpret-as="date" format="md">1/2</say-as></speak>')
+        alexa.ssml.validate(str(speech))
+
+    def test_to_ssml_repeatable(self):
+        speech = alexa.ssml.Speech('Hello')
+
+        self.assertEqual(speech.to_ssml(), speech.to_ssml())
+        self.assertEqual(speech.say(' again').to_ssml(), '<speak>Hello again</speak>')
+
+    def test_add(self):
+        greeting = alexa.ssml.Speech('Hi').pause()
+        speech = (
+            alexa.ssml.Speech()
+            .add(greeting)
+            .add(alexa.ssml.fragment('<p>Welcome back</p>'))
+            .add('<s>Ready?</s>'))
+
+        self.assertEqual(
+            speech.to_ssml(), '<speak>Hi<break/><p>Welcome back</p><s>Ready?</s></speak>')
+        with self.assertRaises(ValueError):
+            speech.add('<p>Unbalanced')
+
+    def test_invalid_arguments(self):
+        speech = alexa.ssml.Speech()
+
+        with self.assertRaises(ValueError):
+            speech.pause(strength='long')
+        with self.assertRaises(ValueError):
+            speech.emphasis('Hi', level='loud')
+        with self.assertRaises(ValueError):
+            speech.audio('http://example.com/chime.mp3')
+
+
+class ValidateTests(unittest.TestCase):
+
+    def test_valid(self):
+        for markup in [
+            '<speak>Hello</speak>',
+            '<speak><p>One <break time="1s"/> two</p><s>Three &amp; four</s></speak>',
+            "<speak><amazon:effect name='whispered'>psst</amazon:effect></speak>",
+            '<speak>Say <sub alias="aluminum">Al</sub> &#233;</speak>',
+        ]:
+            alexa.ssml.validate(markup)
+
+    def test_invalid(self):
+        for markup in [
+            'Hello',
+            'Hello <speak>there</speak>',
+            '<speak>Hello</speak> there',
+            '<speak><p>Hello</speak>',
+            '<speak>Hello</p></speak>',
+            '<speak><speak>Hello</speak></speak>',
+            '<speak><script>alert()</script></speak>',
+            '<speak>Fish & chips</speak>',
+            '<speak>1 < 2</speak>',
+            '<speak><p>Hello</p class="x"></speak>',
+        ]:
+            with self.subTest(markup=markup), self.assertRaises(ValueError):
+                alexa.ssml.validate(markup)
+
+    def test_fragments(self):
+        alexa.ssml.validate('Hello <break/> there', fragment=True)
+
+        with self.assertRaises(ValueError):
+            alexa.ssml.validate('<speak>Hello</speak>', fragment=True)
+
+    def test_fragments_are_cached(self):
+        markup = '<emphasis>Cached</emphasis>'
+
+        self.assertIs(alexa.ssml.fragment(markup), alexa.ssml.fragment(markup))
+        self.assertIsInstance(alexa.ssml.fragment(markup), alexa.ssml.Fragment)
+
+
+class TruncateTests(unittest.TestCase):
+
+    MARKUP = (
+        '<speak>Hello there <emphasis level="strong">big world</emphasis>'
+        ' and fish &amp; chips</speak>')
+
+    def test_short_enough(self):
+        self.assertIs(alexa.ssml.truncate(self.MARKUP, len(self.MARKUP)), self.MARKUP)
+
+    def test_stays_well_formed(self):
+        for max_length in range(len('<speak>H</speak>'), len(self.MARKUP)):
+            with self.subTest(max_length=max_length):
+                truncated = alexa.ssml.truncate(self.MARKUP, max_length)
+
+                self.assertLessEqual(len(truncated), max_length)
+                alexa.ssml.validate(truncated)
+
+    def test_closes_open_elements(self):
+        self.assertEqual(
+            alexa.ssml.truncate(self.MARKUP, 66),
+            '<speak>Hello there <emphasis level="strong">big</emphasis></speak>')
+
+    def test_too_short(self):
+        with self.assertRaises(ValueError):
+            alexa.ssml.truncate(self.MARKUP, 10)
@@ -0,0 +1,287 @@
+import copy
+import os
+import tempfile
+import threading
+import unittest
+
+import alexa.session
+import alexa.store
+import lambda_handler
+
+from .. import generate_application_id, generate_session_id, generate_user_id
+from ..lambda_handler.test_lambda_handler import LambdaHandlerTestsMixin
+
+
+class RecordingStore(alexa.store.StateStore):
+    """In-memory backend that records how it's called"""
+
+    def __init__(self):
+        self.items = {}
+        self.gets = []
+        self.batches = []
+
+    def get(self, key):
+        self.gets.append(key)
+        return self.items.get(key)
+
+    def put_many(self, items):
+        self.batches.append(dict(items))
+        self.items.update(items)
+
+    def delete(self, key):
+        self.items.pop(key, None)
+
+
+class SQLiteStateStoreTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.database = os.path.join(directory.name, 'state.sqlite3')
+
+        self.store = alexa.store.SQLiteStateStore(self.database)
+
+    def tearDown(self):
+        connection, _ = alexa.store.SQLiteStateStore._connections.pop(self.database)
+        connection.close()
+
+    def test_round_trip(self):
+        self.assertIsNone(self.store.get('user:1'))
+
+        self.store.put_many({'user:1': {'visits': 1}, 'user:2': {'visits': 2}})
+        self.assertEqual(self.store.get('user:1'), {'visits': 1})
+        self.assertEqual(self.store.get('user:2'), {'visits': 2})
+
+        self.store.delete('user:1')
+        self.assertIsNone(self.store.get('user:1'))
+
+    def test_connection_is_shared(self):
+        # Stores on the same database reuse one connection
+
+        other = alexa.store.SQLiteStateStore(self.database)
+
+        self.assertIs(other._connection, self.store._connection)
+
+    def test_invalid_table(self):
+        with self.assertRaises(ValueError):
+            alexa.store.SQLiteStateStore(self.database, table='state; DROP')
+
+
+class CachedStateStoreTests(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = RecordingStore()
+        self.backend.items['user:1'] = {'visits': 1}
+        self.store = alexa.store.CachedStateStore(self.backend)
+
+    def test_read_through(self):
+        # Only the first read of a key reaches the backend
+
+        for _ in range(3):
+            self.assertEqual(self.store.get('user:1'), {'visits': 1})
+        self.assertEqual(self.store.get('user:2'), {})
+        self.store.get('user:2')
+
+        self.assertEqual(self.backend.gets, ['user:1', 'user:2'])
+
+    def test_write_behind(self):
+        # Writes are visible immediately but batched until flushed
+
+        self.store.set('user:2', {'visits': 5})
+        self.store.update('user:1', {'name': 'Sam'})
+
+        self.assertEqual(self.store.get('user:1'), {'visits': 1, 'name': 'Sam'})
+        self.assertEqual(self.backend.batches, [])
+        self.assertEqual(self.store.pending, {'user:1', 'user:2'})
+
+        self.assertEqual(self.store.flush(), 2)
+        self.assertEqual(self.backend.batches, [{
+            'user:1': {'visits': 1, 'name': 'Sam'},
+            'user:2': {'visits': 5},
+        }])
+        self.assertEqual(self.store.flush(), 0)
+        self.assertEqual(len(self.backend.batches), 1)
+
+    def test_pending_writes_survive_eviction(self):
+        store = alexa.store.CachedStateStore(self.backend, max_entries=1)
+        store.set('user:2', {'visits': 2})
+        store.get('user:1')
+
+        self.assertEqual(store.get('user:2'), {'visits': 2})
+
+    def test_failed_flush_is_retried(self):
+        def fail(items):
+            raise OSError('disk full')
+
+        self.store.set('user:2', {'visits': 2})
+        self.backend.put_many, put_many = fail, self.backend.put_many
+        with self.assertRaises(OSError):
+            self.store.flush()
+
+        self.backend.put_many = put_many
+        self.assertEqual(self.store.flush(), 1)
+
+    def test_discard(self):
+        # Discarded writes are never flushed, and reads go back to the backend
+
+        self.store.get('user:1')
+        self.store.update('user:1', {'name': 'Sam'})
+
+        self.assertEqual(self.store.discard(), 1)
+        self.assertEqual(self.store.pending, frozenset())
+        self.assertEqual(self.store.get('user:1'), {'visits': 1})
+        self.assertEqual(self.store.flush(), 0)
+
+    def test_get_returns_copy(self):
+        # Changing a read state doesn't change the store until it's set
+
+        self.store.get('user:1')['visits'] = 2
+        state = self.store.get('user:2')
+        state['visits'] = 3
+
+        self.assertEqual(self.store.get('user:1'), {'visits': 1})
+        self.assertEqual(self.store.get('user:2'), {})
+
+        self.store.set('user:2', state)
+        state['visits'] = 4
+        self.assertEqual(self.store.get('user:2'), {'visits': 3})
+
+    def test_delete(self):
+        self.store.get('user:1')
+        self.store.delete('user:1')
+
+        self.assertEqual(self.store.get('user:1'), {})
+        self.assertIn('user:1', self.backend.items)
+
+        self.assertEqual(self.store.flush(), 1)
+        self.assertNotIn('user:1', self.backend.items)
+        self.assertEqual(self.store.get('user:1'), {})
+
+    def test_pending_per_thread(self):
+        # Writes made on another thread are only seen, flushed and discarded
+        # there
+
+        def write():
+            self.store.set('user:2', {'visits': 2})
+            self.assertEqual(self.store.get('user:2'), {'visits': 2})
+
+        self.store.set('user:3', {'visits': 3})
+        thread = threading.Thread(target=write)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(self.store.get('user:2'), {})
+        self.assertEqual(self.store.pending, {'user:3'})
+        self.assertEqual(self.store.flush(), 1)
+        self.assertEqual(self.backend.batches, [{'user:3': {'visits': 3}}])
+
+    def test_abstract_backend(self):
+        class IncompleteStore(alexa.store.StateStore):
+
+            def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            IncompleteStore()
+
+    def test_save_attributes(self):
+        # Only changed session attributes are merged into the stored state
+
+        self.backend.items['user:1'] = {'visits': 1, 'name': 'Sam', 'color': 'blue'}
+        attributes = alexa.session.SessionAttributes(
+            {'visits': 1, 'name': 'Sam', 'color': 'blue', 'city': 'Boston'})
+
+        self.assertFalse(self.store.save_attributes('user:1', attributes))
+        self.assertEqual(self.store.pending, set())
+
+        attributes['visits'] = 2
+        del attributes['color']
+        self.assertTrue(self.store.save_attributes('user:1', attributes))
+        self.assertEqual(self.store.get('user:1'), {'visits': 2, 'name': 'Sam'})
+
+
+class StoreKeys(unittest.TestCase):
+
+    def test_keys(self):
+        session = alexa.session.Session({
+            'new': True,
+            'sessionId': generate_session_id(),
+            'application': {'applicationId': generate_application_id()},
+            'user': {'userId': generate_user_id()},
+        })
+
+        self.assertEqual(
+            alexa.store.user_key(session.user), 'user:' + session.user.user_id)
+        self.assertEqual(
+            alexa.store.session_key(session), 'session:' + session.session_id)
+
+
+def handle_visit(alexa_session, alexa_user, alexa_request, alexa_context):
+    store = alexa.store.default_store()
+    store.update(alexa.store.user_key(alexa_user), {'visited': True})
+
+    return {}
+
+
+class FlushedAfterResponse(LambdaHandlerTestsMixin, unittest.TestCase):
+
+    intent_name = 'Visit'
+
+    def setUp(self):
+        super().setUp()
+        self.registry.register('Visit', handle_visit)
+
+        self.backend = RecordingStore()
+        self.addCleanup(setattr, alexa.store, '_default_store', alexa.store._default_store)
+        alexa.store._default_store = alexa.store.CachedStateStore(self.backend)
+
+    def test_flushed_once_per_invocation(self):
+        lambda_handler.lambda_handler(self.test_input, None, registry=self.registry)
+
+        user_id = self.test_input['session']['user']['userId']
+        self.assertEqual(self.backend.batches, [{'user:' + user_id: {'visited': True}}])
+
+    def test_discarded_after_failure(self):
+        # A failed invocation's writes aren't flushed by the next one
+
+        def handle_failure(alexa_session, alexa_user, alexa_request, alexa_context):
+            handle_visit(alexa_session, alexa_user, alexa_request, alexa_context)
+            raise RuntimeError('handler failed')
+
+        self.registry.register('Visit', handle_failure)
+        with self.assertRaises(RuntimeError):
+            lambda_handler.lambda_handler(self.test_input, None, registry=self.registry)
+
+        self.assertEqual(alexa.store.default_store().pending, frozenset())
+        self.assertEqual(alexa.store.flush_default_store(), 0)
+        self.assertEqual(self.backend.batches, [])
+
+    def test_batch_with_failure(self):
+        # A failing event of a batch only discards its own writes, even while
+        # other events are still running
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def handle_success(alexa_session, alexa_user, alexa_request, alexa_context):
+            handle_visit(alexa_session, alexa_user, alexa_request, alexa_context)
+            barrier.wait()
+            return {}
+
+        def handle_failure(alexa_session, alexa_user, alexa_request, alexa_context):
+            handle_visit(alexa_session, alexa_user, alexa_request, alexa_context)
+            barrier.wait()
+            raise RuntimeError('handler failed')
+
+        self.registry.register('Visit', handle_success)
+        self.registry.register('Fail', handle_failure)
+        failing_event = copy.deepcopy(self.test_input)
+        failing_event['request']['intent']['name'] = 'Fail'
+        failing_event['session']['user']['userId'] = generate_user_id()
+
+        results = lambda_handler.batch_handler(
+            [self.test_input, failing_event], None, registry=self.registry)
+
+        self.assertEqual(results[0], {'response': {}})
+        self.assertEqual(results[1]['error']['type'], 'RuntimeError')
+        user_id = self.test_input['session']['user']['userId']
+        self.assertEqual(self.backend.batches, [{'user:' + user_id: {'visited': True}}])